@@ -7,6 +7,22 @@ import numpy as np
 import os
 from yaniv_neural_network_enhanced import EnhancedYanivNN
 
+def write_tfjs_weights(layers, path, transpose=False):
+    """Stream layer weights to a TensorFlow.js weights.bin, one layer at a time
+    
+    Kernels are written in their [in, out] layout; ``transpose`` writes them
+    as [out, in] instead.
+    """
+    with open(path, 'wb', buffering=1 << 20) as f:
+        for layer in layers:
+            # Kernel weights
+            kernel = layer['weights'].T if transpose else layer['weights']
+            np.ascontiguousarray(kernel, dtype=np.float32).tofile(f)
+            
+            # Bias weights
+            np.ascontiguousarray(layer['bias'].ravel(), dtype=np.float32).tofile(f)
+
+
 def convert_enhanced_model_to_tfjs(model_path, output_dir):
     """Convert enhanced Python model to TensorFlow.js format"""
     
@@ -91,29 +107,12 @@ def convert_enhanced_model_to_tfjs(model_path, output_dir):
     with open(os.path.join(output_dir, 'model.json'), 'w') as f:
         json.dump(model_config, f)
     
-    # Prepare weights
-    weights_data = []
-    
-    # Add weights for each layer (transpose for TensorFlow.js)
-    for i, layer in enumerate(network.layers):
-        # Kernel weights (transposed)
-        kernel = layer['weights'].T.astype(np.float32)
-        weights_data.append(kernel.flatten())
-        
-        # Bias weights
-        bias = layer['bias'].flatten().astype(np.float32)
-        weights_data.append(bias)
-    
     # Note: Skip connections are not directly supported in simple Sequential model
     # They would need a Functional API model in TensorFlow.js
     # For now, we'll create a standard feedforward network
     
-    # Concatenate all weights
-    all_weights = np.concatenate(weights_data)
-    
     # Save weights.bin
-    with open(os.path.join(output_dir, 'weights.bin'), 'wb') as f:
-        f.write(all_weights.tobytes())
+    write_tfjs_weights(network.layers, os.path.join(output_dir, 'weights.bin'), transpose=True)
     
     # Create weight manifest
     weight_specs = []
@@ -5,6 +5,8 @@ Convert the improved enhanced model to web format
 
 import json
 import os
+import numpy as np
+from convert_enhanced_model import write_tfjs_weights
 
 def convert_improved_to_web():
     """Convert improved model to TensorFlow.js format"""
@@ -30,6 +32,15 @@ def convert_improved_to_web():
         
         print(f"✓ Loaded model with {len(model_data['layers'])} layers")
         
+        # Convert each layer to NumPy once; shapes and weights.bin come from these arrays
+        layers_np = [
+            {
+                "weights": np.asarray(layer_data["weights"], dtype=np.float32),
+                "bias": np.asarray(layer_data["bias"], dtype=np.float32).ravel()
+            }
+            for layer_data in model_data["layers"]
+        ]
+        
         # Create TensorFlow.js format
         tfjs_model = {
             "modelTopology": {
@@ -59,14 +70,14 @@ def convert_improved_to_web():
         layer_names = ["dense_1", "dense_2", "dense_3", "output"]
         activations = ["relu", "relu", "relu", "softmax"]
         
-        for i, (layer_data, name, activation) in enumerate(zip(model_data["layers"], layer_names, activations)):
+        for i, (layer_np, name, activation) in enumerate(zip(layers_np, layer_names, activations)):
             layer_config = {
                 "class_name": "Dense",
                 "config": {
                     "name": name,
                     "trainable": True,
                     "dtype": "float32",
-                    "units": len(layer_data["weights"][0]),
+                    "units": layer_np["weights"].shape[1],
                     "activation": activation,
                     "use_bias": True,
                     "kernel_initializer": {"class_name": "GlorotUniform"},
@@ -78,9 +89,9 @@ def convert_improved_to_web():
         # Create weight manifest
         weight_specs = []
         
-        for i, (layer_data, name) in enumerate(zip(model_data["layers"], layer_names)):
+        for i, (layer_np, name) in enumerate(zip(layers_np, layer_names)):
             # Kernel weights
-            kernel_shape = [len(layer_data["weights"]), len(layer_data["weights"][0])]
+            kernel_shape = list(layer_np["weights"].shape)
             weight_specs.append({
                 "name": f"{name}/kernel",
                 "shape": kernel_shape,
@@ -88,7 +99,7 @@ def convert_improved_to_web():
             })
             
             # Bias weights
-            bias_shape = [len(layer_data["bias"][0])]
+            bias_shape = [layer_np["bias"].shape[0]]
             weight_specs.append({
                 "name": f"{name}/bias", 
                 "shape": bias_shape,
@@ -110,17 +121,24 @@ def convert_improved_to_web():
         
         print(f"✓ Created: {output_path}")
         
-        # Create weights.bin (simplified - use existing JS script)
-        print("✓ Model structure updated")
-        print("  Note: Run 'node create_enhanced_weights.js' to update weights")
+        # Create weights.bin from the trained weights
+        weights_path = "public/models/yaniv-enhanced/weights.bin"
+        write_tfjs_weights(layers_np, weights_path)
+        
+        # Round-trip check: weights.bin must hold each kernel in the [in, out]
+        # layout its manifest entry declares, followed by its bias
+        expected = np.concatenate([part for layer_np in layers_np
+                                   for part in (layer_np["weights"].ravel(), layer_np["bias"])])
+        if not np.array_equal(np.fromfile(weights_path, dtype=np.float32), expected):
+            raise ValueError(f"{weights_path} does not match the model's weights")
+        print(f"✓ Created: {weights_path}")
         
         print(f"\n✅ Conversion complete!")
         print(f"Your improved AI is ready for the web!")
         
         print(f"\nNext steps:")
-        print(f"  1. node create_enhanced_weights.js  # Update weights")
-        print(f"  2. npm run dev                     # Start game") 
-        print(f"  3. Test your improved AI!")
+        print(f"  1. npm run dev                     # Start game") 
+        print(f"  2. Test your improved AI!")
         
         return True
         
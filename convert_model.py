@@ -7,7 +7,107 @@ import json
 import numpy as np
 import os
 
-def convert_python_to_tfjs(input_file, output_dir):
+QUANTIZE_DTYPES = ('float16', 'uint8')
+WEIGHTS_ALIGNMENT = 32
+
+
+def quantize_weights(w, quantize=None):
+    """Quantize a weight tensor for weights.bin, returning the data and its manifest fields"""
+    w = np.asarray(w, dtype=np.float32)
+    if quantize is None:
+        return w, {}
+    if quantize == 'float16':
+        return w.astype(np.float16), {"quantization": {"dtype": "float16"}}
+    if quantize == 'uint8':
+        # Affine per-tensor quantization, dequantized by TensorFlow.js as q * scale + min
+        w_min = float(w.min())
+        scale = (float(w.max()) - w_min) / 255.0 or 1.0
+        q = np.round((w - w_min) / scale).astype(np.uint8)
+        return q, {"quantization": {"dtype": "uint8", "scale": scale, "min": w_min}}
+    raise ValueError(f"Unsupported quantization: {quantize}")
+
+
+def write_aligned_weights(f, tensors, alignment=WEIGHTS_ALIGNMENT):
+    """Write tensors back to back, padding each to an alignment boundary
+    
+    Returns the (offset, length) in bytes of every tensor.
+    """
+    layout = []
+    offset = 0
+    for data in tensors:
+        data.tofile(f)
+        pad = -data.nbytes % alignment
+        f.write(b'\0' * pad)
+        layout.append((offset, data.nbytes))
+        offset += data.nbytes + pad
+    return layout
+
+
+# TensorFlow.js expects weights in a specific format; weightsManifest is filled in per model
+_MODEL_TEMPLATE = {
+    "format": "layers-model",
+    "generatedBy": "Yaniv AI Converter",
+    "convertedBy": "Python to TFJS",
+    "modelTopology": {
+        "keras_version": "2.11.0",
+        "backend": "tensorflow",
+        "model_config": {
+            "class_name": "Sequential",
+            "config": {
+                "name": "yaniv_ai_model",
+                "layers": [
+                    {
+                        "class_name": "InputLayer",
+                        "config": {
+                            "batch_input_shape": [None, 11],
+                            "dtype": "float32",
+                            "sparse": False,
+                            "ragged": False,
+                            "name": "input_layer"
+                        }
+                    },
+                    {
+                        "class_name": "Dense",
+                        "config": {
+                            "name": "dense_1",
+                            "trainable": True,
+                            "dtype": "float32",
+                            "units": 64,
+                            "activation": "relu",
+                            "use_bias": True,
+                            "kernel_initializer": {"class_name": "GlorotUniform"},
+                            "bias_initializer": {"class_name": "Zeros"}
+                        }
+                    },
+                    {
+                        "class_name": "Dense",
+                        "config": {
+                            "name": "dense_2",
+                            "trainable": True,
+                            "dtype": "float32",
+                            "units": 16,
+                            "activation": "softmax",
+                            "use_bias": True,
+                            "kernel_initializer": {"class_name": "GlorotUniform"},
+                            "bias_initializer": {"class_name": "Zeros"}
+                        }
+                    }
+                ]
+            }
+        }
+    }
+}
+
+# Weight tensors in weights.bin order
+_WEIGHT_SPECS = (
+    ("dense_1/kernel", [11, 64]),
+    ("dense_1/bias", [64]),
+    ("dense_2/kernel", [64, 16]),
+    ("dense_2/bias", [16])
+)
+
+
+def convert_python_to_tfjs(input_file, output_dir, quantize=None):
     """Convert Python neural network JSON to TensorFlow.js compatible format"""
     
     # Load the Python model
@@ -24,102 +124,31 @@ def convert_python_to_tfjs(input_file, output_dir):
     w2 = np.array(model_data['w2'], dtype=np.float32)  # Shape: (64, 16)
     b2 = np.array(model_data['b2'], dtype=np.float32)  # Shape: (16,)
     
-    # TensorFlow.js expects weights in a specific format
-    weights_manifest = {
-        "format": "layers-model",
-        "generatedBy": "Yaniv AI Converter",
-        "convertedBy": "Python to TFJS",
-        "modelTopology": {
-            "keras_version": "2.11.0",
-            "backend": "tensorflow",
-            "model_config": {
-                "class_name": "Sequential",
-                "config": {
-                    "name": "yaniv_ai_model",
-                    "layers": [
-                        {
-                            "class_name": "InputLayer",
-                            "config": {
-                                "batch_input_shape": [None, 11],
-                                "dtype": "float32",
-                                "sparse": False,
-                                "ragged": False,
-                                "name": "input_layer"
-                            }
-                        },
-                        {
-                            "class_name": "Dense",
-                            "config": {
-                                "name": "dense_1",
-                                "trainable": True,
-                                "dtype": "float32",
-                                "units": 64,
-                                "activation": "relu",
-                                "use_bias": True,
-                                "kernel_initializer": {"class_name": "GlorotUniform"},
-                                "bias_initializer": {"class_name": "Zeros"}
-                            }
-                        },
-                        {
-                            "class_name": "Dense",
-                            "config": {
-                                "name": "dense_2",
-                                "trainable": True,
-                                "dtype": "float32",
-                                "units": 16,
-                                "activation": "softmax",
-                                "use_bias": True,
-                                "kernel_initializer": {"class_name": "GlorotUniform"},
-                                "bias_initializer": {"class_name": "Zeros"}
-                            }
-                        }
-                    ]
-                }
-            }
-        },
-        "weightsManifest": [{
-            "paths": ["weights.bin"],
-            "weights": [
-                {
-                    "name": "dense_1/kernel",
-                    "shape": [11, 64],
-                    "dtype": "float32"
-                },
-                {
-                    "name": "dense_1/bias",
-                    "shape": [64],
-                    "dtype": "float32"
-                },
-                {
-                    "name": "dense_2/kernel",
-                    "shape": [64, 16],
-                    "dtype": "float32"
-                },
-                {
-                    "name": "dense_2/bias",
-                    "shape": [16],
-                    "dtype": "float32"
-                }
-            ]
-        }]
-    }
+    # Quantize each tensor in the order specified in the manifest
+    tensors = [
+        quantize_weights(np.ascontiguousarray(w1.T).ravel(), quantize),  # TensorFlow uses different weight ordering
+        quantize_weights(b1, quantize),
+        quantize_weights(np.ascontiguousarray(w2.T).ravel(), quantize),
+        quantize_weights(b2, quantize)
+    ]
+    
+    # Save weights as binary file, each tensor aligned for SIMD loads
+    with open(os.path.join(output_dir, 'weights.bin'), 'wb') as f:
+        layout = write_aligned_weights(f, [data for data, _ in tensors])
+    
+    weights_manifest = dict(_MODEL_TEMPLATE, weightsManifest=[{
+        "paths": ["weights.bin"],
+        "weights": [
+            {"name": name, "shape": shape, "dtype": "float32",
+             "offset": offset, "length": length, **fields}
+            for (name, shape), (_, fields), (offset, length) in zip(_WEIGHT_SPECS, tensors, layout)
+        ]
+    }])
     
     # Save model.json
     with open(os.path.join(output_dir, 'model.json'), 'w') as f:
         json.dump(weights_manifest, f, indent=2)
     
-    # Save weights as binary file
-    # Concatenate all weights in the order specified in the manifest
-    all_weights = np.concatenate([
-        w1.transpose().flatten(),  # TensorFlow uses different weight ordering
-        b1.flatten(),
-        w2.transpose().flatten(),
-        b2.flatten()
-    ])
-    
-    # Save as binary file
-    all_weights.astype(np.float32).tofile(os.path.join(output_dir, 'weights.bin'))
-    
     # Also save metadata
     metadata = {
         "fitness": model_data.get("fitness", 0),
@@ -147,7 +176,9 @@ if __name__ == "__main__":
                         help="Path to input Python model JSON file")
     parser.add_argument("--output", default="public/models/yaniv-trained-optimized",
                         help="Output directory for TensorFlow.js model")
+    parser.add_argument("--quantize", choices=QUANTIZE_DTYPES, default=None,
+                        help="Store weights.bin as float16 or uint8 instead of float32")
     
     args = parser.parse_args()
     
-    convert_python_to_tfjs(args.input, args.output)
\ No newline at end of file
+    convert_python_to_tfjs(args.input, args.output, quantize=args.quantize)
\ No newline at end of file
@@ -5,14 +5,34 @@ This is a self-contained, working implementation
 """
 
 import json
-import random
-import time
 import os
 import sys
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from convert_model import QUANTIZE_DTYPES, quantize_weights, write_aligned_weights
+
+# Shared generator for all weight initialisation, mutation and simulated scoring
+_RNG = np.random.default_rng()
+
+# Feature normalisation constants and fixed feature blocks
+_HAND_NORM = np.float32(13.0)
+_PAD5 = np.zeros(5, dtype=np.float32)
+_DIST10 = np.full(10, 0.1, dtype=np.float32)
+_STATE10 = np.full(10, 0.5, dtype=np.float32)
+_STRAT7 = np.full(7, 0.2, dtype=np.float32)
 
 class EnhancedYanivAI:
     """Complete Enhanced AI implementation"""
     
+    __slots__ = ('weights', 'performance')
+    
     def __init__(self):
         self.weights = self.initialize_weights()
         self.performance = 0.65  # Starting performance
@@ -20,106 +40,149 @@ class EnhancedYanivAI:
     def initialize_weights(self):
         """Initialize network weights"""
         return {
-            'layer1': [[random.uniform(-0.1, 0.1) for _ in range(64)] for _ in range(35)],
-            'layer2': [[random.uniform(-0.1, 0.1) for _ in range(32)] for _ in range(64)],
-            'layer3': [[random.uniform(-0.1, 0.1) for _ in range(16)] for _ in range(32)],
-            'bias1': [0.0] * 64,
-            'bias2': [0.0] * 32,
-            'bias3': [0.0] * 16
+            'layer1': _RNG.uniform(-0.1, 0.1, (35, 64)).astype(np.float32),
+            'layer2': _RNG.uniform(-0.1, 0.1, (64, 32)).astype(np.float32),
+            'layer3': _RNG.uniform(-0.1, 0.1, (32, 16)).astype(np.float32),
+            'bias1': np.zeros(64, dtype=np.float32),
+            'bias2': np.zeros(32, dtype=np.float32),
+            'bias3': np.zeros(16, dtype=np.float32)
         }
     
     def extract_features(self, hand, game_state):
         """Extract 35 features from game state"""
-        features = []
-        
         # Hand cards (5 features)
-        for i in range(5):
-            if i < len(hand):
-                features.append(hand[i] / 13.0)
-            else:
-                features.append(0.0)
+        cards = np.asarray(hand[:5], dtype=np.float32) / _HAND_NORM
+        if cards.size < 5:
+            cards = np.concatenate([cards, _PAD5[cards.size:]])
         
         # Hand value (1 feature)
         hand_value = sum(min(card, 10) for card in hand)
-        features.append(hand_value / 50.0)
-        
-        # Card distribution (10 features)
-        for i in range(10):
-            features.append(0.1)  # Simplified
-        
-        # Game state (10 features)
-        features.extend([0.5] * 10)  # Simplified
         
-        # Strategic features (9 features)
-        features.append(1.0 if hand_value <= 7 else 0.0)  # Can Yaniv
-        features.append(0.5)  # Game phase
-        features.extend([0.2] * 7)  # Other strategic features
-        
-        return features[:35]  # Ensure exactly 35
+        return np.concatenate([
+            cards,
+            [hand_value / 50.0],
+            _DIST10,  # Card distribution (10 features, simplified)
+            _STATE10,  # Game state (10 features, simplified)
+            [float(hand_value <= 7), 0.5],  # Can Yaniv, game phase
+            _STRAT7  # Other strategic features
+        ]).astype(np.float32, copy=False)
     
     def forward_pass(self, features):
-        """Simple forward pass through network"""
-        # Simplified - just return action probabilities
-        action_probs = [0.0] * 16
-        
-        # Use hand value to make smart decisions
-        hand_value = features[5] * 50  # Denormalize
-        
-        if hand_value <= 7:
-            action_probs[15] = 0.8  # High probability for Yaniv
-        else:
-            # Prefer discarding high cards
-            for i in range(5):
-                if features[i] > 0.7:  # High card
-                    action_probs[i] = 0.3
-                else:
-                    action_probs[i] = 0.1
+        """Forward pass through network, returning action probabilities"""
+        x = np.asarray(features, dtype=np.float32)
+        h1 = np.maximum(0, x @ self.weights['layer1'] + self.weights['bias1'])
+        h2 = np.maximum(0, h1 @ self.weights['layer2'] + self.weights['bias2'])
+        z = h2 @ self.weights['layer3'] + self.weights['bias3']
         
-        # Normalize
-        total = sum(action_probs)
-        if total > 0:
-            action_probs = [p / total for p in action_probs]
-        else:
-            action_probs = [1.0 / 16] * 16
-        
-        return action_probs
+        # Softmax, in place on the logits
+        z -= z.max()
+        np.exp(z, out=z)
+        z /= z.sum()
+        return z
     
     def mutate(self, mutation_rate=0.1):
         """Mutate weights for evolution"""
-        for layer in self.weights:
-            if isinstance(self.weights[layer], list):
-                if isinstance(self.weights[layer][0], list):
-                    # 2D array
-                    for i in range(len(self.weights[layer])):
-                        for j in range(len(self.weights[layer][i])):
-                            if random.random() < mutation_rate:
-                                self.weights[layer][i][j] += random.uniform(-0.05, 0.05)
-                else:
-                    # 1D array
-                    for i in range(len(self.weights[layer])):
-                        if random.random() < mutation_rate:
-                            self.weights[layer][i] += random.uniform(-0.05, 0.05)
-    
-    def save(self, filename):
-        """Save AI to file"""
+        for layer, weights in self.weights.items():
+            mask = _RNG.random(weights.shape) < mutation_rate
+            weights[mask] += _RNG.uniform(-0.05, 0.05, np.count_nonzero(mask)).astype(np.float32)
+    
+    def save(self, filename, legacy=False):
+        """Save AI to file, with the weights in a .npz next to the JSON metadata"""
+        if legacy:
+            self.save_legacy(filename)
+            return
+        self.save_meta(filename)
+        self.save_weights(self.weights_path(filename))
+    
+    @staticmethod
+    def weights_path(filename):
+        """Path of the .npz weights file belonging to a JSON metadata file"""
+        return os.path.splitext(filename)[0] + '.npz'
+    
+    def save_meta(self, filename):
+        """Save performance and version metadata as JSON"""
         data = {
-            'weights': self.weights,
             'performance': self.performance,
             'version': 'enhanced_v2'
         }
         with open(filename, 'w') as f:
             json.dump(data, f, indent=2)
     
+    def save_weights(self, filename):
+        """Save weights as an uncompressed .npz archive of float32 arrays"""
+        np.savez(filename, **self.weights)
+    
+    def save_legacy(self, filename):
+        """Save weights and metadata together in a single JSON file"""
+        data = {
+            'weights': self.weights,
+            'performance': self.performance,
+            'version': 'enhanced_v2'
+        }
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            data['weights'] = {layer: weights.tolist() for layer, weights in self.weights.items()}
+            with open(filename, 'w') as f:
+                json.dump(data, f)
+    
     def load(self, filename):
-        """Load AI from file"""
-        with open(filename, 'r') as f:
-            data = json.load(f)
-        self.weights = data['weights']
+        """Load AI from file, reading weights from the .npz or, for legacy files, the JSON"""
+        with open(filename, 'rb') as f:
+            data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+        if 'weights' in data:
+            self.weights = {layer: np.asarray(weights, dtype=np.float32)
+                            for layer, weights in data['weights'].items()}
+        else:
+            with np.load(self.weights_path(filename)) as weights:
+                self.weights = {layer: weights[layer] for layer in weights.files}
         self.performance = data.get('performance', 0.65)
 
+def stack_population_weights(population):
+    """Stack each layer's weights across the population into (P, ...) arrays"""
+    return {layer: np.stack([ai.weights[layer] for ai in population])
+            for layer in population[0].weights}
+
+
+def population_forward_pass(population_weights, features):
+    """Forward a (B, 35) feature batch through every network at once, returning (P, B, 16)"""
+    X = np.asarray(features, dtype=np.float32)
+    h1 = np.maximum(0, np.matmul(X, population_weights['layer1']) + population_weights['bias1'][:, None, :])
+    h2 = np.maximum(0, np.matmul(h1, population_weights['layer2']) + population_weights['bias2'][:, None, :])
+    z = np.matmul(h2, population_weights['layer3']) + population_weights['bias3'][:, None, :]
+    
+    # Softmax over actions, in place on the logits
+    z -= z.max(axis=-1, keepdims=True)
+    np.exp(z, out=z)
+    z /= z.sum(axis=-1, keepdims=True)
+    return z
+
+
+def _evaluate(args):
+    """Worker entry point: score one AI with a picklable evaluate_fn(ai, gen)"""
+    evaluate_fn, ai, gen = args
+    return evaluate_fn(ai, gen)
+
+
+def evaluate_population(population, gen, evaluate_fn, num_workers=None):
+    """Score every AI with evaluate_fn, spreading the population over worker processes"""
+    num_workers = num_workers or mp.cpu_count()
+    tasks = [(evaluate_fn, ai, gen) for ai in population]
+    if num_workers <= 1:
+        return np.array([_evaluate(task) for task in tasks])
+    
+    ctx = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else mp.get_context()
+    with ProcessPoolExecutor(max_workers=num_workers, mp_context=ctx) as executor:
+        return np.array(list(executor.map(_evaluate, tasks)))
+
 
-def train_enhanced_ai(generations=20, population_size=10):
-    """Train the Enhanced AI using evolution"""
+def train_enhanced_ai(generations=20, population_size=10, evaluate_fn=None, num_workers=None):
+    """Train the Enhanced AI using evolution
+    
+    evaluate_fn(ai, gen) -> float scores a single AI and is run across worker
+    processes; without it performance is simulated for the whole population.
+    """
     
     print("🚀 Enhanced AI Training System v2.0")
     print("=" * 50)
@@ -133,28 +196,28 @@ def train_enhanced_ai(generations=20, population_size=10):
     for gen in range(generations):
         print(f"\n📊 Generation {gen + 1}/{generations}")
         
-        # Evaluate each AI
-        performances = []
-        for i, ai in enumerate(population):
-            # Simulate performance (increases with training)
+        if evaluate_fn is not None:
+            performances = evaluate_population(population, gen, evaluate_fn, num_workers)
+        else:
+            # Simulate performance for the whole population (increases with training)
             base_perf = 0.65 + (gen * 0.01)  # 1% improvement per generation
-            variation = random.uniform(-0.02, 0.03)
+            variation = _RNG.uniform(-0.02, 0.03, population_size)
             
             # Small chance of breakthrough
-            if random.random() < 0.1:
-                variation += random.uniform(0.01, 0.02)
+            variation += (_RNG.random(population_size) < 0.1) * _RNG.uniform(0.01, 0.02, population_size)
             
-            performance = min(0.85, base_perf + variation)
-            ai.performance = performance
-            performances.append(performance)
-            
-            if performance > best_performance:
-                best_performance = performance
-                best_ai = ai
-                print(f"  ✅ New best: {performance:.1%}")
+            performances = np.minimum(0.85, base_perf + variation)
+        for ai, performance in zip(population, performances):
+            ai.performance = float(performance)
+        
+        best_idx = int(performances.argmax())
+        if performances[best_idx] > best_performance:
+            best_performance = float(performances[best_idx])
+            best_ai = population[best_idx]
+            print(f"  ✅ New best: {best_performance:.1%}")
         
         # Show generation stats
-        avg_perf = sum(performances) / len(performances)
+        avg_perf = performances.mean()
         print(f"  Average: {avg_perf:.1%}, Best: {best_performance:.1%}")
         
         # Evolution - keep best, mutate others
@@ -168,16 +231,13 @@ def train_enhanced_ai(generations=20, population_size=10):
         
         while len(new_population) < population_size:
             # Clone and mutate a survivor
-            parent = random.choice(survivors)
+            parent = survivors[_RNG.integers(len(survivors))]
             child = EnhancedYanivAI()
-            child.weights = json.loads(json.dumps(parent.weights))  # Deep copy
+            child.weights = {layer: weights.copy() for layer, weights in parent.weights.items()}
             child.mutate(mutation_rate=0.15)
             new_population.append(child)
         
         population = new_population
-        
-        # Small delay for realism
-        time.sleep(0.1)
     
     print(f"\n✅ Training Complete!")
     print(f"Best performance: {best_performance:.1%}")
@@ -265,96 +325,99 @@ export class EnhancedNeuralNetworkAI implements AIPlayer {
     return True
 
 
-def create_simple_model():
+# Fixed topology of the simple TensorFlow.js model; weightsManifest is filled in per call
+_SIMPLE_MODEL_TEMPLATE = {
+    "modelTopology": {
+        "class_name": "Sequential",
+        "config": {
+            "name": "enhanced_yaniv_final",
+            "layers": [
+                {
+                    "class_name": "InputLayer",
+                    "config": {
+                        "batch_input_shape": [None, 11],
+                        "dtype": "float32",
+                        "sparse": False,
+                        "name": "input"
+                    }
+                },
+                {
+                    "class_name": "Dense",
+                    "config": {
+                        "name": "dense",
+                        "trainable": True,
+                        "dtype": "float32",
+                        "units": 64,
+                        "activation": "relu",
+                        "use_bias": True
+                    }
+                },
+                {
+                    "class_name": "Dense",
+                    "config": {
+                        "name": "output",
+                        "trainable": True,
+                        "dtype": "float32",
+                        "units": 16,
+                        "activation": "softmax",
+                        "use_bias": True
+                    }
+                }
+            ]
+        }
+    },
+    "format": "layers-model",
+    "generatedBy": "Enhanced AI Training v2"
+}
+
+# Weight tensors in weights.bin order
+_SIMPLE_WEIGHT_SPECS = (
+    ("dense/kernel", [11, 64]),
+    ("dense/bias", [64]),
+    ("output/kernel", [64, 16]),
+    ("output/bias", [16])
+)
+
+
+def create_simple_model(quantize=None):
     """Create a simple TensorFlow.js compatible model"""
     
     print("\n📦 Creating TensorFlow.js model files...")
     
-    model_json = {
-        "modelTopology": {
-            "class_name": "Sequential",
-            "config": {
-                "name": "enhanced_yaniv_final",
-                "layers": [
-                    {
-                        "class_name": "InputLayer",
-                        "config": {
-                            "batch_input_shape": [None, 11],
-                            "dtype": "float32",
-                            "sparse": False,
-                            "name": "input"
-                        }
-                    },
-                    {
-                        "class_name": "Dense",
-                        "config": {
-                            "name": "dense",
-                            "trainable": True,
-                            "dtype": "float32",
-                            "units": 64,
-                            "activation": "relu",
-                            "use_bias": True
-                        }
-                    },
-                    {
-                        "class_name": "Dense",
-                        "config": {
-                            "name": "output",
-                            "trainable": True,
-                            "dtype": "float32",
-                            "units": 16,
-                            "activation": "softmax",
-                            "use_bias": True
-                        }
-                    }
-                ]
-            }
-        },
-        "format": "layers-model",
-        "generatedBy": "Enhanced AI Training v2",
-        "weightsManifest": [{
-            "paths": ["weights.bin"],
-            "weights": [
-                {"name": "dense/kernel", "shape": [11, 64], "dtype": "float32"},
-                {"name": "dense/bias", "shape": [64], "dtype": "float32"},
-                {"name": "output/kernel", "shape": [64, 16], "dtype": "float32"},
-                {"name": "output/bias", "shape": [16], "dtype": "float32"}
-            ]
-        }]
-    }
-    
     # Create model directory
     model_dir = os.path.join("public", "models", "yaniv-enhanced")
     os.makedirs(model_dir, exist_ok=True)
     
-    # Save model.json
-    with open(os.path.join(model_dir, "model.json"), 'w') as f:
-        json.dump(model_json, f, indent=2)
-    
-    # Create simple weights file
-    import struct
+    # Generate strategic weights, quantizing each tensor if requested
+    tensors = []
+    entries = []
+    for name, shape in _SIMPLE_WEIGHT_SPECS:
+        data, fields = quantize_weights(_RNG.uniform(-0.1, 0.1, shape), quantize)
+        tensors.append(data)
+        entries.append({"name": name, "shape": shape, "dtype": "float32", **fields})
     
-    # Total weights needed
-    weights_count = (11 * 64) + 64 + (64 * 16) + 16
-    weights_data = []
-    
-    # Generate strategic weights
-    for i in range(weights_count):
-        weights_data.append(random.uniform(-0.1, 0.1))
+    # Save weights.bin, each tensor aligned for SIMD loads
+    with open(os.path.join(model_dir, "weights.bin"), 'wb') as f:
+        layout = write_aligned_weights(f, tensors)
+    for entry, (offset, length) in zip(entries, layout):
+        entry["offset"] = offset
+        entry["length"] = length
     
-    # Pack as float32
-    packed_weights = b''.join(struct.pack('f', w) for w in weights_data)
+    model_json = dict(_SIMPLE_MODEL_TEMPLATE, weightsManifest=[{
+        "paths": ["weights.bin"],
+        "weights": entries
+    }])
     
-    # Save weights.bin
-    with open(os.path.join(model_dir, "weights.bin"), 'wb') as f:
-        f.write(packed_weights)
+    # Save model.json
+    with open(os.path.join(model_dir, "model.json"), 'w') as f:
+        json.dump(model_json, f, indent=2)
     
     print(f"✅ Created model files in {model_dir}")
     
     return True
 
 
-def main():
+def main(quantize=None):
     """Main training and setup function"""
     
     print("🎮 ENHANCED YANIV AI - COMPLETE SETUP")
@@ -371,7 +434,7 @@ def main():
     
     # Step 3: Create model files
     print("\nStep 3: Creating model files...")
-    create_simple_model()
+    create_simple_model(quantize=quantize)
     
     # Final instructions
     print("\n" + "=" * 50)
@@ -384,6 +447,7 @@ def main():
     
     print(f"\n📁 Files created:")
     print(f"  - enhanced_ai_trained.json (training data)")
+    print(f"  - enhanced_ai_trained.npz (network weights)")
     print(f"  - src/game/EnhancedNeuralNetworkAI.ts (AI implementation)")
     print(f"  - public/models/yaniv-enhanced/model.json")
     print(f"  - public/models/yaniv-enhanced/weights.bin")
@@ -397,4 +461,12 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Train and set up the Enhanced Yaniv AI")
+    parser.add_argument("--quantize", choices=QUANTIZE_DTYPES, default=None,
+                        help="Store weights.bin as float16 or uint8 instead of float32")
+    
+    args = parser.parse_args()
+    
+    main(quantize=args.quantize)
\ No newline at end of file
@@ -1,133 +1,367 @@
 import numpy as np
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from yaniv_neural_network import YanivNeuralNetwork
 from yaniv_game_ai import YanivGameAI
+from collections import OrderedDict
+import hashlib
+import multiprocessing as mp
 import random
 import json
 import os
 
+
+# Weight arrays of a YanivNeuralNetwork, in the order they are laid out in a row of W
+_WEIGHT_NAMES = ('w1', 'b1', 'w2', 'b2')
+
+# Worker-side population, set once per worker by _init_worker
+_worker_population: List[YanivNeuralNetwork] = []
+
+
+def _init_worker(population: List[YanivNeuralNetwork]):
+    """Pool initializer: hold the population and give each worker its own random streams"""
+    global _worker_population
+    _worker_population = population
+    random.seed()
+    np.random.seed()
+
+
+def weights_key(network: YanivNeuralNetwork) -> bytes:
+    """Digest of a network's weights, identifying it across generations"""
+    h = hashlib.blake2b(digest_size=16)
+    for weights in (network.w1, network.b1, network.w2, network.b2):
+        h.update(weights.tobytes())
+    return h.digest()
+
+
+def play_seeded_game(first: YanivNeuralNetwork, second: YanivNeuralNetwork,
+                     seed: int) -> bool:
+    """Play one game with all randomness seeded, returning whether ``first`` won
+    
+    The game draws from its own PCG64 generator, leaving global random state
+    alone. For fixed weights the outcome depends only on the seed, which is
+    what makes results cacheable between generations.
+    """
+    rng = np.random.Generator(np.random.PCG64(seed))
+    return YanivGameAI().play_game([first, second], rng=rng) is first
+
+
+def matchup_decided(p1_wins: int, games_played: int, min_games: int = 4,
+                    z_threshold: Optional[float] = 2.5) -> bool:
+    """Whether a matchup is lopsided enough to stop playing it
+    
+    Sequential test on the win difference: stop once at least ``min_games`` were
+    played and |p1_wins - p2_wins| / sqrt(n) exceeds ``z_threshold``. A
+    threshold of None never stops early.
+    """
+    if z_threshold is None or games_played < min_games:
+        return False
+    return abs(2 * p1_wins - games_played) > z_threshold * np.sqrt(games_played)
+
+
+def _score_matchup(slots: List[Tuple[int, int, bool, Optional[bool]]], min_games: int,
+                   z_threshold: Optional[float], play=None) -> Tuple[int, int, List[Tuple[int, int, bool, bool]], bool]:
+    """Tally a matchup's (game_num, seed, i_first, i_won) slots in order until it is decided
+    
+    Slots with i_won None have not been played; ``play(seed, i_first)`` plays
+    them, and without it the tally stops at the first one. Returns (i_wins,
+    games counted, newly played slots, whether the matchup is finished).
+    """
+    i_wins = played = 0
+    new_results = []
+    for game_num, seed, i_first, i_won in slots:
+        if matchup_decided(i_wins, played, min_games, z_threshold):
+            break
+        if i_won is None:
+            if play is None:
+                return i_wins, played, new_results, False
+            i_won = play(seed, i_first)
+            new_results.append((game_num, seed, i_first, i_won))
+        i_wins += i_won
+        played += 1
+    return i_wins, played, new_results, True
+
+
+def _run_matchup(args: Tuple[int, int, List[Tuple[int, int, bool, Optional[bool]]], int, Optional[float]]
+                 ) -> Tuple[int, int, int, int, List[Tuple[int, int, bool, bool]]]:
+    """Play out the game slots of population members i and j, stopping once the matchup is decided
+    
+    Returns (i, j, i_wins, games counted, [(game_num, seed, i_first, i_won), ...])
+    with the list holding only the games actually played here.
+    """
+    i, j, slots, min_games, z_threshold = args
+    player1 = _worker_population[i]
+    player2 = _worker_population[j]
+    
+    def play(seed: int, i_first: bool) -> bool:
+        if i_first:
+            return play_seeded_game(player1, player2, seed)
+        return not play_seeded_game(player2, player1, seed)
+    
+    i_wins, played, new_results, _ = _score_matchup(slots, min_games, z_threshold, play)
+    return i, j, i_wins, played, new_results
+
+
 class GeneticAlgorithm:
     """Genetic algorithm for evolving Yaniv AI players"""
     
     def __init__(self, population_size: int = 50, top_k: int = 10, 
-                 mutation_rate: float = 0.1, mutation_strength: float = 0.1):
+                 mutation_rate: float = 0.1, mutation_strength: float = 0.1,
+                 num_workers: Optional[int] = None, match_cache_size: int = 100_000,
+                 min_games: int = 4, early_stop_z: Optional[float] = 2.5):
         self.population_size = population_size
         self.top_k = top_k
         self.mutation_rate = mutation_rate
         self.mutation_strength = mutation_strength
+        self.num_workers = num_workers or mp.cpu_count()
+        
+        # A matchup stops early once its score is this lopsided (see matchup_decided)
+        self.min_games = min_games
+        self.early_stop_z = early_stop_z
+        
+        # Game slot k of a matchup is played with a seed derived from match_seed,
+        # the pair's weights and k (see _game_seed), so rematches between
+        # unchanged networks (e.g. survivors) can be reused
+        self.match_seed = random.randrange(2**31)
+        self.match_cache_size = match_cache_size
+        self._match_cache: 'OrderedDict[Tuple[bytes, bytes, int], bool]' = OrderedDict()
         self.generation = 0
         self.population: List[YanivNeuralNetwork] = []
         self.best_fitness_history = []
         
+        # Population state as parallel arrays, row i belonging to population[i]
+        self.W = np.zeros((0, 0), dtype=np.float32)
+        self.fitness = np.zeros(population_size)
+        self.wins = np.zeros(population_size, dtype=np.int32)
+        self.games = np.zeros(population_size, dtype=np.int32)
+        self.results = np.zeros((population_size, population_size), dtype=np.int32)
+        self.matchup_games = np.zeros((population_size, population_size), dtype=np.int32)
+        
     def initialize_population(self):
         """Create initial random population"""
-        self.population = []
-        for i in range(self.population_size):
-            network = YanivNeuralNetwork(network_id=i)
-            self.population.append(network)
+        self._set_population([YanivNeuralNetwork(network_id=i)
+                              for i in range(self.population_size)])
         print(f"Initialized population with {self.population_size} neural networks")
     
+    @staticmethod
+    def _flat_weights(network: YanivNeuralNetwork) -> np.ndarray:
+        """Concatenate a network's weights into one row"""
+        return np.concatenate([getattr(network, name).ravel() for name in _WEIGHT_NAMES])
+    
+    def _set_population(self, networks: List[YanivNeuralNetwork], W: Optional[np.ndarray] = None):
+        """Adopt ``networks`` as the population, their weights becoming views into rows of W
+        
+        Without ``W`` the matrix is stacked from the networks' current weights.
+        """
+        if W is None:
+            W = np.stack([self._flat_weights(network) for network in networks]).astype(np.float32)
+        for row_index, (network, row) in enumerate(zip(networks, W)):
+            offset = 0
+            for name in _WEIGHT_NAMES:
+                shape = getattr(network, name).shape
+                size = int(np.prod(shape))
+                setattr(network, name, row[offset:offset + size].reshape(shape))
+                offset += size
+            network.network_id = row_index
+        self.W = W
+        self.population = networks
+        n = len(networks)
+        self.fitness = np.zeros(n)
+        self.wins = np.zeros(n, dtype=np.int32)
+        self.games = np.zeros(n, dtype=np.int32)
+    
     def evaluate_population(self, games_per_matchup: int = 10):
         """Run tournament between all AI players"""
-        # Reset stats for all networks
+        n = len(self.population)
+        
+        # Cross-table of the tournament: results[i, j] is how many games i won
+        # against j, out of matchup_games[i, j]
+        self.results = np.zeros((n, n), dtype=np.int32)
+        self.matchup_games = np.zeros((n, n), dtype=np.int32)
+        
         for network in self.population:
-            network.fitness = 0
-            network.wins = 0
-            network.games_played = 0
-        
-        total_matchups = self.population_size * (self.population_size - 1) // 2
-        matchup_count = 0
-        
-        # Round-robin tournament
-        for i in range(len(self.population)):
-            for j in range(i + 1, len(self.population)):
-                player1 = self.population[i]
-                player2 = self.population[j]
-                
-                # Play multiple games between these two players
-                p1_wins = 0
-                p2_wins = 0
-                
+            network._wkey = weights_key(network)
+        
+        # Score each matchup from the cache as far as it goes, and queue the
+        # rest; games are played in order until the matchup is decided
+        tasks = []
+        for i in range(n):
+            for j in range(i + 1, n):
+                slots = []
                 for game_num in range(games_per_matchup):
-                    # Alternate who goes first
-                    if game_num % 2 == 0:
-                        winner = self.simulate_game(player1, player2)
-                    else:
-                        winner = self.simulate_game(player2, player1)
+                    seed = self._game_seed(self.population[i], self.population[j], game_num)
+                    i_first = self._first_seat(self.population[i], self.population[j], game_num)
+                    i_won = self._cached_result(self.population[i], self.population[j], seed, i_first)
+                    slots.append((game_num, seed, i_first, i_won))
+                i_wins, played, _, finished = _score_matchup(slots, self.min_games, self.early_stop_z)
+                if finished:
+                    self._add_matchup_result(i, j, i_wins, played)
+                else:
+                    tasks.append((i, j, slots, self.min_games, self.early_stop_z))
+        
+        total_matchups = len(tasks)
+        
+        # Round-robin tournament, matchups spread over worker processes
+        if tasks:
+            ctx = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else mp.get_context()
+            chunksize = max(1, total_matchups // (4 * self.num_workers))
+            with ctx.Pool(processes=self.num_workers, initializer=_init_worker,
+                          initargs=(self.population,)) as pool:
+                for matchup_count, (i, j, i_wins, played, new_results) in enumerate(
+                        pool.imap_unordered(_run_matchup, tasks, chunksize=chunksize), 1):
+                    # Update stats and remember the outcomes
+                    self._add_matchup_result(i, j, i_wins, played)
+                    for game_num, seed, i_first, i_won in new_results:
+                        self._store_result(self.population[i], self.population[j], seed, i_first, i_won)
                     
-                    if winner == player1:
-                        p1_wins += 1
-                    else:
-                        p2_wins += 1
-                
-                # Update stats
-                player1.games_played += games_per_matchup
-                player2.games_played += games_per_matchup
-                player1.wins += p1_wins
-                player2.wins += p2_wins
-                
-                matchup_count += 1
-                if matchup_count % 10 == 0:
-                    print(f"Progress: {matchup_count}/{total_matchups} matchups complete")
-        
-        # Calculate fitness (win rate)
-        for network in self.population:
-            if network.games_played > 0:
-                network.fitness = network.wins / network.games_played
+                    if matchup_count % 10 == 0:
+                        print(f"Progress: {matchup_count}/{total_matchups} matchups complete")
+        
+        # Reduce the cross-table to per-network stats, and calculate fitness
+        # (win rate) over the games each network actually played
+        self.results.sum(axis=1, out=self.wins)
+        self.matchup_games.sum(axis=1, out=self.games)
+        self.fitness.fill(0)
+        np.divide(self.wins, self.games, out=self.fitness, where=self.games > 0)
+        
+        # Mirror the stats onto the networks, which carry them into saved files
+        for network, network_wins, network_games, fitness in zip(
+                self.population, self.wins.tolist(), self.games.tolist(), self.fitness.tolist()):
+            network.wins = network_wins
+            network.games_played = network_games
+            network.fitness = fitness
+    
+    def _add_matchup_result(self, i: int, j: int, i_wins: int, played: int):
+        """Enter a matchup between population members i and j into the cross-table"""
+        self.results[i, j] = i_wins
+        self.results[j, i] = played - i_wins
+        self.matchup_games[i, j] = self.matchup_games[j, i] = played
+    
+    @staticmethod
+    def _first_seat(player1: YanivNeuralNetwork, player2: YanivNeuralNetwork, game_num: int) -> bool:
+        """Whether player1 starts game ``game_num`` of their matchup
+        
+        Seating alternates from the pair's canonical (weight key) order rather
+        than population order, so a pair plays the same seated games whichever
+        of them ranks first next generation.
+        """
+        return (player1._wkey <= player2._wkey) == (game_num % 2 == 0)
+    
+    def _game_seed(self, player1: YanivNeuralNetwork, player2: YanivNeuralNetwork,
+                   game_num: int) -> int:
+        """Seed of game ``game_num`` of a matchup
+        
+        Hashed from the pair's weight keys in canonical order, so every pair
+        gets its own deals and a pair keeps them whichever of them ranks first.
+        """
+        h = hashlib.blake2b(digest_size=8, key=self.match_seed.to_bytes(4, 'little'))
+        h.update(min(player1._wkey, player2._wkey))
+        h.update(max(player1._wkey, player2._wkey))
+        h.update(game_num.to_bytes(4, 'little'))
+        return int.from_bytes(h.digest(), 'little')
+    
+    @staticmethod
+    def _match_key(player1: YanivNeuralNetwork, player2: YanivNeuralNetwork,
+                   seed: int, p1_first: bool) -> Tuple[bytes, bytes, int]:
+        """Cache key of a game, in seating order"""
+        if p1_first:
+            return player1._wkey, player2._wkey, seed
+        return player2._wkey, player1._wkey, seed
+    
+    def _cached_result(self, player1: YanivNeuralNetwork, player2: YanivNeuralNetwork,
+                       seed: int, p1_first: bool) -> Optional[bool]:
+        """Whether player1 won this game, or None if it isn't cached"""
+        key = self._match_key(player1, player2, seed, p1_first)
+        first_won = self._match_cache.get(key)
+        if first_won is None:
+            return None
+        self._match_cache.move_to_end(key)
+        return first_won if p1_first else not first_won
+    
+    def _store_result(self, player1: YanivNeuralNetwork, player2: YanivNeuralNetwork,
+                      seed: int, p1_first: bool, p1_won: bool):
+        """Cache the outcome of a game, evicting the least recently used entries"""
+        key = self._match_key(player1, player2, seed, p1_first)
+        self._match_cache[key] = p1_won if p1_first else not p1_won
+        while len(self._match_cache) > self.match_cache_size:
+            self._match_cache.popitem(last=False)
     
     def simulate_game(self, player1: YanivNeuralNetwork, 
-                     player2: YanivNeuralNetwork) -> YanivNeuralNetwork:
-        """Simulate a single game between two AI players"""
-        game = YanivGameAI()
-        winner = game.play_game([player1, player2])
-        return winner
+                     player2: YanivNeuralNetwork, seed: Optional[int] = None) -> YanivNeuralNetwork:
+        """Simulate a single game between two AI players
+        
+        With a ``seed`` the game is deterministic and its outcome is cached.
+        """
+        if seed is None:
+            game = YanivGameAI()
+            winner = game.play_game([player1, player2])
+            return winner
+        
+        for network in (player1, player2):
+            if not hasattr(network, '_wkey'):
+                network._wkey = weights_key(network)
+        p1_won = self._cached_result(player1, player2, seed, True)
+        if p1_won is None:
+            p1_won = play_seeded_game(player1, player2, seed)
+            self._store_result(player1, player2, seed, True, p1_won)
+        return player1 if p1_won else player2
     
     def select_survivors(self) -> List[YanivNeuralNetwork]:
-        """Select top performing networks"""
-        # Sort by fitness (win rate)
-        sorted_population = sorted(self.population, 
-                                 key=lambda x: x.fitness, 
-                                 reverse=True)
+        """Select top performing networks
+        
+        The population arrays are reordered by fitness (best first), so the
+        survivors are the first top_k rows.
+        """
+        # Sort by fitness (win rate); stable, so ties keep population order
+        order = np.argsort(-self.fitness, kind='stable')
+        fitness, wins, games = self.fitness[order], self.wins[order], self.games[order]
+        self._set_population([self.population[i] for i in order], self.W[order])
+        self.fitness, self.wins, self.games = fitness, wins, games
+        self.results = self.results[np.ix_(order, order)]
+        self.matchup_games = self.matchup_games[np.ix_(order, order)]
         
         # Keep top K
-        survivors = sorted_population[:self.top_k]
+        survivors = self.population[:self.top_k]
         
         print(f"\nGeneration {self.generation} results:")
-        print(f"Best fitness: {survivors[0].fitness:.3f}")
+        print(f"Best fitness: {self.fitness[0]:.3f}")
         print(f"Top {self.top_k} fitness scores: ", 
-              [f"{s.fitness:.3f}" for s in survivors])
+              [f"{f:.3f}" for f in self.fitness[:self.top_k].tolist()])
         
         return survivors
     
     def create_next_generation(self, survivors: List[YanivNeuralNetwork]):
         """Create new generation from survivors"""
-        new_population = []
+        num_survivors = len(survivors)
+        new_W = np.empty((self.population_size, self.W.shape[1]), dtype=np.float32)
         
         # Keep the survivors
         for i, survivor in enumerate(survivors):
-            survivor.network_id = i
-            new_population.append(survivor)
+            new_W[i] = self._flat_weights(survivor)
         
-        # Create mutated versions
+        # Create mutated versions, each survivor's copies in consecutive rows
         mutations_per_survivor = 3
-        current_id = len(survivors)
+        num_mutants = min(num_survivors * mutations_per_survivor,
+                          self.population_size - num_survivors)
+        mutants = new_W[num_survivors:num_survivors + num_mutants]
+        mutants[:] = np.repeat(new_W[:num_survivors], mutations_per_survivor, axis=0)[:num_mutants]
+        mask = np.random.random(mutants.shape) < self.mutation_rate
+        mutants[mask] += np.random.randn(np.count_nonzero(mask)) * self.mutation_strength
         
-        for survivor in survivors:
-            for _ in range(mutations_per_survivor):
-                if current_id < self.population_size:
-                    mutant = survivor.copy()
-                    mutant.network_id = current_id
-                    mutant.mutate(self.mutation_rate, self.mutation_strength)
-                    new_population.append(mutant)
-                    current_id += 1
+        # The current network objects carry the survivor and mutant rows, their
+        # weights being rebound to new_W; they start over like new networks
+        current_id = num_survivors + num_mutants
+        networks = self.population[:current_id]
+        for network in networks:
+            network.fitness, network.wins, network.games_played = 0, 0, 0
+            network.__dict__.pop('_wkey', None)
         
         # Fill remaining slots with new random networks
-        while len(new_population) < self.population_size:
-            network = YanivNeuralNetwork(network_id=current_id)
-            new_population.append(network)
-            current_id += 1
+        for i in range(current_id, self.population_size):
+            network = YanivNeuralNetwork(network_id=i)
+            new_W[i] = self._flat_weights(network)
+            networks.append(network)
         
-        self.population = new_population
+        self._set_population(networks, new_W)
         self.generation += 1
     
     def evolve(self, num_generations: int, games_per_matchup: int = 10):
@@ -147,7 +381,7 @@ class GeneticAlgorithm:
             survivors = self.select_survivors()
             
             # Track best fitness
-            self.best_fitness_history.append(survivors[0].fitness)
+            self.best_fitness_history.append(float(self.fitness[0]))
             
             # Save best network
             self.save_best_network(survivors[0])
@@ -164,13 +398,13 @@ class GeneticAlgorithm:
         if not os.path.exists('saved_networks'):
             os.makedirs('saved_networks')
         
-        filename = f'saved_networks/best_gen_{self.generation}.json'
-        network.save(filename)
+        filename = f'saved_networks/best_gen_{self.generation}.npz'
+        network.save_npy(filename)
         
         # Also save as 'best_overall' if it's the best we've seen
         if not hasattr(self, 'best_overall_fitness') or network.fitness > self.best_overall_fitness:
             self.best_overall_fitness = network.fitness
-            network.save('saved_networks/best_overall.json')
+            network.save_npy('saved_networks/best_overall.npz')
             print(f"New best network saved with fitness: {network.fitness:.3f}")
     
     def load_population(self, generation: int):
@@ -1,49 +1,145 @@
 import numpy as np
+from collections import deque
 from typing import List, Dict, Tuple, Optional, Callable
-# Removed multiprocessing for compatibility
-import pickle
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from numba import njit, prange
 import json
-from yaniv_neural_network_enhanced import EnhancedYanivNN, AdvancedFeatureExtractor, HallOfFame, EnsembleAI
-from yaniv_game_enhanced_wrapper import play_simple_match
+import pickle
+from yaniv_neural_network_enhanced import EnhancedYanivNN, AdvancedFeatureExtractor, HallOfFame, EnsembleAI, warm_up_forward
+from yaniv_game_enhanced_wrapper import play_simple_matches
 import time
 
 
+# Worker-side copy of the GA and the shared weight block it reads, set once per worker by _init_worker
+_worker_ga = None
+_worker_shm = None
+
+
+def _init_worker(ga: 'AdaptiveGeneticAlgorithm', shm_spec: Optional[Tuple[str, Tuple[int, int], str]] = None):
+    """Pool initializer: hold the GA and give each worker its own random stream
+    
+    With ``shm_spec`` (name, shape, dtype) the population is rebuilt over the
+    parent's shared weight matrix instead of per-worker copies.
+    """
+    global _worker_ga, _worker_shm
+    if shm_spec is not None:
+        name, shape, dtype = shm_spec
+        _worker_shm = shared_memory.SharedMemory(name=name)
+        ga._adopt_weights(np.ndarray(shape, dtype=dtype, buffer=_worker_shm.buf))
+    _worker_ga = ga
+    np.random.seed()
+    warm_up_forward()
+
+
+def _evaluate_individual(individual_idx: int) -> Tuple[int, float]:
+    """Evaluate one individual of the worker's GA, returning (index, fitness)"""
+    return individual_idx, _worker_ga.evaluate_fitness(individual_idx)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _uniform_crossover(weights1, weights2, out):
+    """Take each weight from either parent with equal probability"""
+    for i in prange(out.size):
+        out[i] = weights1[i] if np.random.random() < 0.5 else weights2[i]
+
+
+def _block_crossover(weights1, weights2, out, num_blocks, rng):
+    """Start from parent 1 and swap in each of num_blocks blocks of parent 2 with probability 0.5
+    
+    The block choices are expanded to a per-weight mask so the child is
+    assembled in one masked copy; the last block absorbs any remainder.
+    """
+    block_size = weights1.size // num_blocks
+    block_choices = rng.random(num_blocks) < 0.5
+    mask = np.repeat(block_choices, block_size)
+    if mask.size < weights1.size:
+        mask = np.concatenate([mask, np.full(weights1.size - mask.size, block_choices[-1])])
+    np.copyto(out, weights1)
+    np.copyto(out, weights2, where=mask)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _arith_crossover(weights1, weights2, out, alpha):
+    """Weighted average of the parents"""
+    beta = 1 - alpha
+    for i in prange(out.size):
+        out[i] = alpha * weights1[i] + beta * weights2[i]
+
+
 class AdaptiveGeneticAlgorithm:
     """Enhanced genetic algorithm with adaptive mutation rates and advanced operators"""
     
     def __init__(self, population_size: int = 100, elite_size: int = 10,
                  mutation_rate_initial: float = 0.1, crossover_rate: float = 0.7,
-                 tournament_size: int = 5):
+                 tournament_size: int = 5, num_workers: Optional[int] = None,
+                 history_size: int = 200):
         
         self.population_size = population_size
+        self.num_workers = num_workers or mp.cpu_count()
         self.elite_size = elite_size
         self.crossover_rate = crossover_rate
         self.tournament_size = tournament_size
         
         # Adaptive mutation rates for each individual
         self.mutation_rates = np.ones(population_size) * mutation_rate_initial
-        self.fitness_history = []
         self.stagnation_counter = 0
         
+        # Per-generation stats, keeping only the most recent history_size generations;
+        # each records the generation it belongs to
+        self.generation = 0
+        self.history_size = history_size
+        self.fitness_history = deque(maxlen=history_size)
+        
         # Hall of Fame to preserve best networks
         self.hall_of_fame = HallOfFame(size=20)
         
-        # Initialize population with enhanced networks
-        self.population = [EnhancedYanivNN() for _ in range(population_size)]
+        # Initialize population with enhanced networks, held as views over
+        # the rows of one contiguous (population_size, D) float32 weight matrix
+        self.rng = np.random.default_rng()
+        self._template = EnhancedYanivNN()
+        self._set_population([EnhancedYanivNN() for _ in range(population_size)])
+        self._shared_weights = False
+        self._noise_buf = None
+        self._draw_buf = None
         self.fitness_scores = np.zeros(population_size)
         
         # Feature extractor
         self.feature_extractor = AdvancedFeatureExtractor()
         
         # Performance tracking
-        self.generation_stats = []
-        
+        self.generation_stats = deque(maxlen=history_size)
+        
+    def _set_population(self, networks: List[EnhancedYanivNN]):
+        """Copy the networks' weights into a fresh weight matrix and make them views over its rows"""
+        self.W = np.stack([network.get_weights_flat() for network in networks])
+        for network, row in zip(networks, self.W):
+            network.set_weights_from_flat(row)
+        self.population = networks
+    
+    def _adopt_weights(self, W: np.ndarray):
+        """Make the population views over the rows of an existing weight matrix"""
+        self.W = W
+        self.population = [self._network_from_row(row) for row in W]
+    
+    def __getstate__(self):
+        # While the weights are in shared memory, workers attach to them there
+        # rather than receiving a pickled copy
+        state = self.__dict__.copy()
+        if state.get('_shared_weights'):
+            state['W'] = None
+            state['population'] = None
+        state['_noise_buf'] = state['_draw_buf'] = None
+        return state
+    
+    def _network_from_row(self, row: np.ndarray) -> EnhancedYanivNN:
+        """Network whose weights are views over one row of a weight matrix"""
+        return self._template.clone(row)
+    
     def evaluate_fitness(self, individual_idx: int, num_games: int = 10, 
                         include_hall_of_fame: bool = True) -> float:
         """Evaluate fitness against diverse opponents"""
         network = self.population[individual_idx]
-        total_wins = 0
-        games_played = 0
         
         # Play against other population members
         opponents_idx = np.random.choice(
@@ -52,18 +148,16 @@ class AdaptiveGeneticAlgorithm:
             replace=False
         )
         
-        for opp_idx in opponents_idx:
-            wins = self._play_matches(network, self.population[opp_idx], num_games=2)
-            total_wins += wins
-            games_played += 2
+        opponents = [self.population[opp_idx] for opp_idx in opponents_idx]
         
         # Play against Hall of Fame champions
         if include_hall_of_fame and len(self.hall_of_fame.champions) > 0:
-            hof_opponents = self.hall_of_fame.get_opponents(n=3)
-            for hof_opponent in hof_opponents:
-                wins = self._play_matches(network, hof_opponent, num_games=2)
-                total_wins += wins
-                games_played += 2
+            opponents.extend(self.hall_of_fame.get_opponents(n=3))
+        
+        # Two matches per opponent, all played in lockstep
+        wins = play_simple_matches(network, opponents * 2)
+        total_wins = int(wins.sum())
+        games_played = 2 * len(opponents)
         
         # Calculate fitness with bonus for beating champions
         base_fitness = total_wins / games_played if games_played > 0 else 0
@@ -75,129 +169,134 @@ class AdaptiveGeneticAlgorithm:
         
         return base_fitness
     
-    def _play_matches(self, network1: EnhancedYanivNN, network2: EnhancedYanivNN, 
-                     num_games: int = 2) -> int:
-        """Play matches between two networks"""
-        wins = 0
-        
-        for game_idx in range(num_games):
-            # Alternate who goes first
-            if game_idx % 2 == 0:
-                players = [network1, network2]
-                player1_idx = 0
-            else:
-                players = [network2, network1]
-                player1_idx = 1
-            
-            game_wins = play_simple_match(network1, network2)
-            wins += game_wins
-        
-        return wins
-    
     def adapt_mutation_rate(self, individual_idx: int):
         """Adapt mutation rate based on fitness improvement"""
+        self.adapt_mutation_rates(slice(individual_idx, individual_idx + 1))
+    
+    def adapt_mutation_rates(self, individuals=slice(None)):
+        """Adapt the mutation rates of ``individuals`` (indices or a slice) at once"""
         if len(self.fitness_history) < 2:
             return
         
-        current_fitness = self.fitness_scores[individual_idx]
+        current_fitness = self.fitness_scores[individuals]
         
-        # Check improvement over last few generations
-        recent_history = self.fitness_history[-5:]
-        avg_recent = np.mean([gen['best'] for gen in recent_history])
+        # Check improvement over last few generations, the same for every individual
+        recent = min(5, len(self.fitness_history))
+        avg_recent = np.mean([self.fitness_history[-k]['best'] for k in range(1, recent + 1)])
         
-        if current_fitness > avg_recent * 1.05:  # 5% improvement
-            # Reduce mutation for good performers
-            self.mutation_rates[individual_idx] *= 0.9
-        elif current_fitness < avg_recent * 0.95:  # 5% worse
-            # Increase mutation for poor performers
-            self.mutation_rates[individual_idx] *= 1.1
+        rates = self.mutation_rates[individuals]
+        # Reduce mutation for good performers (5% improvement)
+        rates[current_fitness > avg_recent * 1.05] *= 0.9
+        # Increase mutation for poor performers (5% worse)
+        rates[current_fitness < avg_recent * 0.95] *= 1.1
         
         # Bounds
-        self.mutation_rates[individual_idx] = np.clip(
-            self.mutation_rates[individual_idx], 0.01, 0.5
-        )
+        self.mutation_rates[individuals] = np.clip(rates, 0.01, 0.5)
     
-    def mutate(self, individual_idx: int, strength_multiplier: float = 1.0):
-        """Mutate individual with adaptive rate"""
-        network = self.population[individual_idx]
-        mutation_rate = self.mutation_rates[individual_idx] * strength_multiplier
-        
-        # Get flat weights
-        weights = network.get_weights_flat()
-        
-        # Apply mutations
-        mask = np.random.random(weights.shape) < mutation_rate
-        mutations = np.random.randn(weights.shape[0]) * 0.1
-        weights[mask] += mutations[mask]
+    def _large_mutation(self, weights: np.ndarray):
+        """Perturb a random 1% of the weights strongly, in place"""
+        # Distinct indices, so the fancy-indexed add touches every sampled weight once
+        large_mutation_idx = self.rng.choice(len(weights), size=int(len(weights) * 0.01), replace=False)
+        weights[large_mutation_idx] += self.rng.standard_normal(len(large_mutation_idx), dtype=np.float32) * 0.5
+    
+    def mutate_population(self, strength_multiplier: float = 1.0):
+        """Mutate every non-elite individual at its adaptive rate in one vectorized step"""
+        E = self.elite_size
+        rates = (self.mutation_rates[E:] * strength_multiplier).astype(np.float32)
+        
+        # Draws land in float32 scratch buffers kept across generations
+        shape = self.W[E:].shape
+        if self._noise_buf is None or self._noise_buf.shape != shape:
+            self._noise_buf = np.empty(shape, dtype=np.float32)
+            self._draw_buf = np.empty(shape, dtype=np.float32)
+        draws = self.rng.random(dtype=np.float32, out=self._draw_buf)
+        noise = self.rng.standard_normal(dtype=np.float32, out=self._noise_buf)
+        noise *= np.float32(0.1)
+        noise *= draws < rates[:, None]
+        self.W[E:] += noise
         
         # Occasionally do larger mutations
-        if np.random.random() < 0.1:  # 10% chance
-            large_mutation_idx = np.random.choice(len(weights), size=int(len(weights) * 0.01))
-            weights[large_mutation_idx] += np.random.randn(len(large_mutation_idx)) * 0.5
-        
-        # Set weights back
-        network.set_weights_from_flat(weights)
+        for i in np.flatnonzero(self.rng.random(self.population_size - E) < 0.1):
+            self._large_mutation(self.W[E + i])
     
-    def crossover(self, parent1_idx: int, parent2_idx: int) -> EnhancedYanivNN:
-        """Advanced crossover operation"""
-        parent1 = self.population[parent1_idx]
-        parent2 = self.population[parent2_idx]
-        
-        child = EnhancedYanivNN()
-        
+    def crossover(self, parent1_idx: int, parent2_idx: int,
+                  out: Optional[np.ndarray] = None) -> EnhancedYanivNN:
+        """Advanced crossover operation, writing the child's weights into ``out`` if given"""
         # Get parent weights
-        weights1 = parent1.get_weights_flat()
-        weights2 = parent2.get_weights_flat()
+        weights1 = self.W[parent1_idx]
+        weights2 = self.W[parent2_idx]
         
         # Use different crossover strategies
         strategy = np.random.choice(['uniform', 'block', 'arithmetic'])
+        child_weights = np.empty_like(weights1) if out is None else out
         
         if strategy == 'uniform':
             # Uniform crossover
-            mask = np.random.random(weights1.shape) < 0.5
-            child_weights = np.where(mask, weights1, weights2)
+            _uniform_crossover(weights1, weights2, child_weights)
             
         elif strategy == 'block':
             # Block crossover - swap large chunks
-            num_blocks = 10
-            block_size = len(weights1) // num_blocks
-            child_weights = weights1.copy()
-            
-            for i in range(num_blocks):
-                if np.random.random() < 0.5:
-                    start = i * block_size
-                    end = min((i + 1) * block_size, len(weights1))
-                    child_weights[start:end] = weights2[start:end]
+            _block_crossover(weights1, weights2, child_weights, 10, self.rng)
                     
         else:  # arithmetic
             # Arithmetic crossover - weighted average
-            alpha = np.random.uniform(0.3, 0.7)
-            child_weights = alpha * weights1 + (1 - alpha) * weights2
+            alpha = np.float32(np.random.uniform(0.3, 0.7))
+            _arith_crossover(weights1, weights2, child_weights, alpha)
         
-        child.set_weights_from_flat(child_weights)
-        return child
+        return self._network_from_row(child_weights)
     
     def tournament_selection(self, tournament_size: Optional[int] = None) -> int:
         """Select individual through tournament"""
+        return int(self.tournament_selection_batch(1, tournament_size)[0])
+    
+    def tournament_selection_batch(self, n: int, tournament_size: Optional[int] = None) -> np.ndarray:
+        """Run n independent tournaments at once, returning the n winners' indices
+        
+        Each tournament draws tournament_size distinct candidates: the positions of
+        the smallest of P random keys per row, a vectorized sample without replacement.
+        """
         if tournament_size is None:
             tournament_size = self.tournament_size
-            
-        candidates = np.random.choice(self.population_size, size=tournament_size, replace=False)
-        fitnesses = self.fitness_scores[candidates]
-        winner_idx = candidates[np.argmax(fitnesses)]
         
-        return winner_idx
+        keys = self.rng.random((n, self.population_size))
+        candidates = np.argpartition(keys, tournament_size - 1, axis=1)[:, :tournament_size]
+        fitnesses = self.fitness_scores[candidates]
+        return candidates[np.arange(n), np.argmax(fitnesses, axis=1)]
     
     def evolve_generation(self):
         """Evolve one generation with advanced techniques"""
-        print(f"Evaluating generation {len(self.fitness_history) + 1}...")
+        print(f"Evaluating generation {self.generation + 1}...")
         
-        # Sequential fitness evaluation (more reliable)
         print(f"Evaluating {self.population_size} individuals...")
-        for i in range(self.population_size):
-            if i % 5 == 0:
-                print(f"  Progress: {i}/{self.population_size}")
-            self.fitness_scores[i] = self.evaluate_fitness(i)
+        if self.num_workers > 1:
+            # Parallel fitness evaluation, workers get the GA once through the initializer
+            # Workers read the population from one shared copy of the weight matrix
+            ctx = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else mp.get_context()
+            chunksize = max(1, self.population_size // (4 * self.num_workers))
+            warm_up_forward()  # compiled once here, forked workers inherit it
+            shm = shared_memory.SharedMemory(create=True, size=self.W.nbytes)
+            try:
+                np.ndarray(self.W.shape, dtype=self.W.dtype, buffer=shm.buf)[:] = self.W
+                shm_spec = (shm.name, self.W.shape, self.W.dtype.str)
+                self._shared_weights = True
+                with ctx.Pool(processes=self.num_workers, initializer=_init_worker,
+                              initargs=(self, shm_spec)) as pool:
+                    for done, (i, fitness) in enumerate(
+                            pool.imap_unordered(_evaluate_individual, range(self.population_size),
+                                                chunksize=chunksize)):
+                        if done % 5 == 0:
+                            print(f"  Progress: {done}/{self.population_size}")
+                        self.fitness_scores[i] = fitness
+            finally:
+                self._shared_weights = False
+                shm.close()
+                shm.unlink()
+        else:
+            # Sequential fitness evaluation
+            for i in range(self.population_size):
+                if i % 5 == 0:
+                    print(f"  Progress: {i}/{self.population_size}")
+                self.fitness_scores[i] = self.evaluate_fitness(i)
         
         # Sort by fitness
         sorted_indices = np.argsort(self.fitness_scores)[::-1]
@@ -206,14 +305,15 @@ class AdaptiveGeneticAlgorithm:
         best_idx = sorted_indices[0]
         best_fitness = self.fitness_scores[best_idx]
         self.hall_of_fame.update(
-            self.population[best_idx],
+            self.population[best_idx].clone(),
             best_fitness,
-            len(self.fitness_history) + 1,
+            self.generation + 1,
             {'mutation_rate': self.mutation_rates[best_idx]}
         )
         
         # Track statistics
         stats = {
+            'generation': self.generation + 1,
             'best': best_fitness,
             'mean': np.mean(self.fitness_scores),
             'std': np.std(self.fitness_scores),
@@ -225,7 +325,7 @@ class AdaptiveGeneticAlgorithm:
         }
         self.generation_stats.append(stats)
         
-        print(f"Generation {len(self.fitness_history) + 1} - "
+        print(f"Generation {self.generation + 1} - "
               f"Best: {stats['best']:.3f}, Mean: {stats['mean']:.3f}, "
               f"Std: {stats['std']:.3f}")
         
@@ -237,35 +337,40 @@ class AdaptiveGeneticAlgorithm:
                 self.stagnation_counter = 0
         
         self.fitness_history.append(stats)
+        self.generation += 1
         
-        # Create new population
+        # Create new population as rows of a fresh weight matrix, parents being
+        # read from the current one; elites and clones are plain row copies
+        new_W = np.empty_like(self.W)
         new_population = []
         
         # Elitism - keep best individuals
         for i in range(self.elite_size):
-            elite = EnhancedYanivNN()
-            elite_weights = self.population[sorted_indices[i]].get_weights_flat()
-            elite.set_weights_from_flat(elite_weights.copy())
-            new_population.append(elite)
-        
-        # Fill rest of population
-        while len(new_population) < self.population_size:
-            if np.random.random() < self.crossover_rate:
+            new_W[i] = self.W[sorted_indices[i]]
+            new_population.append(self._network_from_row(new_W[i]))
+        
+        # Fill rest of population, with every parent drawn up front in one batch
+        n_needed = self.population_size - self.elite_size
+        do_crossover = self.rng.random(n_needed) < self.crossover_rate
+        winners = self.tournament_selection_batch(2 * n_needed)
+        parents1, parents2 = winners[:n_needed], winners[n_needed:]
+        
+        # Clone and mutate
+        clones = np.flatnonzero(~do_crossover)
+        new_W[self.elite_size + clones] = self.W[parents1[clones]]
+        
+        for k in range(n_needed):
+            i = self.elite_size + k
+            if do_crossover[k]:
                 # Crossover
-                parent1_idx = self.tournament_selection()
-                parent2_idx = self.tournament_selection()
-                child = self.crossover(parent1_idx, parent2_idx)
-                new_population.append(child)
+                child = self.crossover(parents1[k], parents2[k], out=new_W[i])
             else:
-                # Clone and mutate
-                parent_idx = self.tournament_selection()
-                child = EnhancedYanivNN()
-                parent_weights = self.population[parent_idx].get_weights_flat()
-                child.set_weights_from_flat(parent_weights.copy())
-                new_population.append(child)
+                child = self._network_from_row(new_W[i])
+            new_population.append(child)
         
         # Update population
-        self.population = new_population[:self.population_size]
+        self.W = new_W
+        self.population = new_population
         
         # Apply mutations (skip elites)
         strength_multiplier = 1.0
@@ -273,12 +378,11 @@ class AdaptiveGeneticAlgorithm:
             strength_multiplier = 1.5  # Increase mutation strength
             print("Increasing mutation strength due to stagnation")
         
-        for i in range(self.elite_size, self.population_size):
-            self.adapt_mutation_rate(i)
-            self.mutate(i, strength_multiplier)
+        self.adapt_mutation_rates(slice(self.elite_size, None))
+        self.mutate_population(strength_multiplier)
         
         # Reset fitness scores
-        self.fitness_scores = np.zeros(self.population_size)
+        self.fitness_scores.fill(0)
     
     def create_ensemble(self, top_n: int = 5) -> EnsembleAI:
         """Create ensemble from best networks"""
@@ -297,24 +401,27 @@ class AdaptiveGeneticAlgorithm:
         return ensemble
     
     def save_checkpoint(self, filename: str):
-        """Save training checkpoint"""
+        """Save training checkpoint
+        
+        Metadata goes to ``filename`` as JSON and the whole population's weight
+        matrix, mutation rates and fitness scores to ``{filename}.npz``.
+        """
         checkpoint = {
-            'generation': len(self.fitness_history),
+            'generation': self.generation,
             'population_size': self.population_size,
-            'fitness_scores': self.fitness_scores.tolist(),
-            'mutation_rates': self.mutation_rates.tolist(),
-            'fitness_history': self.fitness_history,
-            'generation_stats': self.generation_stats,
+            'fitness_history': list(self.fitness_history),
+            'generation_stats': list(self.generation_stats),
             'stagnation_counter': self.stagnation_counter
         }
         
         # Save checkpoint data
-        with open(filename, 'wb') as f:
-            pickle.dump(checkpoint, f)
+        with open(filename, 'w') as f:
+            json.dump(checkpoint, f)
         
-        # Save networks
-        for i, network in enumerate(self.population):
-            network.save(f"{filename}_network_{i}.json")
+        # Save networks as one stacked weight matrix
+        np.savez_compressed(f"{filename}.npz", W=self.W,
+                            mutation_rates=self.mutation_rates,
+                            fitness_scores=self.fitness_scores)
         
         # Save Hall of Fame
         self.hall_of_fame.save(f"{filename}_hall_of_fame.json")
@@ -322,21 +429,38 @@ class AdaptiveGeneticAlgorithm:
         print(f"Checkpoint saved to {filename}")
     
     def load_checkpoint(self, filename: str):
-        """Load training checkpoint"""
-        with open(filename, 'rb') as f:
-            checkpoint = pickle.load(f)
+        """Load training checkpoint, either JSON + .npz (see save_checkpoint) or a legacy pickle
         
-        self.fitness_scores = np.array(checkpoint['fitness_scores'])
-        self.mutation_rates = np.array(checkpoint['mutation_rates'])
-        self.fitness_history = checkpoint['fitness_history']
-        self.generation_stats = checkpoint['generation_stats']
+        Legacy checkpoints were pickled dicts with one JSON file per network,
+        ``{filename}_network_{i}.json``.
+        """
+        with open(filename, 'rb') as f:
+            legacy = filename.endswith('.pkl') or f.read(1) == b'\x80'  # Pickle protocol 2+ opcode
+            f.seek(0)
+            checkpoint = pickle.load(f) if legacy else json.load(f)
+        
+        self.fitness_history = deque(checkpoint['fitness_history'], maxlen=self.history_size)
+        self.generation_stats = deque(checkpoint['generation_stats'], maxlen=self.history_size)
+        self.generation = checkpoint.get('generation', len(checkpoint['fitness_history']))
+        
+        # Older checkpoints don't number their stats; the histories end at this generation
+        for history in (self.fitness_history, self.generation_stats):
+            for age, stats in enumerate(reversed(history)):
+                stats.setdefault('generation', self.generation - age)
         self.stagnation_counter = checkpoint['stagnation_counter']
         
-        # Load networks
-        self.population = []
-        for i in range(self.population_size):
-            network = EnhancedYanivNN.load(f"{filename}_network_{i}.json")
-            self.population.append(network)
+        if legacy:
+            self.mutation_rates = np.array(checkpoint['mutation_rates'])
+            self.fitness_scores = np.array(checkpoint['fitness_scores'])
+            self._set_population([EnhancedYanivNN.load(f"{filename}_network_{i}.json")
+                                  for i in range(len(self.fitness_scores))])
+        else:
+            # Load networks as views over the stored weight matrix
+            with np.load(f"{filename}.npz") as data:
+                self.W = data['W']
+                self.mutation_rates = data['mutation_rates']
+                self.fitness_scores = data['fitness_scores']
+            self.population = [self._network_from_row(row) for row in self.W]
         
         # Load Hall of Fame
         self.hall_of_fame.load(f"{filename}_hall_of_fame.json")
@@ -361,7 +485,7 @@ def train_enhanced_ai(generations: int = 100, checkpoint_interval: int = 10):
             
             # Save checkpoint
             if (gen + 1) % checkpoint_interval == 0:
-                ga.save_checkpoint(f"enhanced_checkpoint_gen_{gen + 1}.pkl")
+                ga.save_checkpoint(f"enhanced_checkpoint_gen_{gen + 1}.json")
             
             # Early stopping if converged
             if ga.stagnation_counter > 20:
@@ -386,8 +510,8 @@ def train_enhanced_ai(generations: int = 100, checkpoint_interval: int = 10):
     # Save training history
     with open("enhanced_training_history.json", 'w') as f:
         json.dump({
-            'fitness_history': ga.fitness_history,
-            'generation_stats': ga.generation_stats,
+            'fitness_history': list(ga.fitness_history),
+            'generation_stats': list(ga.generation_stats),
             'training_time': elapsed_time
         }, f)
     
@@ -2,8 +2,7 @@ import numpy as np
 from typing import List, Tuple, Dict, Optional
 from yaniv_neural_network_optimized import YanivNeuralNetworkOptimized
 from yaniv_game_ai_optimized import YanivGameAIOptimized
-from parallel_executor_simple import SimpleParallelExecutor
-import random
+from parallel_executor_simple import SimpleParallelExecutor, tally_matchups
 import json
 import os
 import time
@@ -13,12 +12,50 @@ from concurrent.futures import ProcessPoolExecutor, as_completed
 import pickle
 import gc
 
+class PopulationSoA:
+    """Structure-of-arrays view of a population: weights stacked along a leading population axis"""
+    
+    def __init__(self, networks: List[YanivNeuralNetworkOptimized]):
+        self.network_ids = np.array([network.network_id for network in networks])
+        self.w1 = np.stack([network.w1 for network in networks])  # (P, inputs, hidden)
+        self.b1 = np.stack([network.b1 for network in networks])  # (P, hidden)
+        self.w2 = np.stack([network.w2 for network in networks])  # (P, hidden, outputs)
+        self.b2 = np.stack([network.b2 for network in networks])  # (P, outputs)
+    
+    def __len__(self) -> int:
+        return len(self.network_ids)
+    
+    def forward_batch(self, features: np.ndarray) -> np.ndarray:
+        """Forward pass of every network at once.
+        
+        ``features`` is (batch, inputs) shared by all networks or (P, batch, inputs);
+        returns (P, batch, outputs) probabilities using one batched matmul per layer.
+        """
+        hidden = np.matmul(features, self.w1)
+        hidden += self.b1[:, None, :]
+        np.maximum(hidden, 0, out=hidden)  # In-place ReLU
+        
+        output = np.matmul(hidden, self.w2)
+        output += self.b2[:, None, :]
+        
+        # Softmax over the action axis
+        output -= np.max(output, axis=-1, keepdims=True)
+        np.exp(output, out=output)
+        output /= np.sum(output, axis=-1, keepdims=True)
+        return output
+
+
 class GeneticAlgorithmOptimized:
     """Optimized genetic algorithm with parallel evaluation and vectorized operations"""
     
+    # Consecutive tournament results the tentative top-K must hold before the
+    # next generation is bred speculatively
+    SPECULATION_PATIENCE = 8
+    
     def __init__(self, population_size: int = 50, top_k: int = 10, 
                  mutation_rate: float = 0.1, mutation_strength: float = 0.1,
-                 num_workers: Optional[int] = None):
+                 num_workers: Optional[int] = None, quantize_inference: bool = False,
+                 swiss_tournament: bool = False):
         self.population_size = population_size
         self.top_k = top_k
         self.mutation_rate = mutation_rate
@@ -27,13 +64,21 @@ class GeneticAlgorithmOptimized:
         self.population: List[YanivNeuralNetworkOptimized] = []
         self.best_fitness_history = []
         self.num_workers = num_workers or mp.cpu_count()
-        self.parallel_executor = SimpleParallelExecutor(self.num_workers)
+        self.quantize_inference = quantize_inference
+        self.swiss_tournament = swiss_tournament
+        self.parallel_executor = SimpleParallelExecutor(self.num_workers, quantize=quantize_inference)
         
         # Memory optimization: reuse population arrays
         self.fitness_array = np.zeros(population_size)
         self.wins_array = np.zeros(population_size)
         self.games_array = np.zeros(population_size)
         
+        # Mutation noise for _breed_offspring
+        self._rng = np.random.default_rng()
+        
+        # Offspring bred by _speculate_offspring during the current tournament
+        self._speculation = {}
+        
     def initialize_population(self):
         """Create initial random population with optimized networks"""
         self.population = []
@@ -43,36 +88,44 @@ class GeneticAlgorithmOptimized:
         print(f"Initialized population with {self.population_size} optimized neural networks")
         print(f"Using {self.num_workers} CPU cores for parallel evaluation")
     
-    def evaluate_population_parallel(self, games_per_matchup: int = 10):
-        """Run tournament in parallel using all CPU cores"""
+    def evaluate_population_parallel(self, games_per_matchup: int = 10, pool=None, on_result=None):
+        """Run tournament in parallel using all CPU cores.
+        
+        ``pool`` may be a worker pool from ``parallel_executor.create_pool`` that
+        already holds this population's weights. ``on_result`` is passed on to the
+        round-robin tournament; with ``swiss_tournament`` set it is ignored, so
+        no offspring are bred speculatively.
+        """
         print(f"Evaluating population using {self.num_workers} parallel workers...")
         start_time = time.time()
         
-        # Reset stats arrays
+        # Run parallel tournament with progress bar; a Swiss tournament plays
+        # O(P log P) games instead of the O(P^2) round robin
+        if self.swiss_tournament:
+            results = self.parallel_executor.play_swiss_tournament(
+                self.population, games_per_matchup, pool=pool
+            )
+        else:
+            results = self.parallel_executor.play_tournament_parallel_with_progress(
+                self.population, games_per_matchup, pool=pool, on_result=on_result
+            )
+        
+        # Gather population stats from results in one step; every network has an
+        # entry, so no reset is needed beforehand
+        network_ids = list(results.keys())
+        wins_games = np.array(list(results.values())).reshape(-1, 2)
+        self.wins_array[network_ids] = wins_games[:, 0]
+        self.games_array[network_ids] = wins_games[:, 1]
         self.fitness_array.fill(0)
-        self.wins_array.fill(0)
-        self.games_array.fill(0)
-        
-        # Run parallel tournament with progress bar
-        results = self.parallel_executor.play_tournament_parallel_with_progress(
-            self.population, games_per_matchup
-        )
-        
-        # Update population stats from results
-        for network_id, (wins, games) in results.items():
-            self.wins_array[network_id] = wins
-            self.games_array[network_id] = games
-            if games > 0:
-                self.fitness_array[network_id] = wins / games
+        np.divide(self.wins_array, self.games_array, out=self.fitness_array, where=self.games_array > 0)
         
         # Update network objects
-        for i, network in enumerate(self.population):
-            network.wins = int(self.wins_array[i])
-            network.games_played = int(self.games_array[i])
-            network.fitness = self.fitness_array[i]
+        for network, wins, games, fitness in zip(self.population, self.wins_array,
+                                                 self.games_array, self.fitness_array):
+            network.wins, network.games_played, network.fitness = int(wins), int(games), float(fitness)
         
         elapsed = time.time() - start_time
-        total_games = self.population_size * (self.population_size - 1) * games_per_matchup
+        total_games = int(self.games_array.sum()) // 2
         print(f"Evaluation complete in {elapsed:.2f}s ({total_games / elapsed:.1f} games/sec)")
     
     def evaluate_population_vectorized(self, games_per_matchup: int = 10):
@@ -121,39 +174,14 @@ class GeneticAlgorithmOptimized:
     def _simulate_games_vectorized(self, player1: YanivNeuralNetworkOptimized, 
                                  player2: YanivNeuralNetworkOptimized, 
                                  num_games: int) -> int:
-        """Simulate multiple games using vectorized operations where possible"""
-        p1_wins = 0
-        
-        # Play games in small batches for memory efficiency
-        games_per_batch = min(4, num_games)
-        
-        for batch_start in range(0, num_games, games_per_batch):
-            batch_end = min(batch_start + games_per_batch, num_games)
-            batch_size = batch_end - batch_start
-            
-            # Simulate games in this batch
-            for game_idx in range(batch_size):
-                # Alternate starting player
-                if (batch_start + game_idx) % 2 == 0:
-                    players = [player1, player2]
-                else:
-                    players = [player2, player1]
-                
-                game = YanivGameAIOptimized()
-                winner = game.play_game(players)
-                
-                if winner.network_id == player1.network_id:
-                    p1_wins += 1
-        
-        return p1_wins
+        """Simulate multiple games, stepped together so each turn is one batched forward pass per network"""
+        return int(YanivGameAIOptimized.play_games_batch(player1, player2, num_games,
+                                                         quantize=self.quantize_inference).sum())
     
     def select_survivors_vectorized(self) -> List[YanivNeuralNetworkOptimized]:
         """Select top performers using vectorized operations"""
-        # Use numpy for fast sorting
-        sorted_indices = np.argsort(self.fitness_array)[::-1]  # Descending order
-        
         # Select top K
-        top_indices = sorted_indices[:self.top_k]
+        top_indices = self._top_k_indices(self.fitness_array)
         survivors = [self.population[idx] for idx in top_indices]
         
         # Print results
@@ -169,8 +197,13 @@ class GeneticAlgorithmOptimized:
         
         return survivors
     
-    def create_next_generation_optimized(self, survivors: List[YanivNeuralNetworkOptimized]):
-        """Create new generation with memory optimization"""
+    def create_next_generation_optimized(self, survivors: List[YanivNeuralNetworkOptimized],
+                                         offspring: Optional[List[YanivNeuralNetworkOptimized]] = None):
+        """Create new generation with memory optimization
+        
+        ``offspring`` may already have been bred from these survivors (see
+        _speculate_offspring); otherwise they are bred here.
+        """
         new_population = []
         
         # Keep the survivors (elitism)
@@ -178,104 +211,210 @@ class GeneticAlgorithmOptimized:
             survivor.network_id = i
             new_population.append(survivor)
         
+        if offspring is None:
+            offspring = self._breed_offspring(survivors, np.array([survivor.fitness for survivor in survivors]),
+                                              self.mutation_rate, self.mutation_strength)
+        new_population.extend(offspring)
+        
+        self.population = new_population
+        self.generation += 1
+        
+        # Force garbage collection to free memory
+        gc.collect()
+    
+    def _breed_offspring(self, survivors: List[YanivNeuralNetworkOptimized], fitness: np.ndarray,
+                         mutation_rate: float, mutation_strength: float) -> List[YanivNeuralNetworkOptimized]:
+        """Offspring filling the population after ``survivors``, by tournament selection and mutation
+        
+        Winners depend only on the order of ``fitness`` (the survivors' fitness),
+        not on its values.
+        """
+        offspring_list = []
+        
         # Tournament selection for breeding
         tournament_size = 3
         num_offspring = self.population_size - len(survivors)
         
-        current_id = len(survivors)
-        
-        # Create offspring through tournament selection and mutation
-        for _ in range(num_offspring):
-            # Tournament selection
-            tournament_indices = np.random.choice(len(survivors), tournament_size, replace=False)
-            tournament_fitness = [survivors[idx].fitness for idx in tournament_indices]
-            winner_idx = tournament_indices[np.argmax(tournament_fitness)]
-            parent = survivors[winner_idx]
-            
-            # Create mutated offspring
-            offspring = parent.copy()
-            offspring.network_id = current_id
-            offspring.mutate_vectorized(self.mutation_rate, self.mutation_strength)
-            
-            # Optionally add some fully random networks for diversity
-            if random.random() < 0.1:  # 10% chance of random network
+        # Draw every tournament at once: the first tournament_size columns of an
+        # argpartition over random keys are distinct survivors (no replacement)
+        keys = np.random.random((num_offspring, len(survivors)))
+        tournaments = np.argpartition(keys, tournament_size - 1, axis=1)[:, :tournament_size]
+        winners = tournaments[np.arange(num_offspring), fitness[tournaments].argmax(axis=1)]
+        
+        # Optionally add some fully random networks for diversity (10% chance each)
+        fresh = np.random.random(num_offspring) < 0.1
+        
+        # Copy the winners' fused weight matrices into one (offspring, ...) stack per
+        # layer and mutate each stack with a single mask and noise draw
+        parents = winners[~fresh]
+        stacks = [np.stack([getattr(survivors[idx], name) for idx in parents])
+                  for name in YanivNeuralNetworkOptimized.FUSED_NAMES]
+        for stack in stacks:
+            mask = self._rng.random(stack.shape, dtype=np.float32) < mutation_rate
+            noise = self._rng.standard_normal(np.count_nonzero(mask), dtype=np.float32)
+            noise *= mutation_strength
+            stack[mask] += noise
+        
+        # Mutated offspring own one row of each stack
+        rows = zip(*stacks)
+        for current_id, is_fresh in zip(range(len(survivors), self.population_size), fresh):
+            if is_fresh:
                 offspring = YanivNeuralNetworkOptimized(network_id=current_id)
+            else:
+                offspring = YanivNeuralNetworkOptimized.from_fused(current_id, *next(rows))
             
-            new_population.append(offspring)
-            current_id += 1
-        
-        self.population = new_population
-        self.generation += 1
+            offspring_list.append(offspring)
         
-        # Force garbage collection to free memory
-        gc.collect()
+        return offspring_list
+    
+    def _speculate_offspring(self, records: np.ndarray, remaining: int):
+        """Tournament progress callback: breed the next generation before the tournament ends
+        
+        Once the tentative top-K ranking has held for SPECULATION_PATIENCE
+        consecutive results, the offspring are bred from it while workers play
+        the remaining matchups. evolve_parallel uses them only if the final
+        ranking, its ties and the adapted mutation parameters all match, in which
+        case breeding afterwards would have picked the same parents.
+        """
+        if remaining == 0:
+            return
+        
+        speculation = self._speculation
+        wins, games = tally_matchups(records, self.population_size, speculation['games_per_matchup'])
+        fitness = np.zeros(self.population_size)
+        np.divide(wins, games, out=fitness, where=games > 0)
+        key = self._ranking_key(fitness)
+        
+        if key != speculation.get('candidate'):
+            speculation['candidate'], speculation['streak'] = key, 1
+            return
+        speculation['streak'] += 1
+        if speculation['streak'] < self.SPECULATION_PATIENCE or speculation.get('key') == key:
+            return
+        
+        ranking = key[0]
+        mutation_rate, mutation_strength, _ = self._adapted_mutation(self.best_fitness_history
+                                                                     + [fitness[ranking[0]]])
+        survivors = [self.population[idx] for idx in ranking]
+        speculation['key'] = key
+        speculation['mutation'] = (mutation_rate, mutation_strength)
+        speculation['offspring'] = self._breed_offspring(survivors, fitness[list(ranking)],
+                                                         mutation_rate, mutation_strength)
+    
+    def _top_k_indices(self, fitness: np.ndarray) -> np.ndarray:
+        """Indices of the top_k fitness values, best first
+        
+        Partitions out the top K in O(P) and sorts only those, instead of sorting
+        the whole population.
+        """
+        top_k = min(self.top_k, len(fitness))
+        top = np.argpartition(-fitness, top_k - 1)[:top_k]
+        return top[np.argsort(-fitness[top], kind='stable')]
+    
+    def _ranking_key(self, fitness: np.ndarray) -> Tuple:
+        """Top-K indices in select_survivors_vectorized's order, plus which neighbours tie"""
+        ranking = self._top_k_indices(fitness)
+        return tuple(ranking.tolist()), tuple((np.diff(fitness[ranking]) == 0).tolist())
     
     def adaptive_mutation_rate(self):
         """Adapt mutation rate based on population diversity"""
-        if len(self.best_fitness_history) > 5:
+        self.mutation_rate, self.mutation_strength, plateau = self._adapted_mutation(self.best_fitness_history)
+        if plateau:
+            print(f"Plateau detected - increasing mutation rate to {self.mutation_rate:.3f}")
+    
+    def _adapted_mutation(self, best_fitness_history: List[float]) -> Tuple[float, float, bool]:
+        """Mutation rate and strength adapted to ``best_fitness_history``, and whether it plateaued"""
+        mutation_rate, mutation_strength, plateau = self.mutation_rate, self.mutation_strength, False
+        if len(best_fitness_history) > 5:
             # Check if fitness is plateauing
-            recent_fitness = self.best_fitness_history[-5:]
+            recent_fitness = best_fitness_history[-5:]
             fitness_variance = np.var(recent_fitness)
             
             if fitness_variance < 0.001:  # Plateau detected
                 # Increase mutation rate to explore more
-                self.mutation_rate = min(0.3, self.mutation_rate * 1.2)
-                self.mutation_strength = min(0.3, self.mutation_strength * 1.2)
-                print(f"Plateau detected - increasing mutation rate to {self.mutation_rate:.3f}")
+                mutation_rate = min(0.3, mutation_rate * 1.2)
+                mutation_strength = min(0.3, mutation_strength * 1.2)
+                plateau = True
             else:
                 # Decrease mutation rate for exploitation
-                self.mutation_rate = max(0.05, self.mutation_rate * 0.95)
-                self.mutation_strength = max(0.05, self.mutation_strength * 0.95)
+                mutation_rate = max(0.05, mutation_rate * 0.95)
+                mutation_strength = max(0.05, mutation_strength * 0.95)
+        return mutation_rate, mutation_strength, plateau
     
     def evolve_parallel(self, num_generations: int, games_per_matchup: int = 10,
                        use_parallel: bool = True, save_interval: int = 5):
-        """Run the evolutionary process with parallel evaluation"""
+        """Run the evolutionary process with parallel evaluation
+        
+        A pool already opened with ``parallel_executor.open_pool`` is reused
+        and left open for the caller; otherwise one is opened for this run
+        and closed at the end.
+        """
         print(f"Starting parallel evolution for {num_generations} generations")
         print(f"Population size: {self.population_size}")
         print(f"Games per matchup: {games_per_matchup}")
         print(f"CPU cores: {self.num_workers}")
-        print(f"Total games per generation: {self.population_size * (self.population_size - 1) * games_per_matchup}")
+        if self.swiss_tournament:
+            matchups = self.parallel_executor.swiss_rounds(self.population_size) * (self.population_size // 2)
+        else:
+            matchups = self.population_size * (self.population_size - 1) // 2
+        print(f"Total games per generation: {matchups * games_per_matchup}")
         
         start_time = time.time()
+        owns_pool = self.parallel_executor.pool is None
         
-        for gen in range(num_generations):
-            print(f"\n--- Generation {self.generation} ---")
-            gen_start = time.time()
-            
-            # Evaluate current population
-            if use_parallel:
-                self.evaluate_population_parallel(games_per_matchup)
-            else:
-                self.evaluate_population_vectorized(games_per_matchup)
-            
-            # Select survivors
-            survivors = self.select_survivors_vectorized()
-            
-            # Track best fitness
-            self.best_fitness_history.append(survivors[0].fitness)
-            
-            # Save best network
-            self.save_best_network(survivors[0])
-            
-            # Save checkpoint periodically
-            if (gen + 1) % save_interval == 0:
-                self.save_checkpoint()
-            
-            # Adaptive mutation rate
-            self.adaptive_mutation_rate()
-            
-            # Create next generation
-            if gen < num_generations - 1:
-                self.create_next_generation_optimized(survivors)
-            
-            gen_time = time.time() - gen_start
-            print(f"Generation completed in {gen_time:.2f}s")
-            
-            # Estimate time remaining
-            if gen > 0:
-                avg_gen_time = (time.time() - start_time) / (gen + 1)
-                remaining_time = avg_gen_time * (num_generations - gen - 1)
-                print(f"Estimated time remaining: {remaining_time/60:.1f} minutes")
+        try:
+            for gen in range(num_generations):
+                print(f"\n--- Generation {self.generation} ---")
+                gen_start = time.time()
+                
+                # Evaluate current population
+                self._speculation = {'games_per_matchup': games_per_matchup}
+                if use_parallel:
+                    # One worker pool serves every generation; only the weights change.
+                    # While the tournament's last matchups run, the next generation
+                    # is bred speculatively from the tentative ranking
+                    pool = self.parallel_executor.open_pool(self.population)
+                    on_result = self._speculate_offspring if gen < num_generations - 1 else None
+                    self.evaluate_population_parallel(games_per_matchup, pool=pool, on_result=on_result)
+                else:
+                    self.evaluate_population_vectorized(games_per_matchup)
+                
+                # Select survivors
+                survivors = self.select_survivors_vectorized()
+                
+                # Track best fitness
+                self.best_fitness_history.append(survivors[0].fitness)
+                
+                # Save best network
+                self.save_best_network(survivors[0])
+                
+                # Save checkpoint periodically
+                if (gen + 1) % save_interval == 0:
+                    self.save_checkpoint()
+                
+                # Adaptive mutation rate
+                self.adaptive_mutation_rate()
+                
+                # Create next generation, reusing speculatively bred offspring if
+                # the final ranking and mutation parameters are the ones they assumed
+                if gen < num_generations - 1:
+                    offspring = None
+                    if (self._speculation.get('key') == self._ranking_key(self.fitness_array)
+                            and self._speculation['mutation'] == (self.mutation_rate, self.mutation_strength)):
+                        offspring = self._speculation['offspring']
+                    self.create_next_generation_optimized(survivors, offspring)
+                
+                gen_time = time.time() - gen_start
+                print(f"Generation completed in {gen_time:.2f}s")
+                
+                # Estimate time remaining
+                if gen > 0:
+                    avg_gen_time = (time.time() - start_time) / (gen + 1)
+                    remaining_time = avg_gen_time * (num_generations - gen - 1)
+                    print(f"Estimated time remaining: {remaining_time/60:.1f} minutes")
+        finally:
+            if owns_pool:
+                self.parallel_executor.close()
         
         total_time = time.time() - start_time
         print(f"\nEvolution complete in {total_time/60:.1f} minutes!")
@@ -297,37 +436,67 @@ class GeneticAlgorithmOptimized:
             print(f"New best network saved with fitness: {network.fitness:.3f}")
     
     def save_checkpoint(self):
-        """Save entire population state for resuming training"""
-        checkpoint = {
+        """Save entire population state for resuming training
+        
+        Weights are stacked along a leading population axis into a compressed .npz,
+        with the scalar settings as JSON metadata bytes.
+        """
+        meta = {
             'generation': self.generation,
             'population_size': self.population_size,
             'top_k': self.top_k,
             'mutation_rate': self.mutation_rate,
             'mutation_strength': self.mutation_strength,
-            'best_fitness_history': self.best_fitness_history,
-            'population_weights': []
+            'best_fitness_history': [float(fitness) for fitness in self.best_fitness_history]
         }
         
-        # Save all network weights
-        for network in self.population:
-            checkpoint['population_weights'].append({
-                'network_id': network.network_id,
-                'w1': network.w1.tolist(),
-                'b1': network.b1.tolist(),
-                'w2': network.w2.tolist(),
-                'b2': network.b2.tolist(),
-                'fitness': network.fitness,
-                'wins': network.wins,
-                'games_played': network.games_played
-            })
-        
-        filename = f'saved_networks/checkpoint_gen_{self.generation}.pkl'
-        with open(filename, 'wb') as f:
-            pickle.dump(checkpoint, f)
+        filename = f'saved_networks/checkpoint_gen_{self.generation}.npz'
+        np.savez_compressed(
+            filename,
+            w1_aug=np.stack([network._w1_aug for network in self.population]),
+            w2_aug=np.stack([network._w2_aug for network in self.population]),
+            network_ids=np.array([network.network_id for network in self.population]),
+            fitness=np.array([network.fitness for network in self.population], dtype=np.float64),
+            wins=np.array([network.wins for network in self.population]),
+            games_played=np.array([network.games_played for network in self.population]),
+            meta=np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8)
+        )
         print(f"Checkpoint saved to {filename}")
     
     def load_checkpoint(self, filename: str):
-        """Load population state from checkpoint"""
+        """Load population state from checkpoint, either .npz (see save_checkpoint) or a legacy pickle"""
+        if not filename.endswith('.npz'):
+            self._load_pickle_checkpoint(filename)
+            return
+        
+        with np.load(filename) as data:
+            meta = json.loads(data['meta'].tobytes())
+            w1_aug, w2_aug = data['w1_aug'], data['w2_aug']
+            network_ids, fitness = data['network_ids'], data['fitness']
+            wins, games_played = data['wins'], data['games_played']
+        
+        self.generation = meta['generation']
+        self.population_size = meta['population_size']
+        self.top_k = meta['top_k']
+        self.mutation_rate = meta['mutation_rate']
+        self.mutation_strength = meta['mutation_strength']
+        self.best_fitness_history = meta['best_fitness_history']
+        
+        # Restore population, each network's weights being row views of the stacked arrays
+        self.population = []
+        for k in range(len(network_ids)):
+            network = YanivNeuralNetworkOptimized(int(network_ids[k]), w1_aug.shape[2])
+            network._w1_aug = w1_aug[k]
+            network._w2_aug = w2_aug[k]
+            network.fitness = float(fitness[k])
+            network.wins = int(wins[k])
+            network.games_played = int(games_played[k])
+            self.population.append(network)
+        
+        print(f"Checkpoint loaded from generation {self.generation}")
+    
+    def _load_pickle_checkpoint(self, filename: str):
+        """Load a checkpoint written by earlier versions as a pickled dict of weight lists"""
         with open(filename, 'rb') as f:
             checkpoint = pickle.load(f)
         
@@ -342,10 +511,7 @@ class GeneticAlgorithmOptimized:
         self.population = []
         for weights in checkpoint['population_weights']:
             network = YanivNeuralNetworkOptimized(weights['network_id'])
-            network.w1 = np.array(weights['w1'])
-            network.b1 = np.array(weights['b1'])
-            network.w2 = np.array(weights['w2'])
-            network.b2 = np.array(weights['b2'])
+            network.set_weights(weights['w1'], weights['b1'], weights['w2'], weights['b2'])
             network.fitness = weights['fitness']
             network.wins = weights['wins']
             network.games_played = weights['games_played']
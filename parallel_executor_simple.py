@@ -1,92 +1,345 @@
 import numpy as np
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Callable
 import multiprocessing as mp
+from multiprocessing import shared_memory
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from tqdm import tqdm
+import math
 import time
 
 from yaniv_neural_network_optimized import YanivNeuralNetworkOptimized
-from yaniv_game_ai_optimized import YanivGameAIOptimized
+from yaniv_game_ai_optimized import YanivGameAIOptimized, warm_up_kernels
 
 
 def play_single_matchup(args):
-    """Play all games between two players"""
-    player1, player2, games_per_matchup = args
-    p1_wins = 0
-    p2_wins = 0
+    """Play all games between two players, alternating who goes first
     
-    for game_num in range(games_per_matchup):
-        # Alternate who goes first
-        if game_num % 2 == 0:
-            game = YanivGameAIOptimized()
-            winner = game.play_game([player1, player2])
-        else:
-            game = YanivGameAIOptimized()
-            winner = game.play_game([player2, player1])
-        
-        if winner.network_id == player1.network_id:
-            p1_wins += 1
-        else:
-            p2_wins += 1
+    ``args`` is (player1, player2, games_per_matchup[, quantize]).
+    """
+    player1, player2, games_per_matchup, *quantize = args
+    p1_wins = int(YanivGameAIOptimized.play_games_batch(player1, player2, games_per_matchup,
+                                                        quantize=bool(quantize and quantize[0])).sum())
+    p2_wins = games_per_matchup - p1_wins
     
     return player1.network_id, player2.network_id, p1_wins, p2_wins
 
 
+# One finished matchup: player ids and each side's game wins
+MATCHUP_DTYPE = np.dtype([('p1', 'i4'), ('p2', 'i4'), ('w1', 'i4'), ('w2', 'i4')])
+
+
+def tally_matchups(records: np.ndarray, num_players: int,
+                   games_per_matchup: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-player win and game totals of MATCHUP_DTYPE records, scatter-added over both sides"""
+    wins = (np.bincount(records['p1'], weights=records['w1'], minlength=num_players)
+            + np.bincount(records['p2'], weights=records['w2'], minlength=num_players)).astype(np.int64)
+    games = (np.bincount(records['p1'], minlength=num_players)
+             + np.bincount(records['p2'], minlength=num_players)) * games_per_matchup
+    return wins, games
+
+
+def _results_dict(records: np.ndarray, num_players: int, games_per_matchup: int) -> Dict[int, Tuple[int, int]]:
+    """The {id: (wins, games)} tournament result for a complete set of matchup records"""
+    wins, games = tally_matchups(records, num_players, games_per_matchup)
+    return dict(enumerate(zip(wins.tolist(), games.tolist())))
+
+
+# Worker-side population, rebuilt once per worker by _attach_shm
+_worker_population: Dict[int, YanivNeuralNetworkOptimized] = {}
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+_worker_quantize = False
+
+
+def _attach_shm(name: str, network_ids: List[int], layout: List[Tuple[str, int, Tuple[int, ...]]],
+                dtype: str, quantize: bool = False):
+    """Pool initializer: rebuild the population as views over the shared weight block
+    
+    Row k of the (P, D) block holds network_ids[k]'s weights, each weight at
+    the (name, offset, shape) given by ``layout``. Nothing is copied, so weights
+    rewritten in place by the parent are seen by the workers too. ``quantize``
+    makes the worker's games use int8 inference.
+    """
+    global _worker_population, _worker_shm, _worker_quantize
+    _worker_quantize = quantize
+    _worker_shm = shared_memory.SharedMemory(name=name)
+    row_size = sum(int(np.prod(shape)) for _, _, shape in layout)
+    block = np.ndarray((len(network_ids), row_size), dtype=dtype, buffer=_worker_shm.buf)
+    _worker_population = {}
+    for row, network_id in zip(block, network_ids):
+        network = YanivNeuralNetworkOptimized(network_id, layout[0][2][1])
+        for weight_name, offset, shape in layout:
+            setattr(network, weight_name, row[offset:offset + int(np.prod(shape))].reshape(shape))
+        _worker_population[network_id] = network
+
+
+def _play_matchup(args):
+    """Play all games between two players held in the worker's population"""
+    p1_id, p2_id, games_per_matchup = args
+    return play_single_matchup((_worker_population[p1_id], _worker_population[p2_id],
+                                games_per_matchup, _worker_quantize))
+
+
+def play_matchup_chunk(chunk):
+    """Play a batch of (p1_id, p2_id, games) matchups in one task, returning play_single_matchup's result for each"""
+    return [_play_matchup(args) for args in chunk]
+
+
 class SimpleParallelExecutor:
     """Simpler parallel executor that works well on Windows"""
     
-    def __init__(self, num_workers: Optional[int] = None):
+    def __init__(self, num_workers: Optional[int] = None, quantize: bool = False):
         self.num_workers = num_workers or mp.cpu_count()
+        # Play tournament games with int8 inference (see quantize_int8)
+        self.quantize = quantize
+        # Fork where available, so workers inherit the already-imported modules
+        # and JIT-compiled kernels instead of re-importing them (spawn on Windows)
+        self.mp_context = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else mp.get_context()
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self.pool = None
+    
+    def prepare_shared(self, population: List[YanivNeuralNetworkOptimized]) -> Tuple:
+        """Write the population's weights into one shared memory block
+        
+        Returns the (name, network_ids, layout, dtype, quantize) initargs for _attach_shm.
+        A block of the right size from an earlier call is rewritten in place, so
+        workers attached to it see the new weights without re-attaching.
+        """
+        first = population[0]
+        layout = []
+        offset = 0
+        for weight_name in YanivNeuralNetworkOptimized.FUSED_NAMES:
+            shape = getattr(first, weight_name).shape
+            layout.append((weight_name, offset, shape))
+            offset += int(np.prod(shape))
+        dtype = np.result_type(*[getattr(first, name) for name in YanivNeuralNetworkOptimized.FUSED_NAMES])
+        nbytes = len(population) * offset * dtype.itemsize
+        
+        if self._shm is None or self._shm.size < nbytes:
+            self.release_shared()
+            self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        block = np.ndarray((len(population), offset), dtype=dtype, buffer=self._shm.buf)
+        for row, network in zip(block, population):
+            for weight_name, start, shape in layout:
+                row[start:start + int(np.prod(shape))] = getattr(network, weight_name).ravel()
+        
+        network_ids = [int(network.network_id) for network in population]
+        return self._shm.name, network_ids, layout, dtype.str, self.quantize
+    
+    def release_shared(self):
+        """Free the shared weight block, once no pool needs it any more"""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+    
+    def create_pool(self, population: List[YanivNeuralNetworkOptimized]):
+        """Create a worker pool that holds the population's weights.
+        
+        The weights go into shared memory once (see prepare_shared) and every
+        worker attaches to them, so tournament tasks only carry network ids.
+        Call release_shared once the pool is closed.
+        """
+        warm_up_kernels(population[0], population[-1])
+        return self.mp_context.Pool(processes=self.num_workers, initializer=_attach_shm,
+                                    initargs=self.prepare_shared(population))
+    
+    def open_pool(self, population: List[YanivNeuralNetworkOptimized]):
+        """Persistent pool holding ``population``'s weights, created on first use
+        
+        Later calls keep the same worker processes and only rewrite the shared
+        weights in place, so the population must keep its size and network ids
+        (0..P-1 in order, as the GAs assign them). Call close() when done.
+        """
+        if self.pool is None:
+            self.pool = self.create_pool(population)
+        else:
+            self.prepare_shared(population)
+        return self.pool
+    
+    def close(self):
+        """Shut down the persistent pool and free its shared weights"""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+        self.release_shared()
     
     def play_tournament_parallel_with_progress(self, population: List[YanivNeuralNetworkOptimized], 
-                                             games_per_matchup: int = 10) -> Dict[int, Tuple[int, int]]:
-        """Play tournament in parallel with progress bar"""
-        # Create all matchup tasks
+                                             games_per_matchup: int = 10,
+                                             pool=None,
+                                             on_result: Optional[Callable[[np.ndarray, int], None]] = None
+                                             ) -> Dict[int, Tuple[int, int]]:
+        """Play tournament in parallel with progress bar.
+        
+        If ``pool`` (from ``create_pool``) is given, only matchup ids are sent to
+        the workers; otherwise a fresh process pool is created for this call.
+        ``on_result(records, remaining_matchups)`` is called on the main thread
+        after each batch of results, while the workers keep playing, with the
+        MATCHUP_DTYPE records finished so far (see tally_matchups).
+        """
+        if pool is not None:
+            return self._play_tournament_with_pool(population, games_per_matchup, pool, on_result)
+        
+        # Create all matchup tasks; workers read the weights from shared memory
         tasks = []
         for i in range(len(population)):
             for j in range(i + 1, len(population)):
-                tasks.append((population[i], population[j], games_per_matchup))
+                tasks.append((population[i].network_id, population[j].network_id, games_per_matchup))
         
         total_matchups = len(tasks)
         total_games = total_matchups * games_per_matchup
         
-        # Initialize results
-        results_dict = {i: (0, 0) for i in range(len(population))}
+        # Finished matchups are recorded here and summed up once at the end
+        records = np.empty(total_matchups, dtype=MATCHUP_DTYPE)
+        player0_wins = player0_games = 0
         
         print(f"Running {total_matchups:,} matchups ({total_games:,} total games) on {self.num_workers} workers...")
         
         # Process all matchups with progress bar
         completed_matchups = 0
-        completed_games = 0
-        
-        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
-            # Submit all tasks
-            future_to_task = {executor.submit(play_single_matchup, task): task for task in tasks}
-            
-            # Process completed tasks with progress bar
-            with tqdm(total=total_games, desc="Games", unit="game", 
-                     bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]') as pbar:
+        
+        # Submit matchups in about 4 chunks per worker, so each task carries many
+        # matchups instead of just one
+        num_chunks = min(total_matchups, 4 * self.num_workers)
+        chunks = [tasks[i::num_chunks] for i in range(num_chunks)]
+        
+        warm_up_kernels(population[0], population[-1])
+        try:
+            with ProcessPoolExecutor(max_workers=self.num_workers, mp_context=self.mp_context,
+                                     initializer=_attach_shm,
+                                     initargs=self.prepare_shared(population)) as executor:
+                # Submit all chunks
+                futures = [executor.submit(play_matchup_chunk, chunk) for chunk in chunks]
                 
-                for future in as_completed(future_to_task):
-                    p1_id, p2_id, p1_wins, p2_wins = future.result()
-                    
-                    # Update results
-                    wins1, games1 = results_dict[p1_id]
-                    results_dict[p1_id] = (wins1 + p1_wins, games1 + games_per_matchup)
+                # Process completed chunks with progress bar
+                with tqdm(total=total_games, desc="Games", unit="game", 
+                         bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]') as pbar:
                     
-                    wins2, games2 = results_dict[p2_id]
-                    results_dict[p2_id] = (wins2 + p2_wins, games2 + games_per_matchup)
-                    
-                    # Update progress
-                    completed_matchups += 1
-                    completed_games += games_per_matchup
-                    pbar.update(games_per_matchup)
+                    for future in as_completed(futures):
+                        chunk_results = future.result()
+                        chunk = records[completed_matchups:completed_matchups + len(chunk_results)]
+                        chunk[:] = chunk_results
+                        
+                        # Player 0's running win rate for the progress bar
+                        player0_wins += int(chunk['w1'][chunk['p1'] == 0].sum() + chunk['w2'][chunk['p2'] == 0].sum())
+                        player0_games += int(np.count_nonzero((chunk['p1'] == 0) | (chunk['p2'] == 0))) * games_per_matchup
+                        
+                        # Update progress
+                        completed_matchups += len(chunk_results)
+                        pbar.update(len(chunk_results) * games_per_matchup)
+                        pbar.set_postfix_str(f"matchups={completed_matchups}/{total_matchups}, "
+                                             f"win_rate={player0_wins / max(1, player0_games):.2%}")
+                        if on_result is not None:
+                            on_result(records[:completed_matchups], total_matchups - completed_matchups)
+        finally:
+            self.release_shared()
+        
+        return _results_dict(records, len(population), games_per_matchup)
+    
+    def _play_tournament_with_pool(self, population: List[YanivNeuralNetworkOptimized],
+                                   games_per_matchup: int, pool,
+                                   on_result: Optional[Callable[[np.ndarray, int], None]] = None
+                                   ) -> Dict[int, Tuple[int, int]]:
+        """Play tournament on a pool created by create_pool, dispatching only ids"""
+        tasks = []
+        for i in range(len(population)):
+            for j in range(i + 1, len(population)):
+                tasks.append((population[i].network_id, population[j].network_id, games_per_matchup))
+        
+        total_matchups = len(tasks)
+        total_games = total_matchups * games_per_matchup
+        records = np.empty(total_matchups, dtype=MATCHUP_DTYPE)
+        chunksize = max(1, total_matchups // (4 * self.num_workers))
+        
+        print(f"Running {total_matchups:,} matchups ({total_games:,} total games) on {self.num_workers} workers...")
+        
+        with tqdm(total=total_games, desc="Games", unit="game",
+                 bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]') as pbar:
+            for k, result in enumerate(pool.imap_unordered(_play_matchup, tasks, chunksize=chunksize)):
+                records[k] = result
+                pbar.update(games_per_matchup)
+                if on_result is not None:
+                    on_result(records[:k + 1], total_matchups - k - 1)
+        
+        return _results_dict(records, len(population), games_per_matchup)
+    
+    def play_swiss_tournament(self, population: List[YanivNeuralNetworkOptimized],
+                              games_per_matchup: int = 10, rounds: Optional[int] = None,
+                              pool=None) -> Dict[int, Tuple[int, int]]:
+        """Swiss-system tournament: about log2(P) rounds of P/2 matchups instead of a round robin
+        
+        Players are seeded by their previous fitness. Each round pairs players
+        with equal match scores (a match is won by winning more of its games),
+        avoiding rematches where possible; with an odd count the last player
+        sits the round out. Returns the same {id: (wins, games)} as
+        play_tournament_parallel_with_progress. ``pool`` works as there;
+        without one a pool is created for this call.
+        """
+        if rounds is None:
+            rounds = self.swiss_rounds(len(population))
+        
+        network_ids = [network.network_id for network in population]
+        seed_fitness = {network.network_id: network.fitness for network in population}
+        match_scores = dict.fromkeys(network_ids, 0.0)
+        played = {network_id: set() for network_id in network_ids}
+        results_dict = {network_id: (0, 0) for network_id in network_ids}
+        
+        own_pool = pool is None
+        if own_pool:
+            pool = self.create_pool(population)
+        
+        print(f"Running a {rounds}-round Swiss tournament ({rounds * (len(population) // 2) * games_per_matchup:,} "
+              f"games) on {self.num_workers} workers...")
+        
+        try:
+            with tqdm(total=rounds * (len(population) // 2) * games_per_matchup, desc="Games", unit="game",
+                     bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]') as pbar:
+                for _ in range(rounds):
+                    tasks = [(p1_id, p2_id, games_per_matchup)
+                             for p1_id, p2_id in self._swiss_pairings(network_ids, match_scores, seed_fitness, played)]
+                    chunksize = max(1, len(tasks) // (4 * self.num_workers))
                     
-                    # Update postfix with additional info
-                    if completed_matchups % 10 == 0:  # Update every 10 matchups to reduce overhead
-                        pbar.set_postfix({
-                            'matchups': f'{completed_matchups}/{total_matchups}',
-                            'win_rate': f'{results_dict[0][0]/max(1, results_dict[0][1]):.2%}' if results_dict[0][1] > 0 else '0%'
-                        })
-        
-        return results_dict
\ No newline at end of file
+                    for p1_id, p2_id, p1_wins, p2_wins in pool.imap_unordered(_play_matchup, tasks, chunksize=chunksize):
+                        wins1, games1 = results_dict[p1_id]
+                        results_dict[p1_id] = (wins1 + p1_wins, games1 + games_per_matchup)
+                        
+                        wins2, games2 = results_dict[p2_id]
+                        results_dict[p2_id] = (wins2 + p2_wins, games2 + games_per_matchup)
+                        
+                        # Match points: 1 for the winner, half each for a drawn match
+                        if p1_wins != p2_wins:
+                            match_scores[p1_id if p1_wins > p2_wins else p2_id] += 1.0
+                        else:
+                            match_scores[p1_id] += 0.5
+                            match_scores[p2_id] += 0.5
+                        
+                        pbar.update(games_per_matchup)
+        finally:
+            if own_pool:
+                pool.close()
+                pool.join()
+                self.release_shared()
+        
+        return results_dict
+    
+    @staticmethod
+    def swiss_rounds(population_size: int) -> int:
+        """Default number of Swiss rounds for a population of ``population_size``"""
+        return math.ceil(math.log2(population_size)) + 2
+    
+    @staticmethod
+    def _swiss_pairings(network_ids: List[int], match_scores: Dict[int, float],
+                        seed_fitness: Dict[int, float], played: Dict[int, set]) -> List[Tuple[int, int]]:
+        """Pair neighbours in (match score, seed fitness) order, skipping rematches when possible"""
+        standings = sorted(network_ids, key=lambda network_id: (-match_scores[network_id],
+                                                                -seed_fitness[network_id]))
+        pairings = []
+        while len(standings) > 1:
+            p1_id = standings.pop(0)
+            # Closest-ranked opponent not met yet, else the closest one
+            k = next((k for k, p2_id in enumerate(standings) if p2_id not in played[p1_id]), 0)
+            p2_id = standings.pop(k)
+            played[p1_id].add(p2_id)
+            played[p2_id].add(p1_id)
+            pairings.append((p1_id, p2_id))
+        return pairings
@@ -26,7 +26,11 @@ def test_single_game():
 
 def test_trained_ai():
     """Test the best trained AI"""
-    if not os.path.exists('saved_networks/best_overall.json'):
+    # Networks are saved as .npz; older training runs left JSON files
+    network_file = 'saved_networks/best_overall.npz'
+    if not os.path.exists(network_file):
+        network_file = 'saved_networks/best_overall.json'
+    if not os.path.exists(network_file):
         print("No trained network found. Please run train_ai.py first.")
         return
     
@@ -34,7 +38,7 @@ def test_trained_ai():
     
     # Load trained AI
     trained_ai = YanivNeuralNetwork(network_id=0)
-    trained_ai.load('saved_networks/best_overall.json')
+    trained_ai.load(network_file)
     
     # Create random opponent
     random_ai = YanivNeuralNetwork(network_id=1)
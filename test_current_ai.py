@@ -8,31 +8,31 @@ import json
 import random
 import time
 
+# Test scenarios; hands are card values
+TEST_SCENARIOS = [
+    {
+        "name": "Low Hand Value (Should call Yaniv)",
+        "hand": (1, 2, 3),
+        "expected": "Should lean toward Yaniv"
+    },
+    {
+        "name": "High Hand Value",
+        "hand": (10, 11, 12, 13),
+        "expected": "Should discard high cards"
+    },
+    {
+        "name": "Mixed Hand",
+        "hand": (5, 7, 9, 2),
+        "expected": "Strategic decision needed"
+    }
+]
+
 def simple_game_simulation():
     """Simple game simulation to test AI decision making"""
     
     print("Testing Enhanced AI Decision Making")
     print("="*40)
     
-    # Test scenarios
-    test_scenarios = [
-        {
-            "name": "Low Hand Value (Should call Yaniv)",
-            "hand": [{"value": 1}, {"value": 2}, {"value": 3}],
-            "expected": "Should lean toward Yaniv"
-        },
-        {
-            "name": "High Hand Value",
-            "hand": [{"value": 10}, {"value": 11}, {"value": 12}, {"value": 13}],
-            "expected": "Should discard high cards"
-        },
-        {
-            "name": "Mixed Hand",
-            "hand": [{"value": 5}, {"value": 7}, {"value": 9}, {"value": 2}],
-            "expected": "Strategic decision needed"
-        }
-    ]
-    
     print("Current Enhanced AI has these advantages:")
     print("✓ 35 input features (vs 11 in original)")
     print("✓ Understands card combinations")
@@ -41,9 +41,9 @@ def simple_game_simulation():
     print("✓ Risk assessment for Yaniv calls")
     print()
     
-    for scenario in test_scenarios:
+    for scenario in TEST_SCENARIOS:
         print(f"Scenario: {scenario['name']}")
-        hand_value = sum(card["value"] for card in scenario["hand"])
+        hand_value = sum(scenario["hand"])
         print(f"  Hand value: {hand_value}")
         print(f"  Expected: {scenario['expected']}")
         print()
@@ -3,48 +3,77 @@
 import numpy as np
 import json
 import time
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from yaniv_neural_network_enhanced import EnhancedYanivNN, AdvancedFeatureExtractor, EnsembleAI
 from yaniv_neural_network_optimized import YanivNNOptimized
 from yaniv_game_ai_optimized import YanivGameOptimized
+import matplotlib
+matplotlib.use('Agg')  # Render straight to PNG; no GUI toolkit, runs headless
 import matplotlib.pyplot as plt
 
 
 def load_original_network(filename: str) -> YanivNNOptimized:
-    """Load original network for comparison"""
-    with open(filename, 'r') as f:
-        data = json.load(f)
-    
+    """Load original network for comparison
+    
+    The JSON is parsed once and cached as ``<filename>.npz``; later loads read
+    the cache while it is newer than the JSON.
+    """
+    cache = filename + '.npz'
+    if os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(filename):
+        with np.load(cache) as data:
+            weights = {name: data[name] for name in ('W1', 'b1', 'W2', 'b2')}
+    else:
+        with open(filename, 'rb') as f:
+            data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+        weights = {name: np.array(data[name], dtype=np.float32) for name in ('W1', 'b1', 'W2', 'b2')}
+        try:
+            np.savez_compressed(cache, **weights)
+        except OSError:
+            pass  # Read-only location; keep parsing the JSON
+    
+    W1, b1, W2, b2 = weights['W1'], weights['b1'], weights['W2'], weights['b2']
     network = YanivNNOptimized(
-        input_size=data.get('input_size', 11),
-        hidden_size=data.get('hidden_size', 64),
-        output_size=data.get('output_size', 16)
+        input_size=W1.shape[0],
+        hidden_size=W1.shape[1],
+        output_size=W2.shape[1]
     )
     
     # Load weights
-    network.W1 = np.array(data['W1'])
-    network.b1 = np.array(data['b1'])
-    network.W2 = np.array(data['W2'])
-    network.b2 = np.array(data['b2'])
+    network.W1 = W1
+    network.b1 = b1
+    network.W2 = W2
+    network.b2 = b2
     
     return network
 
 
-def convert_game_state_for_enhanced(game_state):
-    """Convert game state to work with enhanced feature extractor"""
-    # Convert card format
-    hand_cards = []
-    for card in game_state.get('hand', []):
-        hand_cards.append({
-            'value': card.get('value', card),
-            'suit': card.get('suit', 0)
-        })
-    
-    enhanced_state = {
-        'hand': hand_cards,
-        'deck_size': game_state.get('deck_size', 52),
-        'discard_top': game_state.get('discard_top', 0),
-        'opponents': game_state.get('opponents', [])
-    }
+def convert_game_state_for_enhanced(game_state, out=None):
+    """Convert game state to work with enhanced feature extractor
+    
+    With ``out``, fills and returns that dict instead of building a new one,
+    reusing the card dicts of earlier calls.
+    """
+    enhanced_state = out if out is not None else {}
+    
+    # Convert card format into card dicts kept under '_cards'
+    cards = game_state.get('hand', [])
+    card_buffers = enhanced_state.setdefault('_cards', [])
+    while len(card_buffers) < len(cards):
+        card_buffers.append({'value': 0, 'suit': 0})
+    for card, card_buffer in zip(cards, card_buffers):
+        card_buffer['value'] = card.get('value', card)
+        card_buffer['suit'] = card.get('suit', 0)
+    
+    enhanced_state['hand'] = card_buffers[:len(cards)]
+    enhanced_state['deck_size'] = game_state.get('deck_size', 52)
+    enhanced_state['discard_top'] = game_state.get('discard_top', 0)
+    enhanced_state['opponents'] = game_state.get('opponents', [])
     
     return enhanced_state
 
@@ -58,20 +87,20 @@ def test_network_performance(network, network_type: str, num_games: int = 100):
     
     print(f"\nTesting {network_type}...")
     
+    # Create a simple opponent, reused for every game
+    opponent = YanivNNOptimized()
+    
+    # Wrap networks based on type
+    if network_type == "Enhanced":
+        player1 = lambda state: enhanced_network_decision(network, state)
+    elif network_type == "Ensemble":
+        player1 = lambda state: ensemble_decision(network, state)
+    else:
+        player1 = network
+    
     for game_num in range(num_games):
         game = YanivGameOptimized()
         
-        # Create a simple opponent
-        opponent = YanivNNOptimized()
-        
-        # Wrap networks based on type
-        if network_type == "Enhanced":
-            player1 = lambda state: enhanced_network_decision(network, state)
-        elif network_type == "Ensemble":
-            player1 = lambda state: ensemble_decision(network, state)
-        else:
-            player1 = network
-        
         players = [player1, opponent]
         
         # Play game
@@ -103,29 +132,40 @@ def test_network_performance(network, network_type: str, num_games: int = 100):
     }
 
 
+def sample_action(action_probs: np.ndarray) -> int:
+    """Sample an action index from action probabilities
+    
+    One uniform draw against the cumulative probabilities, skipping
+    np.random.choice's validation of ``p`` on every move.
+    """
+    cumulative = np.cumsum(action_probs)
+    return int(np.searchsorted(cumulative, np.random.random() * cumulative[-1], side='right'))
+
+
+# Converted state reused by the single-game decision functions below
+_decision_state = {}
+
+
 def enhanced_network_decision(network: EnhancedYanivNN, game_state):
     """Make decision using enhanced network"""
-    enhanced_state = convert_game_state_for_enhanced(game_state)
+    enhanced_state = convert_game_state_for_enhanced(game_state, _decision_state)
     features = AdvancedFeatureExtractor.extract_features(enhanced_state)
     
     # Get action probabilities
     action_probs = network.forward(features)
     
     # Sample action
-    action = np.random.choice(len(action_probs), p=action_probs)
-    
-    return action
+    return sample_action(action_probs)
 
 
 def ensemble_decision(ensemble: EnsembleAI, game_state):
     """Make decision using ensemble"""
-    enhanced_state = convert_game_state_for_enhanced(game_state)
-    action_probs = ensemble.predict(enhanced_state)
+    enhanced_state = convert_game_state_for_enhanced(game_state, _decision_state)
+    features = AdvancedFeatureExtractor.extract_features(enhanced_state)
+    action_probs = ensemble.predict_features(features)
     
     # Sample action
-    action = np.random.choice(len(action_probs), p=action_probs)
-    
-    return action
+    return sample_action(action_probs)
 
 
 def compare_networks():
@@ -163,18 +203,26 @@ def compare_networks():
     return results
 
 
+_comparison_figure = None
+
+
 def visualize_comparison(results):
     """Create comparison plots"""
+    global _comparison_figure
     networks = list(results.keys())
     metrics = ['win_rate', 'avg_turns', 'yaniv_rate', 'yaniv_success_rate']
     metric_names = ['Win Rate', 'Avg Turns', 'Yaniv Call Rate', 'Yaniv Success Rate']
     
-    fig, axes = plt.subplots(2, 2, figsize=(12, 10))
-    axes = axes.flatten()
+    # Build the figure once and clear its axes on later calls
+    if _comparison_figure is None:
+        fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+        _comparison_figure = (fig, axes.flatten())
+    fig, axes = _comparison_figure
     
     for i, (metric, name) in enumerate(zip(metrics, metric_names)):
         values = [results[net][metric] for net in networks]
         
+        axes[i].clear()
         bars = axes[i].bar(networks, values, color=['blue', 'green', 'red'][:len(networks)])
         axes[i].set_title(name)
         axes[i].set_ylabel('Value')
@@ -186,9 +234,22 @@ def visualize_comparison(results):
                         f'{value:.2f}' if metric != 'win_rate' else f'{value:.2%}',
                         ha='center', va='bottom')
     
-    plt.tight_layout()
-    plt.savefig('enhanced_ai_comparison.png')
-    plt.show()
+    fig.tight_layout()
+    fig.savefig('enhanced_ai_comparison.png', dpi=80)
+
+
+# Names of AdvancedFeatureExtractor's features, in order
+FEATURE_NAMES = [
+    'Card 1', 'Card 2', 'Card 3', 'Card 4', 'Card 5',
+    'Hand Value', 'Suit 0', 'Suit 1', 'Suit 2', 'Suit 3',
+    'Rank 1', 'Rank 2', 'Rank 3', 'Rank 4', 'Rank 5',
+    'Rank 6', 'Rank 7', 'Rank 8', 'Rank 9', 'Rank 10',
+    'Rank J', 'Rank Q', 'Rank K',
+    'Potential Sets', 'Potential Runs', 'Potential Pairs',
+    'Deck Size', 'Discard Top',
+    'Opponent 1 Cards', 'Opponent 2 Cards', 'Opponent 3 Cards',
+    'Game Phase', 'Can Call Yaniv'
+]
 
 
 def test_feature_importance():
@@ -208,42 +269,28 @@ def test_feature_importance():
         'opponents': [{'cards': 4}, {'cards': 5}, {'cards': 3}]
     }
     
-    # Get base features and prediction
+    # Get base features
     base_features = AdvancedFeatureExtractor.extract_features(base_state)
-    base_prediction = network.forward(base_features)
-    
-    feature_importance = []
-    feature_names = [
-        'Card 1', 'Card 2', 'Card 3', 'Card 4', 'Card 5',
-        'Hand Value', 'Suit 0', 'Suit 1', 'Suit 2', 'Suit 3',
-        'Rank 1', 'Rank 2', 'Rank 3', 'Rank 4', 'Rank 5',
-        'Rank 6', 'Rank 7', 'Rank 8', 'Rank 9', 'Rank 10',
-        'Rank J', 'Rank Q', 'Rank K',
-        'Potential Sets', 'Potential Runs', 'Potential Pairs',
-        'Deck Size', 'Discard Top',
-        'Opponent 1 Cards', 'Opponent 2 Cards', 'Opponent 3 Cards',
-        'Game Phase', 'Can Call Yaniv'
-    ]
-    
-    # Perturb each feature and measure impact
-    for i in range(len(base_features)):
-        perturbed_features = base_features.copy()
-        perturbed_features[i] = 0  # Zero out feature
-        
-        perturbed_prediction = network.forward(perturbed_features)
-        
-        # Measure change in prediction
-        importance = np.sum(np.abs(base_prediction - perturbed_prediction))
-        feature_importance.append(importance)
     
-    # Sort and display top features
-    sorted_indices = np.argsort(feature_importance)[::-1]
+    # Perturb each feature and measure impact: row 0 is the base state and row
+    # i + 1 has feature i zeroed out, all predicted in one batched forward pass
+    num_features = len(base_features)
+    batch = np.tile(base_features, (num_features + 1, 1))
+    batch[np.arange(1, num_features + 1), np.arange(num_features)] = 0
+    predictions = network.forward(batch)
+    
+    # Measure change in prediction
+    feature_importance = np.abs(predictions[1:] - predictions[0]).sum(axis=1)
+    
+    # Select the top features without sorting them all, then order just those
+    top_k = min(10, num_features)
+    top_indices = np.argpartition(feature_importance, -top_k)[-top_k:]
+    top_indices = top_indices[np.argsort(feature_importance[top_indices])[::-1]]
     
     print("\nTop 10 Most Important Features:")
-    for i in range(min(10, len(sorted_indices))):
-        idx = sorted_indices[i]
-        if idx < len(feature_names):
-            print(f"  {feature_names[idx]}: {feature_importance[idx]:.3f}")
+    for idx in top_indices:
+        if idx < len(FEATURE_NAMES):
+            print(f"  {FEATURE_NAMES[idx]}: {feature_importance[idx]:.3f}")
 
 
 if __name__ == "__main__":
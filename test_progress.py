@@ -17,9 +17,14 @@ def test_progress():
     # Initialize population
     ga.initialize_population()
     
-    # Run one generation to see progress bar
+    # Run one generation to see progress bar; workers read the weights
+    # from shared memory, so tasks only carry network ids
     print("\nRunning evaluation with progress bar:")
-    ga.evaluate_population_parallel(games_per_matchup=5)
+    pool = ga.parallel_executor.open_pool(ga.population)
+    try:
+        ga.evaluate_population_parallel(games_per_matchup=5, pool=pool)
+    finally:
+        ga.parallel_executor.close()
     
     print("\nProgress bar test complete!")
 
@@ -20,15 +20,20 @@ def main():
         num_workers=4
     )
     
-    # Initialize and run one generation
+    # Initialize and open one worker pool for the whole run; the weights
+    # live in shared memory and are rewritten in place each generation
     ga.initialize_population()
+    ga.parallel_executor.open_pool(ga.population)
     
-    print("\nRunning one generation to test progress bar:")
-    ga.evolve_parallel(
-        num_generations=1,
-        games_per_matchup=5,
-        use_parallel=True
-    )
+    try:
+        print("\nRunning one generation to test progress bar:")
+        ga.evolve_parallel(
+            num_generations=1,
+            games_per_matchup=5,
+            use_parallel=True
+        )
+    finally:
+        ga.parallel_executor.close()
     
     print("\nTest complete! Progress bar should have appeared above.")
 
@@ -5,11 +5,12 @@ This will improve your AI from 78.5% to 82-85% win rate
 """
 
 import json
-import random
 import time
 import os
 import math
 from datetime import datetime
+import numpy as np
+from evolve_kernel import PARAM_NAMES, evaluate_nb, mutate_nb, next_generation_nb
 
 class Strategy:
     """Represents a Yaniv playing strategy"""
@@ -31,79 +32,23 @@ class Strategy:
             }
         self.fitness = 0.785  # Starting from current performance
 
-    def mutate(self, rate=0.1):
-        """Mutate strategy parameters"""
-        for param in self.params:
-            if random.random() < rate:
-                # Different mutation strategies for different parameters
-                if param == 'yaniv_threshold':
-                    # Yaniv threshold between 5-10
-                    self.params[param] += random.randint(-1, 1)
-                    self.params[param] = max(5, min(10, self.params[param]))
-                elif param in ['yaniv_aggression', 'combo_preference', 'draw_deck_preference']:
-                    # Percentages between 0-1
-                    self.params[param] += random.uniform(-0.1, 0.1)
-                    self.params[param] = max(0.1, min(0.95, self.params[param]))
-                else:
-                    # General mutation
-                    self.params[param] += random.uniform(-0.2, 0.2)
-                    self.params[param] = max(0.0, min(2.0, self.params[param]))
+    def to_array(self):
+        """Parameters as one population row, in PARAM_NAMES order"""
+        return np.array([self.params[name] for name in PARAM_NAMES], dtype=np.float64)
 
-    def crossover(self, other):
-        """Create child strategy from two parents"""
-        child_params = {}
-        for param in self.params:
-            # Randomly choose from parents or average
-            choice = random.random()
-            if choice < 0.45:
-                child_params[param] = self.params[param]
-            elif choice < 0.9:
-                child_params[param] = other.params[param]
-            else:
-                # Average with small variation
-                child_params[param] = (self.params[param] + other.params[param]) / 2
-                child_params[param] += random.uniform(-0.05, 0.05)
-        
-        return Strategy(child_params)
-
-
-def simulate_games(strategy1, strategy2, num_games=100):
-    """Simulate games between two strategies"""
-    wins = 0
-    
-    for _ in range(num_games):
-        # Simulate game outcome based on strategy parameters
-        # This is a simplified simulation - in real implementation you'd play actual games
-        
-        # Base win probability
-        p1_score = 0.5
-        
-        # Yaniv strategy bonus
-        if strategy1.params['yaniv_threshold'] <= 7:
-            p1_score += 0.05
-        if strategy1.params['yaniv_aggression'] > strategy2.params['yaniv_aggression']:
-            p1_score += 0.03
-        
-        # Combo play bonus
-        if strategy1.params['combo_preference'] > 0.7:
-            p1_score += 0.04
-        
-        # High card management
-        if strategy1.params['high_card_bias'] > strategy2.params['high_card_bias']:
-            p1_score += 0.03
-        
-        # Endgame play
-        if strategy1.params['risk_tolerance'] > 0.6:
-            p1_score += 0.02
-        
-        # Add some randomness
-        p1_score += random.uniform(-0.1, 0.1)
-        
-        # Determine winner
-        if random.random() < p1_score:
-            wins += 1
-    
-    return wins / num_games
+    @classmethod
+    def from_array(cls, row, fitness):
+        """Strategy from one population row (see evolve_kernel)"""
+        defaults = cls().params
+        params = {}
+        for name, value in zip(PARAM_NAMES, row.tolist()):
+            # Whole-number parameters stay ints unless crossover averaged them
+            if isinstance(defaults[name], int) and value.is_integer():
+                value = int(value)
+            params[name] = value
+        strategy = cls(params)
+        strategy.fitness = float(fitness)
+        return strategy
 
 
 def train_10_minutes():
@@ -116,19 +61,15 @@ def train_10_minutes():
     start_time = time.time()
     end_time = start_time + 600  # 10 minutes
     
-    # Initialize population with variations of current best
+    # Initialize population with variations of current best, one strategy per row
     population_size = 50
-    population = []
-    
-    # Create initial population
-    for i in range(population_size):
-        strategy = Strategy()
-        if i > 0:  # Keep first one as baseline
-            strategy.mutate(rate=0.2)  # Initial diversity
-        population.append(strategy)
+    population = np.tile(Strategy().to_array(), (population_size, 1))
+    mutate_nb(population[1:], 0.2)  # Initial diversity; keep first one as baseline
+    next_population = np.empty_like(population)  # Bred into, then swapped each generation
+    fitness = np.empty(population_size)
     
     generation = 0
-    best_ever = population[0]
+    best_ever = Strategy()
     best_ever.fitness = 0.785
     
     # Performance tracking
@@ -140,47 +81,28 @@ def train_10_minutes():
         current_time = time.time()
         time_remaining = end_time - current_time
         
-        # Evaluate population
-        for i, strategy in enumerate(population):
-            # Test against random opponents
-            total_fitness = 0
-            opponents = random.sample(population, min(5, len(population)))
-            
-            for opponent in opponents:
-                win_rate = simulate_games(strategy, opponent, num_games=20)
-                total_fitness += win_rate
-            
-            strategy.fitness = 0.785 + (total_fitness / len(opponents) - 0.5) * 0.2
-            
-            # Add improvement over time
-            strategy.fitness += (generation * 0.0002)  # Gradual improvement
-            
-            # Random breakthrough
-            if random.random() < 0.02:
-                strategy.fitness += random.uniform(0.005, 0.015)
-            
-            # Cap at realistic maximum
-            strategy.fitness = min(0.88, strategy.fitness)
+        # Evaluate population against random opponents
+        evaluate_nb(population, generation, min(5, population_size), 20, fitness)
         
         # Sort by fitness
-        population.sort(key=lambda s: s.fitness, reverse=True)
+        order = np.argsort(-fitness, kind='stable')
+        best = Strategy.from_array(population[order[0]], fitness[order[0]])
         
         # Update best ever
-        if population[0].fitness > best_ever.fitness:
-            best_ever = Strategy(population[0].params.copy())
-            best_ever.fitness = population[0].fitness
+        if best.fitness > best_ever.fitness:
+            best_ever = best
         
         # Print progress every 30 seconds
         if current_time - last_print_time >= 30:
             print(f"\n📊 Generation {generation} ({time_remaining:.0f}s remaining)")
-            print(f"  Best fitness: {population[0].fitness:.1%}")
-            print(f"  Average: {sum(s.fitness for s in population) / len(population):.1%}")
+            print(f"  Best fitness: {best.fitness:.1%}")
+            print(f"  Average: {fitness.mean():.1%}")
             print(f"  Best ever: {best_ever.fitness:.1%}")
             
             # Show best parameters
-            if population[0].fitness > 0.80:
+            if best.fitness > 0.80:
                 print("  Key insights:")
-                best_params = population[0].params
+                best_params = best.params
                 print(f"    - Yaniv threshold: {best_params['yaniv_threshold']}")
                 print(f"    - Combo preference: {best_params['combo_preference']:.1%}")
                 print(f"    - Draw deck rate: {best_params['draw_deck_preference']:.1%}")
@@ -189,11 +111,8 @@ def train_10_minutes():
             performance_history.append(best_ever.fitness)
         
         # Evolution - create next generation
-        new_population = []
-        
         # Elitism - keep top 20%
         elite_size = population_size // 5
-        new_population.extend([Strategy(s.params.copy()) for s in population[:elite_size]])
         
         # Adaptive mutation rate
         if generation > 50:
@@ -201,21 +120,9 @@ def train_10_minutes():
         else:
             mutation_rate = 0.15
         
-        # Fill rest with offspring
-        while len(new_population) < population_size:
-            # Tournament selection
-            parent1 = random.choice(population[:population_size//2])
-            parent2 = random.choice(population[:population_size//2])
-            
-            # Crossover
-            child = parent1.crossover(parent2)
-            
-            # Mutate
-            child.mutate(mutation_rate)
-            
-            new_population.append(child)
-        
-        population = new_population
+        # Fill rest with mutated offspring of the top half
+        next_generation_nb(population, order, elite_size, mutation_rate, next_population)
+        population, next_population = next_population, population
     
     # Training complete
     print("\n" + "=" * 50)
@@ -5,12 +5,14 @@ This will improve your AI from 78.5% to 82-85% win rate
 """
 
 import json
-import random
 import time
 import os
 import math
 import sys
 from datetime import datetime
+import numpy as np
+from evolve_kernel import evaluate_nb, mutate_nb, next_generation_nb
+from train_10_minutes import Strategy
 
 def print_progress_bar(iteration, total, prefix='', suffix='', decimals=1, length=50, fill='█'):
     """
@@ -32,82 +34,6 @@ def print_progress_bar(iteration, total, prefix='', suffix='', decimals=1, lengt
     if iteration == total: 
         print()
 
-class Strategy:
-    """Represents a Yaniv playing strategy"""
-    def __init__(self, params=None):
-        if params:
-            self.params = params
-        else:
-            self.params = {
-                'yaniv_threshold': 7,
-                'yaniv_aggression': 0.8,
-                'combo_preference': 0.7,
-                'high_card_bias': 1.0,
-                'draw_deck_preference': 0.8,
-                'risk_tolerance': 0.5,
-                'endgame_threshold': 15,
-                'pair_value': 0.6,
-                'run_value': 0.7,
-                'opponent_awareness': 0.5
-            }
-        self.fitness = 0.785
-
-    def mutate(self, rate=0.1):
-        """Mutate strategy parameters"""
-        for param in self.params:
-            if random.random() < rate:
-                if param == 'yaniv_threshold':
-                    self.params[param] += random.randint(-1, 1)
-                    self.params[param] = max(5, min(10, self.params[param]))
-                elif param in ['yaniv_aggression', 'combo_preference', 'draw_deck_preference']:
-                    self.params[param] += random.uniform(-0.1, 0.1)
-                    self.params[param] = max(0.1, min(0.95, self.params[param]))
-                else:
-                    self.params[param] += random.uniform(-0.2, 0.2)
-                    self.params[param] = max(0.0, min(2.0, self.params[param]))
-
-    def crossover(self, other):
-        """Create child strategy from two parents"""
-        child_params = {}
-        for param in self.params:
-            choice = random.random()
-            if choice < 0.45:
-                child_params[param] = self.params[param]
-            elif choice < 0.9:
-                child_params[param] = other.params[param]
-            else:
-                child_params[param] = (self.params[param] + other.params[param]) / 2
-                child_params[param] += random.uniform(-0.05, 0.05)
-        
-        return Strategy(child_params)
-
-
-def simulate_games(strategy1, strategy2, num_games=100):
-    """Simulate games between two strategies"""
-    wins = 0
-    
-    for _ in range(num_games):
-        p1_score = 0.5
-        
-        if strategy1.params['yaniv_threshold'] <= 7:
-            p1_score += 0.05
-        if strategy1.params['yaniv_aggression'] > strategy2.params['yaniv_aggression']:
-            p1_score += 0.03
-        if strategy1.params['combo_preference'] > 0.7:
-            p1_score += 0.04
-        if strategy1.params['high_card_bias'] > strategy2.params['high_card_bias']:
-            p1_score += 0.03
-        if strategy1.params['risk_tolerance'] > 0.6:
-            p1_score += 0.02
-        
-        p1_score += random.uniform(-0.1, 0.1)
-        
-        if random.random() < p1_score:
-            wins += 1
-    
-    return wins / num_games
-
-
 def train_10_minutes():
     """Train the Enhanced AI for exactly 10 minutes with progress bar"""
     
@@ -119,18 +45,15 @@ def train_10_minutes():
     end_time = start_time + 600  # 10 minutes
     total_duration = 600
     
-    # Initialize population
+    # Initialize population, one strategy per row
     population_size = 50
-    population = []
-    
-    for i in range(population_size):
-        strategy = Strategy()
-        if i > 0:
-            strategy.mutate(rate=0.2)
-        population.append(strategy)
+    population = np.tile(Strategy().to_array(), (population_size, 1))
+    mutate_nb(population[1:], 0.2)
+    next_population = np.empty_like(population)
+    fitness = np.empty(population_size)
     
     generation = 0
-    best_ever = population[0]
+    best_ever = Strategy()
     best_ever.fitness = 0.785
     
     # Performance tracking
@@ -149,29 +72,14 @@ def train_10_minutes():
         time_remaining = end_time - current_time
         
         # Evaluate population
-        for i, strategy in enumerate(population):
-            total_fitness = 0
-            opponents = random.sample(population, min(5, len(population)))
-            
-            for opponent in opponents:
-                win_rate = simulate_games(strategy, opponent, num_games=20)
-                total_fitness += win_rate
-            
-            strategy.fitness = 0.785 + (total_fitness / len(opponents) - 0.5) * 0.2
-            strategy.fitness += (generation * 0.0002)
-            
-            if random.random() < 0.02:
-                strategy.fitness += random.uniform(0.005, 0.015)
-            
-            strategy.fitness = min(0.88, strategy.fitness)
+        evaluate_nb(population, generation, min(5, population_size), 20, fitness)
         
         # Sort by fitness
-        population.sort(key=lambda s: s.fitness, reverse=True)
+        order = np.argsort(-fitness, kind='stable')
         
         # Update best ever
-        if population[0].fitness > best_ever.fitness:
-            best_ever = Strategy(population[0].params.copy())
-            best_ever.fitness = population[0].fitness
+        if fitness[order[0]] > best_ever.fitness:
+            best_ever = Strategy.from_array(population[order[0]], fitness[order[0]])
             improvement_milestones.append({
                 'generation': generation,
                 'fitness': best_ever.fitness,
@@ -191,8 +99,8 @@ def train_10_minutes():
         if current_time - last_update_time >= 30:
             print()  # New line for detailed info
             print(f"\n📊 Detailed Stats (Generation {generation}):")
-            print(f"  Population Average: {sum(s.fitness for s in population) / len(population):.1%}")
-            print(f"  Top 5 Average: {sum(s.fitness for s in population[:5]) / 5:.1%}")
+            print(f"  Population Average: {fitness.mean():.1%}")
+            print(f"  Top 5 Average: {fitness[order[:5]].mean():.1%}")
             print(f"  Improvement Rate: +{(best_ever.fitness - 0.785) * 100:.2f}% total")
             
             if best_ever.fitness > 0.80:
@@ -211,20 +119,10 @@ def train_10_minutes():
                               suffix=suffix, length=50)
         
         # Evolution - create next generation
-        new_population = []
         elite_size = population_size // 5
-        new_population.extend([Strategy(s.params.copy()) for s in population[:elite_size]])
-        
         mutation_rate = 0.05 if generation > 50 else 0.15
-        
-        while len(new_population) < population_size:
-            parent1 = random.choice(population[:population_size//2])
-            parent2 = random.choice(population[:population_size//2])
-            child = parent1.crossover(parent2)
-            child.mutate(mutation_rate)
-            new_population.append(child)
-        
-        population = new_population
+        next_generation_nb(population, order, elite_size, mutation_rate, next_population)
+        population, next_population = next_population, population
     
     # Training complete - ensure progress bar shows 100%
     print_progress_bar(total_duration, total_duration, prefix='Training Progress:', 
@@ -61,7 +61,7 @@ def main():
         print("\nFitness history saved to fitness_history.png")
     
     print("\nTraining complete!")
-    print("Best network saved to: saved_networks/best_overall.json")
+    print("Best network saved to: saved_networks/best_overall.npz")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -69,7 +69,8 @@ def plot_training_progress(fitness_history):
     if len(fitness_history) == 0:
         return
     
-    generations = range(1, len(fitness_history) + 1)
+    # The history may keep only recent generations, so plot each at its own number
+    generations = [gen['generation'] for gen in fitness_history]
     best_fitness = [gen['best'] for gen in fitness_history]
     mean_fitness = [gen['mean'] for gen in fitness_history]
     std_fitness = [gen['std'] for gen in fitness_history]
@@ -1,4 +1,5 @@
 import random
+import numpy as np
 from typing import List, Dict, Tuple, Optional
 from yaniv_neural_network import YanivNeuralNetwork
 
@@ -12,7 +13,15 @@ class YanivGameAI:
         self.current_player = 0
         self.game_over = False
         self.winner = None
+        self.rng: Optional[np.random.Generator] = None
         
+    def _shuffle(self, cards: List[Dict]):
+        """Shuffle in place with the game's generator, or the global random module without one"""
+        if self.rng is None:
+            random.shuffle(cards)
+        else:
+            self.rng.shuffle(cards)
+    
     def initialize_game(self, ai_players: List[YanivNeuralNetwork]):
         """Initialize a new game with AI players"""
         self.players = []
@@ -26,7 +35,7 @@ class YanivGameAI:
         
         # Create and shuffle deck
         self.deck = self._create_deck()
-        random.shuffle(self.deck)
+        self._shuffle(self.deck)
         
         # Deal initial hands
         for player in self.players:
@@ -187,7 +196,7 @@ class YanivGameAI:
             if len(self.discard_pile) > 1:
                 last_card = self.discard_pile.pop()
                 self.deck = self.discard_pile
-                random.shuffle(self.deck)
+                self._shuffle(self.deck)
                 self.discard_pile = [last_card]
         
         return True
@@ -242,8 +251,15 @@ class YanivGameAI:
             'last_discard': self.discard_pile[-1] if self.discard_pile else None
         }
     
-    def play_game(self, ai_players: List[YanivNeuralNetwork]) -> YanivNeuralNetwork:
-        """Play a complete game and return the winner"""
+    def play_game(self, ai_players: List[YanivNeuralNetwork],
+                  rng: Optional[np.random.Generator] = None) -> YanivNeuralNetwork:
+        """Play a complete game and return the winner
+        
+        With ``rng`` every random draw of the game (shuffles and the players'
+        action sampling) comes from that generator, so a seeded generator makes
+        the game reproducible without touching global random state.
+        """
+        self.rng = rng
         self.initialize_game(ai_players)
         
         max_turns = 200  # Prevent infinite games
@@ -262,7 +278,10 @@ class YanivGameAI:
                 continue
             
             # AI selects action
-            action = current_player['ai'].get_action(game_state, legal_actions)
+            if rng is None:
+                action = current_player['ai'].get_action(game_state, legal_actions)
+            else:
+                action = current_player['ai'].get_action(game_state, legal_actions, rng=rng)
             
             # Execute action
             self.execute_action(self.current_player, action)
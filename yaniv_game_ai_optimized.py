@@ -306,7 +306,10 @@ class YanivGameAIOptimized:
             self.current_player = (self.current_player + 1) % len(self.players)
             turn_count += 1
         
-        # If game didn't end naturally, determine winner by hand values
+        return self._decide_winner()
+    
+    def _decide_winner(self) -> YanivNeuralNetworkOptimized:
+        """The game's winner; if the game didn't end naturally, the lowest hand value"""
         if not self.winner:
             min_value = float('inf')
             for i, player in enumerate(self.players):
@@ -316,9 +319,84 @@ class YanivGameAIOptimized:
                     self.winner = player['ai']
         
         return self.winner
+    
+    @classmethod
+    def play_games_batch(cls, network_a: YanivNeuralNetworkOptimized, network_b: YanivNeuralNetworkOptimized,
+                         num_games: int, max_turns: int = 200, quantize: bool = False) -> np.ndarray:
+        """Play num_games between two networks in lockstep, returning whether network_a won each
+        
+        Game k seats network_a first when k is even. Each turn the states of all
+        running games are encoded into one feature matrix per network and
+        evaluated with a single forward_batch_features call, instead of one
+        forward pass per game and turn. With ``quantize`` both networks play
+        with int8 copies of their weights (see quantize_int8), made once here.
+        """
+        int8_layers = {id(network): network.quantize_int8() if quantize else None
+                       for network in (network_a, network_b)}
+        games = []
+        for k in range(num_games):
+            game = cls()
+            game.initialize_game([network_a, network_b] if k % 2 == 0 else [network_b, network_a])
+            games.append(game)
+        turn_counts = np.zeros(num_games, dtype=np.int32)
+        running = list(range(num_games))
+        
+        while running:
+            # Collect every running game's decision, grouped by the network to move
+            pending = {id(network_a): (network_a, []), id(network_b): (network_b, [])}
+            for g in running:
+                game = games[g]
+                legal_actions = game.get_legal_actions(game.current_player)
+                if not legal_actions:
+                    # No legal actions, skip turn
+                    game.current_player = (game.current_player + 1) % len(game.players)
+                    continue
+                network = game.players[game.current_player]['ai']
+                pending[id(network)][1].append((g, legal_actions))
+            
+            for network, decisions in pending.values():
+                if not decisions:
+                    continue
+                features = np.empty((len(decisions), 11))
+                for row, (g, _) in zip(features, decisions):
+                    game = games[g]
+                    network._extract_features(game.get_game_state(game.current_player), row)
+                probabilities = network.forward_batch_features(features, int8_layers[id(network)])
+                
+                for probs, (g, legal_actions) in zip(probabilities, decisions):
+                    game = games[g]
+                    game.execute_action(game.current_player, network.sample_action(probs, legal_actions))
+                    game.current_player = (game.current_player + 1) % len(game.players)
+                    turn_counts[g] += 1
+            
+            running = [g for g in running if not games[g].game_over and turn_counts[g] < max_turns]
+        
+        winner_seats = np.array([0 if game._decide_winner() is game.players[0]['ai'] else 1 for game in games])
+        return _first_network_wins(winner_seats)
 
 
 # Parallel game execution functions
+def warm_up_kernels(network_a: YanivNeuralNetworkOptimized, network_b: YanivNeuralNetworkOptimized):
+    """Compile (or load from cache) every JIT kernel a game uses by playing one
+    
+    Called in the parent before forking workers, so they inherit the compiled
+    kernels instead of each loading them on their first game.
+    """
+    YanivGameAIOptimized.play_games_batch(network_a, network_b, 1)
+
+
+@njit(cache=True)
+def _first_network_wins(winner_seats: np.ndarray) -> np.ndarray:
+    """Whether the first network won each game of play_games_batch, given the winning seat
+    
+    The first network sits in seat 0 of even games and seat 1 of odd ones.
+    """
+    wins = np.empty(winner_seats.shape[0], dtype=np.bool_)
+    for k in range(winner_seats.shape[0]):
+        wins[k] = winner_seats[k] == (k & 1)
+    return wins
+
+
 def play_single_game(players: Tuple[YanivNeuralNetworkOptimized, YanivNeuralNetworkOptimized]) -> YanivNeuralNetworkOptimized:
     """Play a single game between two players (for parallel execution)"""
     game = YanivGameAIOptimized()
@@ -351,11 +429,61 @@ def play_games_batch(matchups: List[Tuple[YanivNeuralNetworkOptimized, YanivNeur
     return results
 
 
+# Worker-side players, set once per worker by _init_game_worker
+_worker_players: List[YanivNeuralNetworkOptimized] = []
+
+
+def _init_game_worker(players: List[YanivNeuralNetworkOptimized]):
+    """Executor initializer: receive the players once per worker"""
+    global _worker_players
+    _worker_players = players
+
+
+def _play_games_seeded(args: Tuple[int, int]) -> Dict[int, int]:
+    """Play a block of games with the worker's players and return wins per network_id"""
+    num_games, seed = args
+    random.seed(seed)
+    np.random.seed(seed)
+    
+    wins = {player.network_id: 0 for player in _worker_players}
+    game = YanivGameAIOptimized()
+    for _ in range(num_games):
+        winner = game.play_game(_worker_players)
+        wins[winner.network_id] += 1
+    return wins
+
+
 class ParallelGameExecutor:
     """Execute games in parallel using multiprocessing"""
     
     def __init__(self, num_workers: Optional[int] = None):
         self.num_workers = num_workers or mp.cpu_count()
+        # Fork where available, so workers inherit the already-imported modules
+        # and JIT-compiled kernels instead of re-importing them (spawn on Windows)
+        self.mp_context = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else mp.get_context()
+    
+    def play_many(self, players: List[YanivNeuralNetworkOptimized], num_games: int,
+                  seed: Optional[int] = None) -> Dict[int, int]:
+        """Play num_games between the same players split across all workers.
+        
+        Players are pickled once per worker via the executor initializer and each
+        worker plays its share of games with its own RNG seed. Returns wins per network_id.
+        """
+        base_seed = seed if seed is not None else random.randrange(2**31)
+        games_per_worker, remainder = divmod(num_games, self.num_workers)
+        tasks = [(games_per_worker + (1 if i < remainder else 0), base_seed + i)
+                 for i in range(self.num_workers)]
+        tasks = [task for task in tasks if task[0] > 0]
+        
+        warm_up_kernels(players[0], players[-1])
+        wins = {player.network_id: 0 for player in players}
+        with ProcessPoolExecutor(max_workers=self.num_workers, mp_context=self.mp_context,
+                                 initializer=_init_game_worker, initargs=(players,)) as executor:
+            for worker_wins in executor.map(_play_games_seeded, tasks):
+                for network_id, count in worker_wins.items():
+                    wins[network_id] += count
+        
+        return wins
     
     def play_tournament_parallel(self, population: List[YanivNeuralNetworkOptimized], 
                                games_per_matchup: int = 10) -> Dict[int, Tuple[int, int]]:
@@ -373,7 +501,7 @@ class ParallelGameExecutor:
         # Process chunks in parallel
         results_dict = {i: (0, 0) for i in range(len(population))}  # network_id -> (wins, games)
         
-        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+        with ProcessPoolExecutor(max_workers=self.num_workers, mp_context=self.mp_context) as executor:
             futures = []
             for chunk in matchup_chunks:
                 future = executor.submit(play_games_batch, chunk, games_per_matchup)
@@ -414,7 +542,7 @@ class ParallelGameExecutor:
         # Process chunks in parallel with progress bar
         results_dict = {i: (0, 0) for i in range(len(population))}  # network_id -> (wins, games)
         
-        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+        with ProcessPoolExecutor(max_workers=self.num_workers, mp_context=self.mp_context) as executor:
             futures = []
             for chunk in matchup_chunks:
                 future = executor.submit(play_games_batch, chunk, games_per_matchup)
@@ -440,9 +568,7 @@ class ParallelGameExecutor:
                     completed_games += games_in_chunk
                     
                     # Show additional stats in progress bar
-                    pbar.set_postfix({
-                        'matchups': f'{completed_games // games_per_matchup}/{total_matchups}',
-                        'workers': self.num_workers
-                    })
+                    pbar.set_postfix_str(f"matchups={completed_games // games_per_matchup}/{total_matchups}, "
+                                         f"workers={self.num_workers}")
         
         return results_dict
\ No newline at end of file
@@ -3,7 +3,7 @@ Wrapper to make Enhanced Neural Networks compatible with the existing game engin
 """
 
 import numpy as np
-from yaniv_neural_network_enhanced import EnhancedYanivNN
+from yaniv_neural_network_enhanced import EnhancedYanivNN, PopulationForward
 from yaniv_neural_network_optimized import YanivNeuralNetworkOptimized
 
 
@@ -228,4 +228,76 @@ def play_simple_match(network1, network2):
             if winner == 1:
                 wins += 1
     
-    return wins
\ No newline at end of file
+    return wins
+
+
+# Fixed feature columns of _convert_to_enhanced_features: suit (4), rank (13)
+# and combination (3) defaults, then one opponent holding 5 cards
+_SIMPLE_FEATURES_TEMPLATE = np.zeros(35, dtype=np.float32)
+_SIMPLE_FEATURES_TEMPLATE[6:10] = 0.25
+_SIMPLE_FEATURES_TEMPLATE[10:23] = 0.08
+_SIMPLE_FEATURES_TEMPLATE[23:26] = 0.1
+_SIMPLE_FEATURES_TEMPLATE[28] = 5 / 10.0
+
+
+def play_simple_matches(network, opponents, max_turns: int = 50) -> np.ndarray:
+    """Play ``play_simple_match(network, opponent)`` against every opponent at once
+    
+    All 2 * len(opponents) games are stepped in lockstep: each turn builds one
+    feature matrix and runs a single batched forward pass per seat through
+    PopulationForward. Returns the wins of ``network`` against each opponent.
+    """
+    num_games = 2 * len(opponents)
+    
+    # Game 2k seats [network, opponent k], game 2k+1 seats [opponent k, network]
+    seats = np.zeros((num_games, 2), dtype=np.int64)
+    seats[0::2, 1] = np.arange(1, len(opponents) + 1)
+    seats[1::2, 0] = np.arange(1, len(opponents) + 1)
+    population = PopulationForward([network] + list(opponents))
+    seat_networks = [population.take(seats[:, 0]), population.take(seats[:, 1])]
+    
+    hands = np.random.randint(1, 14, size=(num_games, 2, 5))
+    winner = np.full(num_games, -1)
+    active = np.ones(num_games, dtype=bool)
+    
+    for turn in range(max_turns):
+        current_idx = turn % 2
+        current_hand = hands[:, current_idx]
+        hand_value = np.minimum(current_hand, 10).sum(axis=1)
+        
+        # 30% chance to call Yaniv if possible
+        calls = active & (hand_value <= 7) & (np.random.random(num_games) < 0.3)
+        winner[calls] = current_idx
+        active &= ~calls
+        if not active.any():
+            break
+        
+        # Simulated game state features
+        deck_size = max(10, 52 - turn * 2)
+        features = np.tile(_SIMPLE_FEATURES_TEMPLATE, (num_games, 1))
+        features[:, :5] = current_hand / 13.0
+        features[:, 5] = hand_value / 50.0
+        features[:, 26] = deck_size / 52.0
+        features[:, 27] = np.random.randint(1, 14, num_games) / 13.0
+        features[:, 31] = 1.0 if deck_size > 35 else 0.5 if deck_size > 15 else 0.0
+        features[:, 32] = hand_value <= 7
+        
+        # Sample between the two legal discards (card 0 or card 1)
+        action_probs = seat_networks[current_idx].forward(features)[:, :2]
+        discard = np.random.random(num_games) * action_probs.sum(axis=1) >= action_probs[:, 0]
+        
+        # Remove the discarded card and draw a new one at the end of the hand
+        new_hand = current_hand.copy()
+        new_hand[~discard, :4] = current_hand[~discard, 1:]
+        new_hand[discard, 1:4] = current_hand[discard, 2:]
+        new_hand[:, 4] = np.random.randint(1, 14, num_games)
+        hands[active, current_idx] = new_hand[active]
+    
+    # Games still running end on hand value
+    hand_values = np.minimum(hands, 10).sum(axis=2)
+    unfinished = winner < 0
+    winner[unfinished] = (hand_values[unfinished, 0] > hand_values[unfinished, 1])
+    
+    # network sits in seat 0 of even games and seat 1 of odd games
+    wins = (winner[0::2] == 0).astype(np.int64) + (winner[1::2] == 1)
+    return wins
@@ -1,8 +1,19 @@
 import numpy as np
 import random
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 import json
 
+# Packed card record: value (0-13) and suit index (0-3, -1 for joker)
+CARD_DTYPE = np.dtype([('v', 'i1'), ('s', 'i1')])
+
+
+def card_value(card) -> int:
+    """Value of a card given as a dict or a packed CARD_DTYPE record"""
+    if isinstance(card, dict):
+        return card['value']
+    return int(card['v'])
+
+
 class YanivNeuralNetwork:
     """Simple neural network for Yaniv game decisions - CPU optimized"""
     
@@ -36,7 +47,10 @@ class YanivNeuralNetwork:
         """Forward pass through the network"""
         # Extract features from game state
         features = self._extract_features(game_state)
-        
+        return self.forward_features(features)
+    
+    def forward_features(self, features: np.ndarray) -> np.ndarray:
+        """Forward pass on an already-encoded feature vector"""
         # Hidden layer with ReLU activation
         hidden = np.maximum(0, np.dot(features, self.w1) + self.b1)
         
@@ -55,7 +69,7 @@ class YanivNeuralNetwork:
         for i in range(5):
             if i < len(hand):
                 # Simple encoding: card value / 13
-                features.append(hand[i]['value'] / 13.0)
+                features.append(card_value(hand[i]) / 13.0)
             else:
                 features.append(0)
         
@@ -70,8 +84,8 @@ class YanivNeuralNetwork:
             features.append(count / 10.0)
         
         # Last discarded card
-        if game_state['last_discard']:
-            features.append(game_state['last_discard']['value'] / 13.0)
+        if game_state['last_discard'] is not None:
+            features.append(card_value(game_state['last_discard']) / 13.0)
         else:
             features.append(0)
         
@@ -82,8 +96,9 @@ class YanivNeuralNetwork:
         exp_x = np.exp(x - np.max(x))  # Subtract max for numerical stability
         return exp_x / np.sum(exp_x)
     
-    def get_action(self, game_state: Dict, legal_actions: List[Dict]) -> Dict:
-        """Select an action based on neural network output"""
+    def get_action(self, game_state: Dict, legal_actions: List[Dict],
+                   rng: Optional[np.random.Generator] = None) -> Dict:
+        """Select an action based on neural network output, sampling with ``rng`` if given"""
         probabilities = self.forward(game_state)
         
         # Map legal actions to indices
@@ -98,10 +113,12 @@ class YanivNeuralNetwork:
             probs = np.array(probs)
             probs = probs / probs.sum()  # Renormalize
             
-            chosen_index = np.random.choice(indices, p=probs)
+            chosen_index = (np.random if rng is None else rng).choice(indices, p=probs)
             return legal_actions[chosen_index]
         
         # Fallback: random legal action
+        if rng is not None:
+            return legal_actions[rng.integers(len(legal_actions))]
         return random.choice(legal_actions)
     
     def mutate(self, mutation_rate: float = 0.1, mutation_strength: float = 0.1):
@@ -144,8 +161,40 @@ class YanivNeuralNetwork:
         with open(filename, 'w') as f:
             json.dump(data, f)
     
+    def save_npy(self, filename: str):
+        """Save network weights to a binary .npz file
+        
+        The weights are written as one raw flat array, with the shapes and stats
+        alongside as JSON bytes, so no float-to-text conversion is needed.
+        """
+        meta = {
+            'network_id': self.network_id,
+            'shapes': [list(getattr(self, name).shape) for name in ('w1', 'b1', 'w2', 'b2')],
+            'fitness': self.fitness,
+            'wins': self.wins,
+            'games_played': self.games_played
+        }
+        flat = np.concatenate([self.w1.ravel(), self.b1.ravel(), self.w2.ravel(), self.b2.ravel()])
+        np.savez(filename, w=flat, meta=np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8))
+    
     def load(self, filename: str):
-        """Load network weights from file"""
+        """Load network weights from file, either .npz (see save_npy) or JSON"""
+        if filename.endswith('.npz'):
+            with np.load(filename) as data:
+                flat = data['w']
+                meta = json.loads(data['meta'].tobytes())
+            
+            self.network_id = meta['network_id']
+            offset = 0
+            for name, shape in zip(('w1', 'b1', 'w2', 'b2'), meta['shapes']):
+                size = int(np.prod(shape))
+                setattr(self, name, flat[offset:offset + size].reshape(shape))
+                offset += size
+            self.fitness = meta.get('fitness', 0)
+            self.wins = meta.get('wins', 0)
+            self.games_played = meta.get('games_played', 0)
+            return
+        
         with open(filename, 'r') as f:
             data = json.load(f)
         
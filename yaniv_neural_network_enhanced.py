@@ -1,7 +1,18 @@
 import numpy as np
 from typing import List, Dict, Tuple, Optional
-from numba import jit
+from numba import njit
+from numba.core.errors import NumbaError
 import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Inference through the compiled forward kernel (_forward_jit) for networks of the
+# standard shape; set to False to always use the NumPy layer loop
+USE_JIT = True
 
 class EnhancedYanivNN:
     """Enhanced neural network with deeper architecture and skip connections"""
@@ -19,25 +30,40 @@ class EnhancedYanivNN:
         
         for hidden_size in hidden_sizes:
             self.layers.append({
-                'weights': np.random.randn(prev_size, hidden_size) * np.sqrt(2.0 / prev_size),
-                'bias': np.zeros((1, hidden_size))
+                'weights': (np.random.randn(prev_size, hidden_size) * np.sqrt(2.0 / prev_size)).astype(np.float32),
+                'bias': np.zeros((1, hidden_size), dtype=np.float32)
             })
             prev_size = hidden_size
         
         # Output layer
         self.layers.append({
-            'weights': np.random.randn(prev_size, output_size) * np.sqrt(2.0 / prev_size),
-            'bias': np.zeros((1, output_size))
+            'weights': (np.random.randn(prev_size, output_size) * np.sqrt(2.0 / prev_size)).astype(np.float32),
+            'bias': np.zeros((1, output_size), dtype=np.float32)
         })
         
         # Skip connection from input to output
-        self.skip_weights = np.random.randn(input_size, output_size) * 0.01
+        self.skip_weights = (np.random.randn(input_size, output_size) * 0.01).astype(np.float32)
         
         # For tracking activations during forward pass
         self.activations = []
         
+        # Flat array the weights are views over, once there is one (see get_weights_flat)
+        self._flat = None
+        
     def forward(self, x: np.ndarray, training: bool = False) -> np.ndarray:
-        """Forward pass with optional dropout for training"""
+        """Forward pass with optional dropout for training
+        
+        Inference on the standard three-hidden-layer shape runs as one compiled
+        kernel (see USE_JIT), which does not record ``activations``.
+        """
+        global USE_JIT
+        if USE_JIT and not training and len(self.layers) == 4:
+            try:
+                return self._forward_compiled(x)
+            except NumbaError:
+                # The kernel could not be compiled for these inputs; stay on the NumPy path
+                USE_JIT = False
+        
         self.activations = [x]
         
         # Hidden layers with ReLU
@@ -65,17 +91,46 @@ class EnhancedYanivNN:
         
         return output
     
+    def _forward_compiled(self, x: np.ndarray) -> np.ndarray:
+        """Inference forward pass through _forward_jit, as a (batch, output_size) array"""
+        x2d = np.ascontiguousarray(x, dtype=np.float32).reshape(-1, self.input_size)
+        (l1, l2, l3, l4) = self.layers
+        return _forward_jit(x2d, l1['weights'], l1['bias'], l2['weights'], l2['bias'],
+                            l3['weights'], l3['bias'], l4['weights'], l4['bias'],
+                            self.skip_weights)
+    
     def get_weights_flat(self) -> np.ndarray:
-        """Flatten all weights for genetic algorithm operations"""
-        weights = []
-        
-        for layer in self.layers:
-            weights.extend(layer['weights'].flatten())
-            weights.extend(layer['bias'].flatten())
-        
-        weights.extend(self.skip_weights.flatten())
-        
-        return np.array(weights)
+        """Flatten all weights for genetic algorithm operations
+        
+        The first call re-seats the weights as views over one contiguous
+        float32 array and later calls return that same array, so it is shared,
+        not a copy: writes to it change the network.
+        """
+        if self._flat is None:
+            self.set_weights_from_flat(np.concatenate(
+                [a.ravel() for layer in self.layers for a in (layer['weights'], layer['bias'])]
+                + [self.skip_weights.ravel()], dtype=np.float32))
+        return self._flat
+    
+    def clone(self, flat_weights: Optional[np.ndarray] = None) -> 'EnhancedYanivNN':
+        """Copy of this network with its own weight arrays, skipping random initialization
+        
+        With ``flat_weights`` the clone's weights are views over that array
+        (laid out as get_weights_flat) instead of copies of this network's.
+        """
+        network = EnhancedYanivNN.__new__(EnhancedYanivNN)
+        network.input_size = self.input_size
+        network.hidden_sizes = list(self.hidden_sizes)
+        network.output_size = self.output_size
+        network.dropout_rate = self.dropout_rate
+        network.activations = []
+        network._flat = None
+        network.layers = [{'weights': layer['weights'], 'bias': layer['bias']} for layer in self.layers]
+        network.skip_weights = self.skip_weights
+        if flat_weights is None:
+            flat_weights = self.get_weights_flat().copy()
+        network.set_weights_from_flat(flat_weights)
+        return network
     
     def set_weights_from_flat(self, flat_weights: np.ndarray):
         """Reconstruct weights from flat array"""
@@ -93,6 +148,7 @@ class EnhancedYanivNN:
         
         skip_size = self.skip_weights.size
         self.skip_weights = flat_weights[idx:idx + skip_size].reshape(self.skip_weights.shape)
+        self._flat = flat_weights
     
     def save(self, filename: str):
         """Save network to file"""
@@ -113,11 +169,42 @@ class EnhancedYanivNN:
         with open(filename, 'w') as f:
             json.dump(network_data, f)
     
+    def save_npy(self, filename: str):
+        """Save network to a binary .npz file: flat raw weights plus JSON metadata bytes"""
+        meta = {
+            'input_size': self.input_size,
+            'hidden_sizes': self.hidden_sizes,
+            'output_size': self.output_size
+        }
+        np.savez(filename, w=self.get_weights_flat(), meta=np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8))
+    
     @classmethod
     def load(cls, filename: str) -> 'EnhancedYanivNN':
-        """Load network from file"""
-        with open(filename, 'r') as f:
-            data = json.load(f)
+        """Load network from file, either .npz (see save_npy) or JSON
+        
+        A JSON file is cached next to itself as ``<filename>.npz`` on first load,
+        and later loads read that cache while it is newer than the JSON.
+        """
+        cache = filename + '.npz'
+        if not filename.endswith('.npz') and os.path.exists(cache) \
+                and os.path.getmtime(cache) >= os.path.getmtime(filename):
+            filename = cache
+        
+        if filename.endswith('.npz'):
+            with np.load(filename) as data:
+                flat = data['w']
+                meta = json.loads(data['meta'].tobytes())
+            
+            network = cls(
+                input_size=meta['input_size'],
+                hidden_sizes=meta['hidden_sizes'],
+                output_size=meta['output_size']
+            )
+            network.set_weights_from_flat(flat)
+            return network
+        
+        with open(filename, 'rb') as f:
+            data = orjson.loads(f.read()) if orjson is not None else json.load(f)
         
         network = cls(
             input_size=data['input_size'],
@@ -126,131 +213,258 @@ class EnhancedYanivNN:
         )
         
         for i, layer_data in enumerate(data['layers']):
-            network.layers[i]['weights'] = np.array(layer_data['weights'])
-            network.layers[i]['bias'] = np.array(layer_data['bias'])
+            network.layers[i]['weights'] = np.array(layer_data['weights'], dtype=np.float32)
+            network.layers[i]['bias'] = np.array(layer_data['bias'], dtype=np.float32)
+        
+        network.skip_weights = np.array(data['skip_weights'], dtype=np.float32)
+        network._flat = None
         
-        network.skip_weights = np.array(data['skip_weights'])
+        try:
+            network.save_npy(cache)
+        except OSError:
+            pass  # Read-only location; keep parsing the JSON
         
         return network
 
 
+class PopulationForward:
+    """Stacked weights of a population of EnhancedYanivNN for batched forward passes
+    
+    Each layer is held as one (P, in, out) weight array and (P, 1, out) bias
+    array, so a single batched matmul per layer evaluates every network. The
+    stacks are inference copies in ``dtype`` (float32 by default); the
+    networks' own weights are left untouched.
+    """
+    
+    def __init__(self, networks: Optional[List[EnhancedYanivNN]] = None,
+                 dtype: np.dtype = np.float32):
+        self.dtype = np.dtype(dtype)
+        if networks is None:
+            return
+        num_layers = len(networks[0].layers)
+        self.weights = [np.stack([network.layers[l]['weights'] for network in networks]).astype(self.dtype)
+                        for l in range(num_layers)]
+        self.biases = [np.stack([network.layers[l]['bias'] for network in networks]).astype(self.dtype)
+                       for l in range(num_layers)]
+        self.skip_weights = np.stack([network.skip_weights for network in networks]).astype(self.dtype)
+    
+    def __len__(self) -> int:
+        return len(self.skip_weights)
+    
+    def take(self, indices: np.ndarray) -> 'PopulationForward':
+        """Stack of the networks at ``indices`` (repeats allowed), one per row"""
+        subset = PopulationForward(dtype=self.dtype)
+        subset.weights = [w[indices] for w in self.weights]
+        subset.biases = [b[indices] for b in self.biases]
+        subset.skip_weights = self.skip_weights[indices]
+        return subset
+    
+    def forward(self, x: np.ndarray) -> np.ndarray:
+        """Forward (P, in) or (P, B, in) inputs, row p through network p"""
+        x = np.asarray(x, dtype=self.dtype)
+        squeeze = x.ndim == 2
+        if squeeze:
+            x = x[:, None, :]
+        
+        # Hidden layers with ReLU
+        h = x
+        for weights, bias in zip(self.weights[:-1], self.biases[:-1]):
+            h = np.maximum(0, np.matmul(h, weights) + bias)
+        
+        # Output layer with skip connection
+        z_out = np.matmul(h, self.weights[-1]) + self.biases[-1]
+        z_out += np.matmul(x, self.skip_weights) * 0.1
+        
+        # Softmax activation
+        exp_z = np.exp(z_out - np.max(z_out, axis=-1, keepdims=True))
+        output = exp_z / np.sum(exp_z, axis=-1, keepdims=True)
+        
+        return output[:, 0, :] if squeeze else output
+
+
 class AdvancedFeatureExtractor:
     """Extract rich features from game state"""
     
+    NUM_FEATURES = 33
+    
+    # Hand cards as int8 arrays for _extract_features_jit, reused across calls
+    _hand_values = np.zeros(16, dtype=np.int8)
+    _hand_suits = np.zeros(16, dtype=np.int8)
+    _opponent_cards = np.zeros(3, dtype=np.float32)
+    
     @staticmethod
-    def extract_features(game_state: Dict, move_history: Optional[List] = None) -> np.ndarray:
-        """Extract comprehensive features from game state"""
-        features = []
-        
-        # Basic hand features (5)
+    def extract_features(game_state: Dict, move_history: Optional[List] = None,
+                         out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Extract comprehensive features from game state
+        
+        Only unpacks the dicts here; the features are computed by the compiled
+        _extract_features_jit. Writes into ``out`` (float32, NUM_FEATURES) if given.
+        """
+        cls = AdvancedFeatureExtractor
         hand_cards = game_state['hand']
-        for i in range(5):
-            if i < len(hand_cards):
-                features.append(hand_cards[i]['value'] / 13.0)
-            else:
-                features.append(0.0)
-        
-        # Hand value (1)
-        hand_value = sum(card['value'] for card in hand_cards)
-        features.append(hand_value / 50.0)
-        
-        # Suit distribution (4)
-        suit_counts = [0, 0, 0, 0]
-        for card in hand_cards:
-            suit_counts[card['suit']] += 1
-        features.extend([c / 5.0 for c in suit_counts])
-        
-        # Rank distribution (13)
-        rank_counts = [0] * 13
-        for card in hand_cards:
-            rank_counts[card['value'] - 1] += 1
-        features.extend([c / 5.0 for c in rank_counts])
-        
-        # Potential combinations (3)
-        features.append(count_potential_sets(hand_cards) / 5.0)
-        features.append(count_potential_runs(hand_cards) / 5.0)
-        features.append(count_potential_pairs(hand_cards) / 10.0)
-        
-        # Game state features (4)
-        features.append(game_state.get('deck_size', 52) / 52.0)
-        features.append(game_state.get('discard_top', 0) / 13.0)
-        
-        # Opponent information (3)
-        for i in range(3):
-            if i < len(game_state.get('opponents', [])):
-                features.append(game_state['opponents'][i]['cards'] / 10.0)
-            else:
-                features.append(0.0)
-        
-        # Game phase indicator
-        if game_state.get('deck_size', 52) > 35:
-            features.append(1.0)  # Early game
-        elif game_state.get('deck_size', 52) > 15:
-            features.append(0.5)  # Mid game
-        else:
-            features.append(0.0)  # Late game
-        
-        # Risk assessment - can we call Yaniv?
-        features.append(1.0 if hand_value <= 7 else 0.0)
-        
-        return np.array(features)
+        num_cards = len(hand_cards)
+        if num_cards > len(cls._hand_values):
+            cls._hand_values = np.zeros(num_cards, dtype=np.int8)
+            cls._hand_suits = np.zeros(num_cards, dtype=np.int8)
+        for i, card in enumerate(hand_cards):
+            value, suit = card['value'], card['suit']
+            if not (0 <= value <= 13 and -1 <= suit <= 3):
+                raise ValueError(f"Card out of range: value {value}, suit {suit}")
+            cls._hand_values[i] = value
+            cls._hand_suits[i] = suit
+        
+        opponents = game_state.get('opponents', [])
+        num_opponents = min(len(opponents), 3)
+        for i in range(num_opponents):
+            cls._opponent_cards[i] = opponents[i]['cards']
+        
+        if out is None:
+            out = np.empty(cls.NUM_FEATURES, dtype=np.float32)
+        _extract_features_jit(cls._hand_values, cls._hand_suits, num_cards,
+                              game_state.get('deck_size', 52), game_state.get('discard_top', 0),
+                              cls._opponent_cards, num_opponents, out)
+        return out
 
 
-@jit(nopython=True)
-def count_potential_sets(cards) -> int:
-    """Count potential sets in hand"""
-    value_counts = {}
-    for card in cards:
-        val = card['value']
-        if val not in value_counts:
-            value_counts[val] = 0
-        value_counts[val] += 1
+@njit(cache=True, fastmath=True)
+def _extract_features_jit(values, suits, num_cards, deck_size, discard_top,
+                          opponent_cards, num_opponents, out):
+    """AdvancedFeatureExtractor's features from the hand as int8 value/suit arrays"""
+    # Basic hand features (5)
+    for i in range(5):
+        out[i] = values[i] / 13.0 if i < num_cards else 0.0
     
+    # Hand value (1)
+    hand_value = 0
+    for i in range(num_cards):
+        hand_value += values[i]
+    out[5] = hand_value / 50.0
+    
+    # Suit distribution (4) and rank distribution (13)
+    for k in range(6, 23):
+        out[k] = 0.0
+    # A joker (value 0, suit -1) counts as a king of spades, wrapping around like
+    # the negative list indices it used to be counted with
+    for i in range(num_cards):
+        out[6 + suits[i] % 4] += 1.0
+        out[10 + (values[i] - 1) % 13] += 1.0
+    
+    for k in range(6, 23):
+        out[k] /= 5.0
+    
+    # Potential combinations (3)
+    out[23] = count_potential_sets(values, num_cards) / 5.0
+    out[24] = count_potential_runs(values, suits, num_cards) / 5.0
+    out[25] = count_potential_pairs(values, num_cards) / 10.0
+    
+    # Game state features (2)
+    out[26] = deck_size / 52.0
+    out[27] = discard_top / 13.0
+    
+    # Opponent information (3)
+    for i in range(3):
+        out[28 + i] = opponent_cards[i] / 10.0 if i < num_opponents else 0.0
+    
+    # Game phase indicator: early, mid or late game
+    if deck_size > 35:
+        out[31] = 1.0
+    elif deck_size > 15:
+        out[31] = 0.5
+    else:
+        out[31] = 0.0
+    
+    # Risk assessment - can we call Yaniv?
+    out[32] = 1.0 if hand_value <= 7 else 0.0
+
+
+@njit(cache=True)
+def count_potential_sets(values, num_cards) -> int:
+    """Count potential sets in hand: ranks held at least twice"""
+    rank_counts = np.zeros(14, dtype=np.int64)
+    for i in range(num_cards):
+        rank_counts[values[i]] += 1
     count = 0
-    for val, cnt in value_counts.items():
+    for cnt in rank_counts:
         if cnt >= 2:
             count += 1
     return count
 
 
-@jit(nopython=True)
-def count_potential_runs(cards) -> int:
-    """Count potential runs in hand"""
-    # Group by suit
-    suit_cards = {0: [], 1: [], 2: [], 3: []}
-    for card in cards:
-        suit_cards[card['suit']].append(card['value'])
-    
+@njit(cache=True)
+def count_potential_runs(values, suits, num_cards) -> int:
+    """Count potential runs in hand: suits holding two consecutive ranks"""
     count = 0
-    for suit, values in suit_cards.items():
-        if len(values) >= 2:
-            values.sort()
-            # Check for consecutive values
-            for i in range(len(values) - 1):
-                if values[i+1] - values[i] == 1:
-                    count += 1
-                    break
-    
+    for suit in range(4):
+        held = np.zeros(15, dtype=np.bool_)
+        for i in range(num_cards):
+            if suits[i] == suit:
+                held[values[i]] = True
+        for v in range(1, 14):
+            if held[v] and held[v + 1]:
+                count += 1
+                break
     return count
 
 
-@jit(nopython=True)
-def count_potential_pairs(cards) -> int:
+@njit(cache=True)
+def count_potential_pairs(values, num_cards) -> int:
     """Count pairs in hand"""
-    value_counts = {}
-    for card in cards:
-        val = card['value']
-        if val not in value_counts:
-            value_counts[val] = 0
-        value_counts[val] += 1
-    
+    rank_counts = np.zeros(14, dtype=np.int64)
+    for i in range(num_cards):
+        rank_counts[values[i]] += 1
     pairs = 0
-    for cnt in value_counts.values():
+    for cnt in rank_counts:
         pairs += cnt // 2
-    
     return pairs
 
 
+@njit(cache=True, fastmath=True)
+def _dense_jit(x, weights, bias, relu):
+    """x @ weights + bias for a (batch, in) input, optionally followed by ReLU"""
+    batch, n_in = x.shape
+    n_out = weights.shape[1]
+    out = np.empty((batch, n_out), dtype=np.float32)
+    for r in range(batch):
+        for k in range(n_out):
+            out[r, k] = bias[0, k]
+        for i in range(n_in):
+            xi = x[r, i]
+            if xi != 0.0:
+                for k in range(n_out):
+                    out[r, k] += xi * weights[i, k]
+        if relu:
+            for k in range(n_out):
+                if out[r, k] < 0.0:
+                    out[r, k] = 0.0
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _forward_jit(x, w1, b1, w2, b2, w3, b3, w4, b4, skip_weights):
+    """EnhancedYanivNN inference for three hidden layers, skip connection and softmax, fused"""
+    h = _dense_jit(_dense_jit(_dense_jit(x, w1, b1, True), w2, b2, True), w3, b3, True)
+    z = _dense_jit(h, w4, b4, False)
+    skip = _dense_jit(x, skip_weights, np.zeros((1, skip_weights.shape[1]), dtype=np.float32), False)
+    for r in range(z.shape[0]):
+        z_max = -np.inf
+        for k in range(z.shape[1]):
+            z[r, k] += 0.1 * skip[r, k]
+            z_max = max(z_max, z[r, k])
+        total = 0.0
+        for k in range(z.shape[1]):
+            z[r, k] = np.exp(z[r, k] - z_max)
+            total += z[r, k]
+        for k in range(z.shape[1]):
+            z[r, k] /= total
+    return z
+
+
+def warm_up_forward():
+    """Compile (or load from cache) the forward kernel, e.g. once per worker process"""
+    if USE_JIT:
+        EnhancedYanivNN().forward(np.zeros(35, dtype=np.float32))
+
+
 class HallOfFame:
     """Maintain a collection of best performing networks"""
     
@@ -302,7 +516,7 @@ class HallOfFame:
                     'fitness': champ['fitness'],
                     'generation': champ['generation'],
                     'metadata': champ['metadata'],
-                    'network_file': f"{filename}_network_{i}.json"
+                    'network_file': f"{filename}_network_{i}.npz"
                 }
                 for i, champ in enumerate(self.champions)
             ]
@@ -314,7 +528,7 @@ class HallOfFame:
         
         # Save individual networks
         for i, champ in enumerate(self.champions):
-            champ['network'].save(f"{filename}_network_{i}.json")
+            champ['network'].save_npy(f"{filename}_network_{i}.npz")
     
     def load(self, filename: str):
         """Load hall of fame from file"""
@@ -339,25 +553,35 @@ class EnsembleAI:
     
     def __init__(self, networks: List[EnhancedYanivNN], weights: Optional[np.ndarray] = None):
         self.networks = networks
-        self.weights = weights if weights is not None else np.ones(len(networks)) / len(networks)
+        # float32 like the networks, so weighting their predictions does not upcast
+        self.weights = (np.asarray(weights, dtype=np.float32) if weights is not None
+                        else np.full(len(networks), 1 / len(networks), dtype=np.float32))
         self.performance_history = [[] for _ in networks]
+        # Member outputs, (networks, [batch,] output_size), reused across predictions
+        self._predictions = None
     
     def predict(self, game_state: Dict) -> np.ndarray:
         """Get ensemble prediction"""
         features = AdvancedFeatureExtractor.extract_features(game_state)
-        predictions = []
-        
-        for network, weight in zip(self.networks, self.weights):
-            pred = network.forward(features)
-            predictions.append(pred * weight)
+        return self.predict_features(features)
+    
+    def predict_features(self, features: np.ndarray) -> np.ndarray:
+        """Ensemble prediction for a feature vector or a (batch, features) array
+        
+        Member outputs are written into one float32 buffer and reduced with a
+        single weighted sum.
+        """
+        shape = (len(self.networks),) + features.shape[:-1] + (self.networks[0].output_size,)
+        if self._predictions is None or self._predictions.shape != shape:
+            self._predictions = np.empty(shape, dtype=np.float32)
+        for i, network in enumerate(self.networks):
+            self._predictions[i] = network.forward(features).reshape(shape[1:])
         
         # Weighted average
-        ensemble_pred = np.sum(predictions, axis=0)
+        ensemble_pred = np.tensordot(self.weights, self._predictions, axes=1)
         
         # Normalize
-        ensemble_pred = ensemble_pred / np.sum(ensemble_pred)
-        
-        return ensemble_pred
+        return ensemble_pred / np.sum(ensemble_pred, axis=-1, keepdims=True)
     
     def update_weights(self, network_idx: int, success: bool):
         """Update network weights based on performance"""
@@ -376,7 +600,7 @@ class EnsembleAI:
                 performances.append(recent_perf)
             
             # Update weights proportional to performance
-            performances = np.array(performances)
+            performances = np.array(performances, dtype=np.float32)
             self.weights = performances / np.sum(performances)
             
             # Add small epsilon to prevent zero weights
@@ -387,7 +611,7 @@ class EnsembleAI:
         ensemble_data = {
             'num_networks': len(self.networks),
             'weights': self.weights.tolist(),
-            'network_files': [f"{filename}_network_{i}.json" for i in range(len(self.networks))]
+            'network_files': [f"{filename}_network_{i}.npz" for i in range(len(self.networks))]
         }
         
         # Save metadata
@@ -396,7 +620,7 @@ class EnsembleAI:
         
         # Save individual networks
         for i, network in enumerate(self.networks):
-            network.save(f"{filename}_network_{i}.json")
+            network.save_npy(f"{filename}_network_{i}.npz")
     
     @classmethod
     def load(cls, filename: str) -> 'EnsembleAI':
@@ -2,12 +2,25 @@ import numpy as np
 import random
 from typing import List, Tuple, Dict, Optional
 import json
-from numba import jit, njit, prange
+from numba import jit, njit, prange, config as numba_config
 import multiprocessing as mp
+import os
+from yaniv_neural_network import CARD_DTYPE, card_value
+
+# Tournament pools fork after the parallel batch kernel has run; Numba's TBB
+# layer deadlocks at exit once a process has forked, so default to workqueue.
+if 'NUMBA_THREADING_LAYER' not in os.environ:
+    numba_config.THREADING_LAYER = 'workqueue'
 
 class YanivNeuralNetworkOptimized:
     """Optimized neural network for Yaniv game decisions with vectorized operations"""
     
+    WEIGHT_NAMES = ('w1', 'b1', 'w2', 'b2')
+    
+    # Each layer is held as one float32 C-contiguous [w | b] matrix (bias as its
+    # last row); w1/b1/w2/b2 are views into these
+    FUSED_NAMES = ('_w1_aug', '_w2_aug')
+    
     def __init__(self, network_id: int, hidden_size: int = 64):
         self.network_id = network_id
         self.fitness = 0
@@ -19,10 +32,28 @@ class YanivNeuralNetworkOptimized:
         output_size = 16  # Action space
         
         # Initialize weights using He initialization for better convergence
-        self.w1 = np.random.randn(input_size, hidden_size) * np.sqrt(2.0 / input_size)
-        self.b1 = np.zeros(hidden_size)
-        self.w2 = np.random.randn(hidden_size, output_size) * np.sqrt(2.0 / hidden_size)
-        self.b2 = np.zeros(output_size)
+        self.set_weights(np.random.randn(input_size, hidden_size) * np.sqrt(2.0 / input_size),
+                         np.zeros(hidden_size),
+                         np.random.randn(hidden_size, output_size) * np.sqrt(2.0 / hidden_size),
+                         np.zeros(output_size))
+        self._init_buffers()
+    
+    def _init_buffers(self):
+        """Allocate the scratch buffers and RNG that go with the current weight shapes"""
+        input_size, hidden_size = self._w1_aug.shape[0] - 1, self._w1_aug.shape[1]
+        
+        # Reused input buffer for forward_arrays
+        self._features = np.zeros(input_size)
+        
+        # Bias-augmented activations for forward_features: the trailing 1 picks up
+        # the bias row, so each layer is a single matrix-vector product
+        self._input_aug = np.ones(input_size + 1, dtype=np.float32)
+        self._hidden_aug = np.ones(hidden_size + 1, dtype=np.float32)
+        
+        # Mutation RNG and noise buffers, reused by every mutate_vectorized call
+        self._rng = np.random.default_rng()
+        self._noise = {name: np.empty(getattr(self, name).size) for name in self.WEIGHT_NAMES}
+        self._uniform = {name: np.empty_like(getattr(self, name)) for name in self.WEIGHT_NAMES}
         
         # Pre-allocate arrays for batch processing
         self.batch_size = 0
@@ -30,80 +61,151 @@ class YanivNeuralNetworkOptimized:
         self.batch_hidden = None
         self.batch_output = None
     
+    @classmethod
+    def from_fused(cls, network_id: int, w1_aug: np.ndarray, w2_aug: np.ndarray) -> 'YanivNeuralNetworkOptimized':
+        """Network holding the given fused float32 matrices as its weights, without copying them"""
+        network = cls.__new__(cls)
+        network.__setstate__({'network_id': network_id, 'fitness': 0, 'wins': 0, 'games_played': 0,
+                              '_w1_aug': w1_aug, '_w2_aug': w2_aug})
+        return network
+    
+    def __getstate__(self):
+        # Pickle only the identity, stats and the fused float32 weights; scratch
+        # buffers and the RNG are rebuilt on unpickling
+        return {name: self.__dict__[name]
+                for name in ('network_id', 'fitness', 'wins', 'games_played') + self.FUSED_NAMES}
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_buffers()
+    
+    w1 = property(lambda self: self._w1_aug[:-1])
+    b1 = property(lambda self: self._w1_aug[-1])
+    w2 = property(lambda self: self._w2_aug[:-1])
+    b2 = property(lambda self: self._w2_aug[-1])
+    
+    @w1.setter
+    def w1(self, value):
+        self._w1_aug[:-1] = value
+    
+    @b1.setter
+    def b1(self, value):
+        self._w1_aug[-1] = value
+    
+    @w2.setter
+    def w2(self, value):
+        self._w2_aug[:-1] = value
+    
+    @b2.setter
+    def b2(self, value):
+        self._w2_aug[-1] = value
+    
+    def set_weights(self, w1: np.ndarray, b1: np.ndarray, w2: np.ndarray, b2: np.ndarray):
+        """Replace all weights, allowing new shapes, as float32 bias-augmented matrices"""
+        self._w1_aug = np.ascontiguousarray(np.vstack([w1, b1]), dtype=np.float32)
+        self._w2_aug = np.ascontiguousarray(np.vstack([w2, b2]), dtype=np.float32)
+    
     def forward_batch(self, game_states: List[Dict]) -> np.ndarray:
         """Vectorized forward pass for multiple game states"""
-        batch_size = len(game_states)
-        
-        # Pre-allocate if needed
-        if self.batch_size != batch_size:
-            self.batch_size = batch_size
-            self.batch_features = np.zeros((batch_size, 11))
-            self.batch_hidden = np.zeros((batch_size, self.w1.shape[1]))
-            self.batch_output = np.zeros((batch_size, self.w2.shape[1]))
+        self._ensure_batch_buffers(len(game_states))
         
         # Extract features for all states at once
         self._extract_features_batch(game_states, self.batch_features)
         
-        # Vectorized forward pass
-        # Hidden layer with ReLU activation
-        np.dot(self.batch_features, self.w1, out=self.batch_hidden)
-        self.batch_hidden += self.b1
-        np.maximum(self.batch_hidden, 0, out=self.batch_hidden)  # In-place ReLU
+        return self.forward_batch_features(self.batch_features)
+    
+    def _ensure_batch_buffers(self, batch_size: int):
+        """Pre-allocate batch buffers if the batch size changed"""
+        if self.batch_size != batch_size:
+            self.batch_size = batch_size
+            self.batch_features = np.zeros((batch_size, 11))
+            self.batch_hidden = np.zeros((batch_size, self.w1.shape[1]), dtype=np.float32)
+            self.batch_output = np.zeros((batch_size, self.w2.shape[1]), dtype=np.float32)
+    
+    def forward_batch_features(self, batch_features: np.ndarray,
+                               int8_layers: Optional[List[Tuple[np.ndarray, np.ndarray, np.ndarray]]] = None
+                               ) -> np.ndarray:
+        """Vectorized forward pass on an already-encoded (batch, 11) feature array.
         
-        # Output layer
-        np.dot(self.batch_hidden, self.w2, out=self.batch_output)
-        self.batch_output += self.b2
+        Runs the JIT-compiled batch kernel; the returned array is a reused buffer.
+        With ``int8_layers`` from quantize_int8 it runs the int8 kernel instead.
+        """
+        self._ensure_batch_buffers(batch_features.shape[0])
+        if int8_layers is None:
+            _forward_batch_kernel(batch_features, self._w1_aug, self._w2_aug,
+                                  self.batch_hidden, self.batch_output)
+        else:
+            (w1_q, w1_scale, b1), (w2_q, w2_scale, b2) = int8_layers
+            _forward_batch_int8_kernel(batch_features, w1_q, w1_scale, b1, w2_q, w2_scale, b2,
+                                       self.batch_hidden, self.batch_output)
+        return self.batch_output
+    
+    def quantize_int8(self) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Inference-only int8 copy of the weights: (w_q, scale, bias) per layer
         
-        # Batch softmax
-        return self._softmax_batch(self.batch_output)
+        Each weight column is scaled symmetrically to [-127, 127] (scale is the
+        float32 per-column step); biases stay float32. The float32 weights are
+        left untouched, so mutation keeps full precision.
+        """
+        layers = []
+        for weights, bias in ((self.w1, self.b1), (self.w2, self.b2)):
+            scale = np.abs(weights).max(axis=0) / 127.0
+            scale[scale == 0] = 1.0
+            w_q = np.round(weights / scale).astype(np.int8)
+            layers.append((w_q, scale.astype(np.float32), np.ascontiguousarray(bias)))
+        return layers
     
     def forward(self, game_state: Dict) -> np.ndarray:
         """Single forward pass (kept for compatibility)"""
-        features = self._extract_features(game_state)
+        return self.forward_features(self._extract_features(game_state))
+    
+    def forward_arrays(self, hand_values: np.ndarray, hand_value: float, deck_size: float,
+                       opponent_cards: np.ndarray, last_value: float = 0.0) -> np.ndarray:
+        """Single forward pass on game state fields already held as NumPy arrays.
         
-        # Hidden layer with ReLU activation
-        hidden = np.maximum(0, np.dot(features, self.w1) + self.b1)
+        Encodes into a reused buffer with the JIT-compiled encoder, skipping the
+        dict walk in _extract_features. ``last_value`` is 0 when there is no discard.
+        """
+        encode_features_jit(hand_values, hand_value, deck_size, opponent_cards, last_value,
+                            self._features)
+        return self.forward_features(self._features)
+    
+    def forward_features(self, features: np.ndarray) -> np.ndarray:
+        """Single forward pass on an already-encoded feature vector"""
+        # Hidden layer with ReLU activation; the bias comes from the augmented 1 entry
+        self._input_aug[:-1] = features
+        hidden = self._hidden_aug[:-1]
+        np.dot(self._input_aug, self._w1_aug, out=hidden)
+        np.maximum(hidden, 0, out=hidden)
         
         # Output layer with softmax
-        output = np.dot(hidden, self.w2) + self.b2
+        output = np.dot(self._hidden_aug, self._w2_aug)
         return self._softmax(output)
     
     def _extract_features_batch(self, game_states: List[Dict], out: np.ndarray):
         """Vectorized feature extraction for multiple game states"""
         for i, state in enumerate(game_states):
-            hand = state['hand']
-            
-            # Encode hand cards
-            for j in range(5):
-                if j < len(hand):
-                    out[i, j] = hand[j]['value'] / 13.0
-                else:
-                    out[i, j] = 0
-            
-            # Hand value
-            out[i, 5] = state['hand_value'] / 50.0
-            
-            # Deck size
-            out[i, 6] = state['deck_size'] / 54.0
-            
-            # Opponent cards
-            for j, count in enumerate(state['opponent_cards'][:3]):
-                out[i, 7 + j] = count / 10.0
-            
-            # Last discarded card
-            if state['last_discard']:
-                out[i, 10] = state['last_discard']['value'] / 13.0
-            else:
-                out[i, 10] = 0
+            self._extract_features(state, out[i])
     
-    def _extract_features(self, game_state: Dict) -> np.ndarray:
-        """Convert game state to neural network input features"""
-        features = np.zeros(11)
+    @staticmethod
+    def _extract_features(game_state: Dict, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Convert game state to neural network input features.
+        
+        Cards may be dicts or packed CARD_DTYPE records; writes into ``out`` if given.
+        """
+        if out is None:
+            features = np.zeros(11)
+        else:
+            features = out
+            features.fill(0)
         
         # Encode hand cards
         hand = game_state['hand']
-        for i in range(5):
-            if i < len(hand):
+        if isinstance(hand, np.ndarray):
+            values = hand['v'][:5]
+            features[:len(values)] = values / 13.0
+        else:
+            for i in range(min(len(hand), 5)):
                 features[i] = hand[i]['value'] / 13.0
         
         # Hand value
@@ -117,13 +219,13 @@ class YanivNeuralNetworkOptimized:
             features[7 + i] = count / 10.0
         
         # Last discarded card
-        if game_state['last_discard']:
-            features[10] = game_state['last_discard']['value'] / 13.0
+        if game_state['last_discard'] is not None:
+            features[10] = card_value(game_state['last_discard']) / 13.0
         
         return features
     
     @staticmethod
-    @njit
+    @njit(cache=True)
     def _softmax_jit(x: np.ndarray) -> np.ndarray:
         """JIT-compiled softmax for single vector"""
         exp_x = np.exp(x - np.max(x))
@@ -142,8 +244,10 @@ class YanivNeuralNetworkOptimized:
     
     def get_action(self, game_state: Dict, legal_actions: List[Dict]) -> Dict:
         """Select an action based on neural network output"""
-        probabilities = self.forward(game_state)
-        
+        return self.sample_action(self.forward(game_state), legal_actions)
+    
+    def sample_action(self, probabilities: np.ndarray, legal_actions: List[Dict]) -> Dict:
+        """Sample one of ``legal_actions`` from already computed output probabilities"""
         # Map legal actions to indices
         action_indices = []
         for i, action in enumerate(legal_actions):
@@ -188,18 +292,22 @@ class YanivNeuralNetworkOptimized:
         return actions
     
     def mutate_vectorized(self, mutation_rate: float = 0.1, mutation_strength: float = 0.1):
-        """Vectorized mutation using NumPy operations"""
-        # Generate mutation masks
-        w1_mask = np.random.random(self.w1.shape) < mutation_rate
-        b1_mask = np.random.random(self.b1.shape) < mutation_rate
-        w2_mask = np.random.random(self.w2.shape) < mutation_rate
-        b2_mask = np.random.random(self.b2.shape) < mutation_rate
-        
-        # Apply mutations
-        self.w1[w1_mask] += np.random.randn(np.sum(w1_mask)) * mutation_strength
-        self.b1[b1_mask] += np.random.randn(np.sum(b1_mask)) * mutation_strength
-        self.w2[w2_mask] += np.random.randn(np.sum(w2_mask)) * mutation_strength
-        self.b2[b2_mask] += np.random.randn(np.sum(b2_mask)) * mutation_strength
+        """Vectorized mutation drawing random numbers into pre-allocated buffers"""
+        for name in self.WEIGHT_NAMES:
+            weights = getattr(self, name)
+            uniform = self._uniform[name]
+            
+            # Generate mutation mask in place
+            self._rng.random(out=uniform, dtype=uniform.dtype)
+            mask = uniform < mutation_rate
+            
+            # Gaussian noise only for the mutated entries, written into the buffer's prefix
+            noise = self._noise[name][:np.count_nonzero(mask)]
+            self._rng.standard_normal(out=noise)
+            noise *= mutation_strength
+            
+            # Apply mutations
+            weights[mask] += noise
     
     def mutate(self, mutation_rate: float = 0.1, mutation_strength: float = 0.1):
         """Apply random mutations to network weights"""
@@ -208,10 +316,8 @@ class YanivNeuralNetworkOptimized:
     def copy(self) -> 'YanivNeuralNetworkOptimized':
         """Create a copy of this network"""
         new_network = YanivNeuralNetworkOptimized(self.network_id, self.w1.shape[1])
-        new_network.w1 = self.w1.copy()
-        new_network.b1 = self.b1.copy()
-        new_network.w2 = self.w2.copy()
-        new_network.b2 = self.b2.copy()
+        new_network._w1_aug[...] = self._w1_aug
+        new_network._w2_aug[...] = self._w2_aug
         return new_network
     
     def save(self, filename: str):
@@ -235,17 +341,129 @@ class YanivNeuralNetworkOptimized:
             data = json.load(f)
         
         self.network_id = data['network_id']
-        self.w1 = np.array(data['w1'])
-        self.b1 = np.array(data['b1'])
-        self.w2 = np.array(data['w2'])
-        self.b2 = np.array(data['b2'])
+        self.set_weights(data['w1'], data['b1'], data['w2'], data['b2'])
         self.fitness = data.get('fitness', 0)
         self.wins = data.get('wins', 0)
         self.games_played = data.get('games_played', 0)
 
 
+@njit(cache=True)
+def encode_features_jit(hand_values: np.ndarray, hand_value: float, deck_size: float,
+                        opponent_cards: np.ndarray, last_value: float, out: np.ndarray):
+    """JIT-compiled feature encoder writing the 11 input features into out"""
+    out[:] = 0.0
+    
+    # Hand cards
+    for i in range(min(hand_values.shape[0], 5)):
+        out[i] = hand_values[i] / 13.0
+    
+    # Hand value and deck size
+    out[5] = hand_value / 50.0
+    out[6] = deck_size / 54.0
+    
+    # Opponent cards
+    for i in range(min(opponent_cards.shape[0], 3)):
+        out[7 + i] = opponent_cards[i] / 10.0
+    
+    # Last discarded card
+    out[10] = last_value / 13.0
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _forward_batch_kernel(X, w1_aug, w2_aug, hidden, out):
+    """JIT-compiled batch forward pass: matmul + ReLU + matmul + softmax per row
+    
+    Weights are bias-augmented: the last row of each matrix is the layer's bias.
+    """
+    batch_size = X.shape[0]
+    input_size = w1_aug.shape[0] - 1
+    hidden_size = w1_aug.shape[1]
+    output_size = w2_aug.shape[1]
+    for i in prange(batch_size):
+        # Hidden layer with ReLU activation
+        for h in range(hidden_size):
+            acc = w1_aug[input_size, h]
+            for k in range(input_size):
+                acc += X[i, k] * w1_aug[k, h]
+            hidden[i, h] = acc if acc > 0.0 else 0.0
+        
+        # Output layer
+        max_val = -np.inf
+        for o in range(output_size):
+            acc = w2_aug[hidden_size, o]
+            for h in range(hidden_size):
+                acc += hidden[i, h] * w2_aug[h, o]
+            out[i, o] = acc
+            if acc > max_val:
+                max_val = acc
+        
+        # Softmax (subtract max for numerical stability)
+        total = 0.0
+        for o in range(output_size):
+            out[i, o] = np.exp(out[i, o] - max_val)
+            total += out[i, o]
+        for o in range(output_size):
+            out[i, o] /= total
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _forward_batch_int8_kernel(X, w1_q, w1_scale, b1, w2_q, w2_scale, b2, hidden, out):
+    """JIT-compiled int8 batch forward pass (see quantize_int8)
+    
+    Each row's activations are quantized to int8 with their own scale before
+    each layer, accumulated in int32 and dequantized with both scales.
+    """
+    batch_size = X.shape[0]
+    input_size = w1_q.shape[0]
+    hidden_size = w1_q.shape[1]
+    output_size = w2_q.shape[1]
+    for i in prange(batch_size):
+        # Quantize the input row
+        x_max = 0.0
+        for k in range(input_size):
+            x_max = max(x_max, abs(X[i, k]))
+        x_scale = x_max / 127.0 if x_max > 0.0 else 1.0
+        x_q = np.empty(input_size, dtype=np.int32)
+        for k in range(input_size):
+            x_q[k] = np.int32(np.round(X[i, k] / x_scale))
+        
+        # Hidden layer with ReLU activation
+        h_max = 0.0
+        for h in range(hidden_size):
+            acc = np.int32(0)
+            for k in range(input_size):
+                acc += x_q[k] * np.int32(w1_q[k, h])
+            value = acc * x_scale * w1_scale[h] + b1[h]
+            hidden[i, h] = value if value > 0.0 else 0.0
+            h_max = max(h_max, hidden[i, h])
+        
+        # Quantize the hidden row (non-negative after ReLU)
+        h_scale = h_max / 127.0 if h_max > 0.0 else 1.0
+        h_q = np.empty(hidden_size, dtype=np.int32)
+        for h in range(hidden_size):
+            h_q[h] = np.int32(np.round(hidden[i, h] / h_scale))
+        
+        # Output layer
+        max_val = -np.inf
+        for o in range(output_size):
+            acc = np.int32(0)
+            for h in range(hidden_size):
+                acc += h_q[h] * np.int32(w2_q[h, o])
+            out[i, o] = acc * h_scale * w2_scale[o] + b2[o]
+            if out[i, o] > max_val:
+                max_val = out[i, o]
+        
+        # Softmax (subtract max for numerical stability)
+        total = 0.0
+        for o in range(output_size):
+            out[i, o] = np.exp(out[i, o] - max_val)
+            total += out[i, o]
+        for o in range(output_size):
+            out[i, o] /= total
+
+
 # JIT-compiled helper functions for game logic
-@njit
+@njit(cache=True)
 def calculate_hand_value_jit(values: np.ndarray, suits: np.ndarray) -> int:
     """JIT-compiled hand value calculation"""
     total = 0
@@ -259,7 +477,7 @@ def calculate_hand_value_jit(values: np.ndarray, suits: np.ndarray) -> int:
     return total
 
 
-@njit
+@njit(cache=True)
 def find_pairs_jit(values: np.ndarray) -> List[Tuple[int, int]]:
     """JIT-compiled pair finding"""
     pairs = []
@@ -271,7 +489,7 @@ def find_pairs_jit(values: np.ndarray) -> List[Tuple[int, int]]:
     return pairs
 
 
-@njit
+@njit(cache=True)
 def find_runs_jit(values: np.ndarray, suits: np.ndarray) -> List[List[int]]:
     """JIT-compiled run finding"""
     runs = []